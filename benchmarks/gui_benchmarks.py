@@ -0,0 +1,304 @@
+# Offscreen benchmarks for the app startup and for filling the tables with many files
+# usage:
+#   python benchmarks/gui_benchmarks.py --output results.json
+#   python benchmarks/gui_benchmarks.py --output new.json --compare old.json
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+REPOSITORY_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_SCRIPT_PATH = os.path.join(REPOSITORY_FOLDER, "main.py")
+DEFAULT_SIZES = "100,1000,10000,50000"
+TABLE_WIDTH = 1000
+TABLE_HEIGHT = 600
+DRAG_STEPS_COUNT = 20
+FIRST_PAINT_PATTERN = re.compile(r"^\s*total\s+([\d.]+) ms", re.MULTILINE)
+
+
+def create_arguments_parser():
+    parser = argparse.ArgumentParser(description="Time the app startup and the tables with synthetic files.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="comma separated numbers of files (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per case, the fastest one is kept")
+    parser.add_argument("--max-seconds", type=float, default=120.0,
+                        help="skip the bigger sizes of a case once one run takes longer than this")
+    parser.add_argument("--cases", help="comma separated names of the cases to run (default: all)")
+    parser.add_argument("--output", help="write the results to this json file")
+    parser.add_argument("--compare", help="compare the results with an older json file")
+    return parser
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPOSITORY_FOLDER,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout.decode().strip()
+    except OSError:
+        return ""
+
+
+def generate_files_names(number_of_files, extension):
+    files_names = []
+    for i in range(number_of_files):
+        # names of different lengths so the eliding and the column width have real work to do
+        files_names.append("[Group] Show Name " + "Long " * (i % 7) + "- " + str(i + 1).zfill(5) +
+                           " [1080p][HEVC]." + extension)
+    return files_names
+
+
+def generate_files_sizes(number_of_files):
+    return [str(round(200 + (i % 900) * 1.7, 2)) + " MB" for i in range(number_of_files)]
+
+
+def set_global_setting_files(number_of_files):
+    from packages.Tabs.GlobalSetting import GlobalSetting
+    videos = generate_files_names(number_of_files, "mkv")
+    subtitles = generate_files_names(number_of_files, "ass")
+    GlobalSetting.VIDEO_FILES_LIST = videos
+    GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST = [os.path.join("videos", name) for name in videos]
+    GlobalSetting.VIDEO_FILES_SIZE_LIST = generate_files_sizes(number_of_files)
+    GlobalSetting.SUBTITLE_FILES_LIST = subtitles
+    GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST = [os.path.join("subtitles", name) for name in subtitles]
+    GlobalSetting.CHAPTER_FILES_LIST = []
+    GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST = []
+
+
+def process_events():
+    from packages.Startup.MainApplication import MainApplication
+    MainApplication.processEvents()
+
+
+def dispose_widget(widget):
+    widget.hide()
+    widget.deleteLater()
+    process_events()
+
+
+def time_function(function):
+    start_time = time.perf_counter()
+    function()
+    process_events()  # layout and paint are part of what the user waits for
+    return time.perf_counter() - start_time
+
+
+def benchmark_video_table_show_files_list(number_of_files):
+    from packages.Tabs.VideoTab.Widgets.VideoTable import VideoTable
+    files_names = generate_files_names(number_of_files, "mkv")
+    files_sizes = generate_files_sizes(number_of_files)
+    table = VideoTable()
+    table.resize(TABLE_WIDTH, TABLE_HEIGHT)
+    elapsed_time = time_function(lambda: table.show_files_list(files_names, files_sizes))
+    dispose_widget(table)
+    return elapsed_time
+
+
+def benchmark_subtitle_matching_table_show_files(number_of_files):
+    from packages.Tabs.SubtitleTab.Widgets.SubtitleMatchingTable import SubtitleMatchingTable
+    set_global_setting_files(number_of_files)
+    table = SubtitleMatchingTable()
+    table.resize(TABLE_WIDTH, TABLE_HEIGHT)
+    table.show()
+    elapsed_time = time_function(table.show_files)
+    dispose_widget(table)
+    return elapsed_time
+
+
+def create_job_queue_table(number_of_files):
+    from packages.Tabs.MuxSetting.Widgets.JobQueueTable import JobQueueTable
+    set_global_setting_files(number_of_files)
+    table = JobQueueTable()
+    table.resize(TABLE_WIDTH, TABLE_HEIGHT)
+    table.show()
+    return table
+
+
+def benchmark_job_queue_table_setup_queue(number_of_files):
+    table = create_job_queue_table(number_of_files)
+
+    def setup_queue_and_paint():
+        table.setup_queue()
+        process_events()
+
+    elapsed_time = time_function(setup_queue_and_paint)
+    table.clear_queue()
+    dispose_widget(table)
+    return elapsed_time
+
+
+def benchmark_job_queue_table_resize_column(number_of_files):
+    table = create_job_queue_table(number_of_files)
+    table.setup_queue()
+    process_events()
+    new_width = max(table.columnWidth(0) // 2, 50)
+    # like dragging the header, the names are elided when the visible rows are painted again
+
+    def resize_and_paint():
+        table.setColumnWidth(0, new_width)
+        process_events()
+
+    elapsed_time = time_function(resize_and_paint)
+    table.clear_queue()
+    dispose_widget(table)
+    return elapsed_time
+
+
+def benchmark_job_queue_table_drag_name_column(number_of_files):
+    # the slowest step of a drag of the name column header, every step is painted before the next one
+    table = create_job_queue_table(number_of_files)
+    table.setup_queue()
+    process_events()
+    start_width = table.columnWidth(0)
+    slowest_step_time = 0
+
+    def resize_and_paint(new_width):
+        table.setColumnWidth(0, new_width)
+        process_events()
+
+    for step in range(1, DRAG_STEPS_COUNT + 1):
+        new_width = max(start_width - step * start_width // (DRAG_STEPS_COUNT + 1), 50)
+        slowest_step_time = max(slowest_step_time, time_function(lambda: resize_and_paint(new_width)))
+    table.clear_queue()
+    dispose_widget(table)
+    return slowest_step_time
+
+
+def benchmark_job_queue_table_fit_name_column(number_of_files):
+    # like a double click on the handle of the name column after the queue is shown
+    table = create_job_queue_table(number_of_files)
+    table.setup_queue()
+    table.setColumnWidth(0, 50)
+    process_events()
+
+    def fit_and_paint():
+        table.resize_name_column_to_fit_content()
+        process_events()
+
+    elapsed_time = time_function(fit_and_paint)
+    table.clear_queue()
+    dispose_widget(table)
+    return elapsed_time
+
+
+TABLE_CASES = {
+    "video_table_show_files_list": benchmark_video_table_show_files_list,
+    "subtitle_matching_table_show_files": benchmark_subtitle_matching_table_show_files,
+    "job_queue_table_setup_queue": benchmark_job_queue_table_setup_queue,
+    "job_queue_table_resize_column": benchmark_job_queue_table_resize_column,
+    "job_queue_table_drag_name_column": benchmark_job_queue_table_drag_name_column,
+    "job_queue_table_fit_name_column": benchmark_job_queue_table_fit_name_column,
+}
+
+
+def benchmark_startup(repeat):
+    # every run is a new process, the time to first paint comes from main.py --profile-startup
+    best_wall_time = None
+    best_first_paint_time = None
+    for i in range(repeat):
+        start_time = time.perf_counter()
+        startup_process = subprocess.run(
+            [sys.executable, MAIN_SCRIPT_PATH, "--profile-startup", "--quit-after-startup"],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=REPOSITORY_FOLDER, timeout=120)
+        wall_time = (time.perf_counter() - start_time) * 1000
+        output = startup_process.stdout.decode("UTF-8", errors="replace")
+        first_paint_match = FIRST_PAINT_PATTERN.search(output)
+        if startup_process.returncode != 0 or first_paint_match is None:
+            return {"error": output.strip().splitlines()[-1] if output.strip() else "exit code " +
+                                                                                    str(startup_process.returncode)}
+        first_paint_time = float(first_paint_match.group(1))
+        best_wall_time = wall_time if best_wall_time is None else min(best_wall_time, wall_time)
+        best_first_paint_time = first_paint_time if best_first_paint_time is None else \
+            min(best_first_paint_time, first_paint_time)
+    return {"wall_ms": round(best_wall_time, 2), "first_paint_ms": round(best_first_paint_time, 2)}
+
+
+def run_table_case(case_name, case_function, sizes, repeat, max_seconds):
+    case_results = {}
+    too_slow = False
+    for number_of_files in sizes:
+        if too_slow:
+            case_results[str(number_of_files)] = None
+            print("  " + case_name + " " + str(number_of_files) + ": skipped", flush=True)
+            continue
+        best_time = min(case_function(number_of_files) for i in range(repeat))
+        case_results[str(number_of_files)] = round(best_time * 1000, 2)
+        print("  " + case_name + " " + str(number_of_files) + ": " + str(round(best_time * 1000, 1)) + " ms",
+              flush=True)
+        too_slow = best_time > max_seconds
+    return case_results
+
+
+def run_benchmarks(arguments):
+    sizes = [int(size) for size in arguments.sizes.split(",") if size.strip()]
+    selected_cases = None
+    if arguments.cases:
+        selected_cases = [case_name.strip() for case_name in arguments.cases.split(",")]
+    results = {}
+    if selected_cases is None or "startup" in selected_cases:
+        results["startup"] = benchmark_startup(arguments.repeat)
+        print("  startup: " + json.dumps(results["startup"]), flush=True)
+    # the packages find the Resources folder from sys.argv[0] like when the app is started from main.py
+    sys.argv = [MAIN_SCRIPT_PATH]
+    sys.path.insert(0, REPOSITORY_FOLDER)
+    from packages.Startup.MainApplication import MainApplication
+    MainApplication.setQuitOnLastWindowClosed(False)
+    for case_name, case_function in TABLE_CASES.items():
+        if selected_cases is None or case_name in selected_cases:
+            results[case_name] = run_table_case(case_name, case_function, sizes, arguments.repeat,
+                                                arguments.max_seconds)
+    return {
+        "commit": get_git_commit(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM", ""),
+        "sizes": sizes,
+        "results": results,
+    }
+
+
+def format_time(value):
+    if value is None:
+        return "-"
+    return str(round(value, 1)) + " ms"
+
+
+def compare_results(old_report, new_report):
+    print("\nComparing " + (old_report.get("commit") or "old") + " -> " + (new_report.get("commit") or "new"))
+    print("case".ljust(42) + "old".rjust(14) + "new".rjust(14) + "ratio".rjust(9))
+    old_results = old_report["results"]
+    new_results = new_report["results"]
+    for case_name, new_case_results in new_results.items():
+        old_case_results = old_results.get(case_name, {})
+        if case_name == "startup":
+            rows = [(case_name + " first paint", old_case_results.get("first_paint_ms"),
+                     new_case_results.get("first_paint_ms"))]
+        else:
+            rows = [(case_name + " " + size, old_case_results.get(size), new_time)
+                    for size, new_time in new_case_results.items()]
+        for row_name, old_time, new_time in rows:
+            ratio = "-"
+            if old_time and new_time:
+                ratio = str(round(new_time / old_time, 2)) + "x"
+            print(row_name.ljust(42) + format_time(old_time).rjust(14) + format_time(new_time).rjust(14) +
+                  ratio.rjust(9))
+
+
+def main():
+    arguments = create_arguments_parser().parse_args()
+    report = run_benchmarks(arguments)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="UTF-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    if arguments.compare:
+        with open(arguments.compare, "r", encoding="UTF-8") as old_report_file:
+            compare_results(json.load(old_report_file), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+# Memory footprint of the job queue records, measured with tracemalloc
+# usage:
+#   python benchmarks/memory_benchmarks.py --output results.json
+#   python benchmarks/memory_benchmarks.py --output new.json --compare old.json
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+REPOSITORY_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SIZES = "1000,10000,100000"
+
+
+def create_arguments_parser():
+    parser = argparse.ArgumentParser(description="Measure the memory of the job queue records for synthetic videos.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="comma separated numbers of queued jobs (default: %(default)s)")
+    parser.add_argument("--cases", help="comma separated names of the cases to run (default: all)")
+    parser.add_argument("--output", help="write the results to this json file")
+    parser.add_argument("--compare", help="compare the results with an older json file")
+    return parser
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPOSITORY_FOLDER,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout.decode().strip()
+    except OSError:
+        return ""
+
+
+class LegacySingleJobData:
+    # the job record before it had slots, with the display texts it used to keep, kept here to compare with
+    def __init__(self):
+        self.video_name = ""
+        self.video_name_with_spaces = "  "
+        self.video_name_after_elide = "..."
+        self.video_name_displayed = ""
+        self.video_name_absolute = ""
+        self.subtitle_found = False
+        self.subtitle_name = ""
+        self.subtitle_name_absolute = ""
+        self.subtitle_language = "English"
+        self.subtitle_track_name = ""
+        self.subtitle_delay = 0.0
+        self.subtitle_set_default = False
+        self.subtitle_set_forced = False
+        self.chapter_found = False
+        self.chapter_name = ""
+        self.chapter_name_absolute = ""
+        self.progress = 0
+        self.size_before_muxing = "0 MB"
+        self.size_after_muxing = "0 MB"
+        self.done = False
+        self.error_occurred = False
+        self.used_mkvpropedit = False
+        self.muxing_message = ""
+        self.number_of_warnings = 0
+
+
+def generate_files_lists(number_of_jobs):
+    # the lists the tabs give to the queue, they exist before the queue so they are not measured
+    videos = ["[Group] Show Name - " + str(i + 1).zfill(5) + " [1080p][HEVC].mkv" for i in range(number_of_jobs)]
+    subtitles = ["[Group] Show Name - " + str(i + 1).zfill(5) + ".ass" for i in range(number_of_jobs)]
+    return {
+        "videos": videos,
+        "videos_absolute": [os.path.join("videos", name) for name in videos],
+        "videos_sizes": [str(round(200 + (i % 900) * 1.7, 2)) + " MB" for i in range(number_of_jobs)],
+        "subtitles": subtitles,
+        "subtitles_absolute": [os.path.join("subtitles", name) for name in subtitles],
+    }
+
+
+def fill_job(job, files_lists, job_index):
+    job.video_name = files_lists["videos"][job_index]
+    job.video_name_absolute = files_lists["videos_absolute"][job_index]
+    job.subtitle_found = True
+    job.subtitle_name = files_lists["subtitles"][job_index]
+    job.subtitle_name_absolute = files_lists["subtitles_absolute"][job_index]
+    job.subtitle_track_name = "English"
+
+
+def create_legacy_jobs(files_lists):
+    jobs = []
+    for job_index in range(len(files_lists["videos"])):
+        job = LegacySingleJobData()
+        fill_job(job, files_lists, job_index)
+        job.video_name_with_spaces = " " + job.video_name + "   "
+        job.video_name_displayed = chr(0x200E) + job.video_name_with_spaces
+        job.size_before_muxing = " " + files_lists["videos_sizes"][job_index]
+        jobs.append(job)
+    return jobs
+
+
+def create_single_jobs(files_lists):
+    from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+    jobs = []
+    for job_index in range(len(files_lists["videos"])):
+        job = SingleJobData()
+        fill_job(job, files_lists, job_index)
+        job.size_before_muxing = files_lists["videos_sizes"][job_index]
+        jobs.append(job)
+    return jobs
+
+
+def measure_memory(create_jobs, number_of_jobs):
+    files_lists = generate_files_lists(number_of_jobs)
+    gc.collect()
+    tracemalloc.start()
+    jobs = create_jobs(files_lists)
+    current_size, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del jobs
+    return {"bytes": current_size, "peak_bytes": peak_size, "bytes_per_job": round(current_size / number_of_jobs, 1)}
+
+
+MEMORY_CASES = {
+    "legacy_single_job_data": create_legacy_jobs,
+    "single_job_data": create_single_jobs,
+}
+
+
+def run_benchmarks(arguments):
+    sizes = [int(size) for size in arguments.sizes.split(",") if size.strip()]
+    selected_cases = None
+    if arguments.cases:
+        selected_cases = [case_name.strip() for case_name in arguments.cases.split(",")]
+    sys.argv = [os.path.join(REPOSITORY_FOLDER, "main.py")]
+    sys.path.insert(0, REPOSITORY_FOLDER)
+    # imported before the measures so the module itself is not counted in the first case
+    importlib.import_module("packages.Tabs.MuxSetting.Widgets.SingleJobData")
+    results = {}
+    for case_name, create_jobs in MEMORY_CASES.items():
+        if selected_cases is not None and case_name not in selected_cases:
+            continue
+        results[case_name] = {}
+        for number_of_jobs in sizes:
+            case_result = measure_memory(create_jobs, number_of_jobs)
+            results[case_name][str(number_of_jobs)] = case_result
+            print("  " + case_name + " " + str(number_of_jobs) + ": " + format_size(case_result["bytes"]) +
+                  " (" + str(case_result["bytes_per_job"]) + " bytes per job)", flush=True)
+    return {
+        "commit": get_git_commit(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "results": results,
+    }
+
+
+def format_size(value):
+    if value is None:
+        return "-"
+    return str(round(value / 1024 / 1024, 2)) + " MB"
+
+
+def compare_results(old_report, new_report):
+    print("\nComparing " + (old_report.get("commit") or "old") + " -> " + (new_report.get("commit") or "new"))
+    print("case".ljust(42) + "old".rjust(14) + "new".rjust(14) + "ratio".rjust(9))
+    old_results = old_report["results"]
+    for case_name, new_case_results in new_report["results"].items():
+        old_case_results = old_results.get(case_name, {})
+        for size, new_case_result in new_case_results.items():
+            old_size = old_case_results.get(size, {}).get("bytes")
+            new_size = new_case_result["bytes"]
+            ratio = "-"
+            if old_size and new_size:
+                ratio = str(round(new_size / old_size, 2)) + "x"
+            print((case_name + " " + size).ljust(42) + format_size(old_size).rjust(14) +
+                  format_size(new_size).rjust(14) + ratio.rjust(9))
+
+
+def main():
+    arguments = create_arguments_parser().parse_args()
+    report = run_benchmarks(arguments)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="UTF-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    if arguments.compare:
+        with open(arguments.compare, "r", encoding="UTF-8") as old_report_file:
+            compare_results(json.load(old_report_file), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
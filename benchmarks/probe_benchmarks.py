@@ -0,0 +1,249 @@
+# Reading the tracks of matroska files from their headers against probing them with mkvmerge -J,
+# and setting their default and forced flags in place against running mkvpropedit
+# the files are generated, every header read and every flags edit is checked against what the generator wrote
+# usage:
+#   python benchmarks/probe_benchmarks.py --output results.json
+#   python benchmarks/probe_benchmarks.py --mkvmerge /path/to/mkvmerge --mkvpropedit /path/to/mkvpropedit \
+#       --output new.json --compare old.json
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPOSITORY_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# the matroska files are written by the fixtures generator of the tests
+sys.path.insert(0, REPOSITORY_FOLDER)
+
+from tests.matroska_fixtures import get_audio_flags, write_fixture_file, write_flags_job
+
+DEFAULT_SIZES = "10,100,1000"
+
+
+def create_arguments_parser():
+    parser = argparse.ArgumentParser(description="Time reading the tracks of generated matroska files.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="comma separated numbers of files (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest one is kept")
+    parser.add_argument("--cases", help="comma separated names of the cases to run (default: all)")
+    parser.add_argument("--mkvmerge", default=shutil.which("mkvmerge"),
+                        help="mkvmerge used by the mkvmerge_probe case, it is skipped when there is none")
+    parser.add_argument("--mkvpropedit", default=shutil.which("mkvpropedit"),
+                        help="mkvpropedit used by the mkvpropedit_flags case, it is skipped when there is none")
+    parser.add_argument("--output", help="write the results to this json file")
+    parser.add_argument("--compare", help="compare the results with an older json file")
+    return parser
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPOSITORY_FOLDER,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout.decode().strip()
+    except OSError:
+        return ""
+
+
+def get_used_fields(info):
+    # the fields the job builders read, the two probes have to agree on them
+    return ([(track["id"], track["type"], track["properties"].get("language", "eng"),
+              bool(track["properties"].get("default_track")), bool(track["properties"].get("forced_track")))
+             for track in info["tracks"]], len(info["attachments"]))
+
+
+def check_header_reader(files_paths, expected_infos):
+    from packages.Tabs.MuxSetting.Widgets.MatroskaHeaderReader import read_matroska_info
+    for file_path, expected_info in zip(files_paths, expected_infos):
+        info = read_matroska_info(file_path)
+        if info != expected_info:
+            raise SystemExit("the header reader read " + file_path + " as\n" + json.dumps(info) +
+                             "\ninstead of\n" + json.dumps(expected_info))
+
+
+def check_mkvmerge_probe(files_paths, mkvmerge_path):
+    from packages.Tabs.MuxSetting.Widgets.MatroskaHeaderReader import read_matroska_info
+    number_of_differences = 0
+    for file_path in files_paths:
+        probe_process = subprocess.run([mkvmerge_path, "-J", file_path], stdout=subprocess.PIPE)
+        mkvmerge_info = json.loads(probe_process.stdout.decode("utf-8"))
+        if get_used_fields(mkvmerge_info) != get_used_fields(read_matroska_info(file_path)):
+            number_of_differences += 1
+            print("  mkvmerge reads " + file_path + " differently: " + json.dumps(get_used_fields(mkvmerge_info)))
+    return number_of_differences
+
+
+def get_flags_job_file_path(video_path):
+    return video_path[:-len(".mkv")] + ".flags.json"
+
+
+def write_flags_jobs(files_paths, expected_infos):
+    # the timed jobs set the audio flags to the values they already have, so the files stay as generated
+    for file_path, expected_info in zip(files_paths, expected_infos):
+        write_flags_job(get_flags_job_file_path(file_path), file_path, get_audio_flags(expected_info, False))
+
+
+def check_flags_editor(files_paths, expected_infos):
+    # every audio flag is inverted and set back, then a flag the file does not have is set and has to be left
+    # to mkvpropedit without a byte of the file changed
+    from packages.Tabs.MuxSetting.Widgets.MatroskaFlagsEditor import edit_flags_in_place
+    from packages.Tabs.MuxSetting.Widgets.MatroskaHeaderReader import read_matroska_info
+    job_file_path = os.path.join(os.path.dirname(files_paths[0]), "check.flags.json")
+    for file_path, expected_info in zip(files_paths, expected_infos):
+        with open(file_path, "rb") as video_file:
+            file_content = video_file.read()
+        write_flags_job(job_file_path, file_path, get_audio_flags(expected_info, True))
+        if not edit_flags_in_place(job_file_path):
+            raise SystemExit("the flags editor could not invert the audio flags of " + file_path)
+        inverted_info = json.loads(json.dumps(expected_info))
+        for track in inverted_info["tracks"]:
+            if track["type"] == "audio":
+                for flag_key in ("default_track", "forced_track"):
+                    track["properties"][flag_key] = not track["properties"][flag_key]
+        if read_matroska_info(file_path) != inverted_info:
+            raise SystemExit("the flags editor wrote wrong flags in " + file_path)
+        write_flags_job(job_file_path, file_path, get_audio_flags(expected_info, False))
+        if not edit_flags_in_place(job_file_path):
+            raise SystemExit("the flags editor could not set back the audio flags of " + file_path)
+        subtitles_ids = [track["id"] for track in expected_info["tracks"] if track["type"] == "subtitles"]
+        if len(subtitles_ids) > 0:
+            write_flags_job(job_file_path, file_path, [(subtitles_ids[0] + 1, "flag-default", False)])
+            if edit_flags_in_place(job_file_path):
+                raise SystemExit("the flags editor added a default flag to " + file_path)
+        with open(file_path, "rb") as video_file:
+            if video_file.read() != file_content:
+                raise SystemExit("the flags editor left " + file_path + " changed")
+
+
+def benchmark_matroska_header_reader(files_paths, arguments):
+    from packages.Tabs.MuxSetting.Widgets.MatroskaHeaderReader import read_matroska_info
+    return time_function(lambda: [read_matroska_info(file_path) for file_path in files_paths])
+
+
+def benchmark_mkvmerge_probe(files_paths, arguments):
+    if not arguments.mkvmerge:
+        return None
+
+    def probe_files():
+        for file_path in files_paths:
+            probe_process = subprocess.run([arguments.mkvmerge, "-J", file_path],
+                                           stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            json.loads(probe_process.stdout.decode("utf-8"))
+
+    return time_function(probe_files)
+
+
+def benchmark_matroska_flags_editor(files_paths, arguments):
+    from packages.Tabs.MuxSetting.Widgets.MatroskaFlagsEditor import edit_flags_in_place
+    return time_function(lambda: [edit_flags_in_place(get_flags_job_file_path(file_path))
+                                  for file_path in files_paths])
+
+
+def benchmark_mkvpropedit_flags(files_paths, arguments):
+    if not arguments.mkvpropedit:
+        return None
+
+    def edit_files():
+        for file_path in files_paths:
+            subprocess.run([arguments.mkvpropedit, "@" + get_flags_job_file_path(file_path)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    return time_function(edit_files)
+
+
+def time_function(function):
+    start_time = time.perf_counter()
+    function()
+    return time.perf_counter() - start_time
+
+
+PROBE_CASES = {
+    "matroska_header_reader": benchmark_matroska_header_reader,
+    "mkvmerge_probe": benchmark_mkvmerge_probe,
+    "matroska_flags_editor": benchmark_matroska_flags_editor,
+    "mkvpropedit_flags": benchmark_mkvpropedit_flags,
+}
+
+
+def run_benchmarks(arguments):
+    sizes = [int(size) for size in arguments.sizes.split(",") if size.strip()]
+    selected_cases = None
+    if arguments.cases:
+        selected_cases = [case_name.strip() for case_name in arguments.cases.split(",")]
+    results = {case_name: {} for case_name in PROBE_CASES
+               if selected_cases is None or case_name in selected_cases}
+    with tempfile.TemporaryDirectory(prefix="probe_benchmarks_") as fixtures_folder:
+        files_paths = []
+        expected_infos = []
+        for number_of_files in sizes:
+            while len(files_paths) < number_of_files:
+                file_path = os.path.join(fixtures_folder, "episode " + str(len(files_paths) + 1).zfill(5) + ".mkv")
+                expected_infos.append(write_fixture_file(file_path, len(files_paths)))
+                files_paths.append(file_path)
+            check_header_reader(files_paths[:number_of_files], expected_infos[:number_of_files])
+            check_flags_editor(files_paths[:number_of_files], expected_infos[:number_of_files])
+            write_flags_jobs(files_paths[:number_of_files], expected_infos[:number_of_files])
+            if arguments.mkvmerge and "mkvmerge_probe" in results:
+                print("  " + str(check_mkvmerge_probe(files_paths[:number_of_files], arguments.mkvmerge)) +
+                      " files read differently by mkvmerge", flush=True)
+            for case_name in results:
+                case_times = [PROBE_CASES[case_name](files_paths[:number_of_files], arguments)
+                              for i in range(arguments.repeat)]
+                if None in case_times:
+                    results[case_name][str(number_of_files)] = None
+                    print("  " + case_name + " " + str(number_of_files) + ": skipped, no mkvtoolnix tool found",
+                          flush=True)
+                    continue
+                best_time = min(case_times)
+                results[case_name][str(number_of_files)] = round(best_time * 1000, 2)
+                print("  " + case_name + " " + str(number_of_files) + ": " + str(round(best_time * 1000, 1)) + " ms",
+                      flush=True)
+    return {
+        "commit": get_git_commit(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mkvmerge": arguments.mkvmerge or "",
+        "mkvpropedit": arguments.mkvpropedit or "",
+        "sizes": sizes,
+        "results": results,
+    }
+
+
+def format_time(value):
+    if value is None:
+        return "-"
+    return str(round(value, 1)) + " ms"
+
+
+def compare_results(old_report, new_report):
+    print("\nComparing " + (old_report.get("commit") or "old") + " -> " + (new_report.get("commit") or "new"))
+    print("case".ljust(42) + "old".rjust(14) + "new".rjust(14) + "ratio".rjust(9))
+    old_results = old_report["results"]
+    for case_name, new_case_results in new_report["results"].items():
+        old_case_results = old_results.get(case_name, {})
+        for size, new_time in new_case_results.items():
+            old_time = old_case_results.get(size)
+            ratio = "-"
+            if old_time and new_time:
+                ratio = str(round(new_time / old_time, 2)) + "x"
+            print((case_name + " " + size).ljust(42) + format_time(old_time).rjust(14) +
+                  format_time(new_time).rjust(14) + ratio.rjust(9))
+
+
+def main():
+    arguments = create_arguments_parser().parse_args()
+    report = run_benchmarks(arguments)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="UTF-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    if arguments.compare:
+        with open(arguments.compare, "r", encoding="UTF-8") as old_report_file:
+            compare_results(json.load(old_report_file), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
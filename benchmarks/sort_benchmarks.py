@@ -0,0 +1,184 @@
+# Micro benchmarks for sorting the files names like windows and keeping a folder index sorted
+# usage:
+#   python benchmarks/sort_benchmarks.py --output results.json
+#   python benchmarks/sort_benchmarks.py --output new.json --compare old.json
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+
+REPOSITORY_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SIZES = "1000,10000,100000"
+CHANGED_FILES_COUNT = 1000
+
+
+def create_arguments_parser():
+    parser = argparse.ArgumentParser(description="Time the windows like sort of synthetic files names.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="comma separated numbers of files (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest one is kept")
+    parser.add_argument("--cases", help="comma separated names of the cases to run (default: all)")
+    parser.add_argument("--output", help="write the results to this json file")
+    parser.add_argument("--compare", help="compare the results with an older json file")
+    return parser
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPOSITORY_FOLDER,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout.decode().strip()
+    except OSError:
+        return ""
+
+
+def generate_files_names(number_of_files):
+    files_names = []
+    for i in range(number_of_files):
+        # a few shows with numbered episodes like a real folder, so the numbers are compared as numbers
+        files_names.append("[Group] Show " + str(i % 37) + " - S" + str(i % 5 + 1).zfill(2) + "E" +
+                           str(i // 37 + 1) + " [1080p]." + ("mkv", "ass", "srt")[i % 3])
+    random.Random(number_of_files).shuffle(files_names)
+    return files_names
+
+
+def legacy_sort_names_like_windows(names_list):
+    # the sort before the keys were computed with a compiled pattern, kept here to compare with
+    return sorted(names_list, key=lambda name: [int(text) if text.isdigit() else text.lower()
+                                                for text in re.split('([0-9]+)', name)])
+
+
+def split_changed_files_names(number_of_files):
+    # the index starts without some of the files, they come in and go out like the watcher would give them
+    files_names = generate_files_names(number_of_files)
+    changed_files_count = min(CHANGED_FILES_COUNT, number_of_files // 2)
+    return files_names[changed_files_count:], files_names[:changed_files_count]
+
+
+def benchmark_legacy_sort(number_of_files):
+    files_names = generate_files_names(number_of_files)
+    return time_function(lambda: legacy_sort_names_like_windows(files_names))
+
+
+def benchmark_sort_names_like_windows(number_of_files):
+    from packages.Tabs.GlobalSetting import sort_names_like_windows
+    files_names = generate_files_names(number_of_files)
+    return time_function(lambda: sort_names_like_windows(files_names))
+
+
+def benchmark_sorted_files_names_build(number_of_files):
+    from packages.Tabs.SortedFilesNames import SortedFilesNames
+    files_names = generate_files_names(number_of_files)
+    return time_function(lambda: SortedFilesNames(files_names))
+
+
+def benchmark_sorted_files_names_insert_remove(number_of_files):
+    from packages.Tabs.SortedFilesNames import SortedFilesNames
+    files_names, changed_files_names = split_changed_files_names(number_of_files)
+    sorted_files_names = SortedFilesNames(files_names)
+
+    def insert_and_remove():
+        for file_name in changed_files_names:
+            sorted_files_names.insert(file_name)
+        for file_name in changed_files_names:
+            sorted_files_names.remove(file_name)
+
+    return time_function(insert_and_remove)
+
+
+def benchmark_sorted_insert_index_insert_remove(number_of_files):
+    # a plain list like the tabs keep, every visited name gets its key again
+    from packages.Tabs.GlobalSetting import sort_names_like_windows, get_sorted_insert_index
+    files_names, changed_files_names = split_changed_files_names(number_of_files)
+    names_list = sort_names_like_windows(files_names)
+
+    def insert_and_remove():
+        for file_name in changed_files_names:
+            names_list.insert(get_sorted_insert_index(names_list, file_name), file_name)
+        for file_name in changed_files_names:
+            names_list.remove(file_name)
+
+    return time_function(insert_and_remove)
+
+
+def time_function(function):
+    start_time = time.perf_counter()
+    function()
+    return time.perf_counter() - start_time
+
+
+SORT_CASES = {
+    "legacy_sort": benchmark_legacy_sort,
+    "sort_names_like_windows": benchmark_sort_names_like_windows,
+    "sorted_files_names_build": benchmark_sorted_files_names_build,
+    "sorted_files_names_insert_remove": benchmark_sorted_files_names_insert_remove,
+    "sorted_insert_index_insert_remove": benchmark_sorted_insert_index_insert_remove,
+}
+
+
+def run_benchmarks(arguments):
+    sizes = [int(size) for size in arguments.sizes.split(",") if size.strip()]
+    selected_cases = None
+    if arguments.cases:
+        selected_cases = [case_name.strip() for case_name in arguments.cases.split(",")]
+    sys.argv = [os.path.join(REPOSITORY_FOLDER, "main.py")]
+    sys.path.insert(0, REPOSITORY_FOLDER)
+    results = {}
+    for case_name, case_function in SORT_CASES.items():
+        if selected_cases is not None and case_name not in selected_cases:
+            continue
+        results[case_name] = {}
+        for number_of_files in sizes:
+            best_time = min(case_function(number_of_files) for i in range(arguments.repeat))
+            results[case_name][str(number_of_files)] = round(best_time * 1000, 2)
+            print("  " + case_name + " " + str(number_of_files) + ": " + str(round(best_time * 1000, 1)) + " ms",
+                  flush=True)
+    return {
+        "commit": get_git_commit(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "results": results,
+    }
+
+
+def format_time(value):
+    if value is None:
+        return "-"
+    return str(round(value, 1)) + " ms"
+
+
+def compare_results(old_report, new_report):
+    print("\nComparing " + (old_report.get("commit") or "old") + " -> " + (new_report.get("commit") or "new"))
+    print("case".ljust(42) + "old".rjust(14) + "new".rjust(14) + "ratio".rjust(9))
+    old_results = old_report["results"]
+    for case_name, new_case_results in new_report["results"].items():
+        old_case_results = old_results.get(case_name, {})
+        for size, new_time in new_case_results.items():
+            old_time = old_case_results.get(size)
+            ratio = "-"
+            if old_time and new_time:
+                ratio = str(round(new_time / old_time, 2)) + "x"
+            print((case_name + " " + size).ljust(42) + format_time(old_time).rjust(14) +
+                  format_time(new_time).rjust(14) + ratio.rjust(9))
+
+
+def main():
+    arguments = create_arguments_parser().parse_args()
+    report = run_benchmarks(arguments)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="UTF-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    if arguments.compare:
+        with open(arguments.compare, "r", encoding="UTF-8") as old_report_file:
+            compare_results(json.load(old_report_file), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,25 @@
 # -*- coding: utf-8 -*-
 import sys
+from packages.Startup.StartupProfiler import startup_profiler, QUIT_AFTER_STARTUP_ARGUMENT
 from PySide2.QtGui import QFont, QFontDatabase
 from PySide2.QtWidgets import QApplication
+startup_profiler.end_phase("Qt imports")
 from packages.Startup import GlobalFiles
 from packages.Startup.MainApplication import MainApplication
+startup_profiler.end_phase("QApplication and resources")
 import ctypes
 
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("myappid")
+if sys.platform == "win32":
+    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("myappid")
 # noinspection PyAttributeOutsideInit
 from packages.MainWindow import MainWindow
+from packages.Startup.FirstPaintWatcher import FirstPaintWatcher
 from packages.Widgets.WarningDialog import WarningDialog
+startup_profiler.end_phase("main window imports")
 
 window: MainWindow
 app: QApplication
+first_paint_watcher: FirstPaintWatcher
 
 
 def setup_application_font():
@@ -39,6 +46,19 @@ def create_window():
     window = MainWindow(sys.argv)
 
 
+def watch_first_paint():
+    global first_paint_watcher
+    if startup_profiler.enabled:
+        first_paint_watcher = FirstPaintWatcher(window, first_paint_done)
+
+
+def first_paint_done():
+    startup_profiler.end_phase("first paint")
+    startup_profiler.print_report()
+    if QUIT_AFTER_STARTUP_ARGUMENT in sys.argv:
+        app.quit()
+
+
 def run_application():
     sys.exit(app.exec_())
 
@@ -46,5 +66,8 @@ def run_application():
 if __name__ == "__main__":
     create_application()
     setup_application_font()
+    startup_profiler.end_phase("application font")
     create_window()
+    startup_profiler.end_phase("main window")
+    watch_first_paint()
     run_application()
@@ -0,0 +1,325 @@
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from packages.Startup import GlobalPaths
+from packages.Startup.DefaultOptions import Default_Video_Extension, Default_Subtitle_Extension, \
+    Default_Subtitle_Language, Default_Chapter_Extension
+from packages.Startup.PreDefined import ISO_639_2_LANGUAGES
+from packages.Tabs.FolderScanner import get_files_entries
+from packages.Tabs.GlobalSetting import get_file_name_absolute_path
+from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvmergeJob import GetJsonForMkvmergeJob
+from packages.Tabs.MuxSetting.Widgets.MuxingBatchSettings import MuxingBatchSettings, \
+    generate_muxing_batch_settings, get_only_keep_those_tracks
+from packages.Tabs.MuxSetting.Widgets.MuxingLogFile import get_time, add_job_log_to_log_file
+from packages.Tabs.MuxSetting.Widgets.MuxingOutputParser import parse_muxing_output_line, update_muxing_params
+from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
+from packages.Tabs.MuxSetting.Widgets.MuxingProcessRunner import FAILED_EXIT_CODE, MuxingProcessRunner
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+
+EXIT_CODE_ALL_JOBS_SUCCEEDED = 0
+EXIT_CODE_SOME_JOBS_FAILED = 1
+EXIT_CODE_USAGE_ERROR = 2
+
+JOB_SUCCEEDED = "OK"
+JOB_FAILED = "FAILED"
+JOB_SKIPPED = "SKIPPED"
+
+
+def get_extensions_list(extensions_text):
+    return [extension.strip().lstrip(".").upper() for extension in extensions_text.split(",") if extension.strip()]
+
+
+def get_files_list(folder_path, extensions, recursive=False):
+    return [file_entry.name for file_entry in get_files_entries(folder_path, extensions=extensions,
+                                                                 recursive=recursive)]
+
+
+def get_tracks_and_languages(items_text, parser, option_name):
+    tracks = []
+    languages = []
+    for item in items_text.split(","):
+        item = item.strip()
+        if item == "":
+            continue
+        if item.isdigit():
+            tracks.append(item)
+        elif item in ISO_639_2_LANGUAGES:
+            languages.append(item)
+        else:
+            parser.error(option_name + ": '" + item + "' is neither a track id nor a known language name")
+    return tracks, languages
+
+
+def get_default_track_setting(track_text, parser, option_name):
+    if track_text is None or track_text == "":
+        return ""
+    if track_text.isdigit():
+        return "Track " + track_text.zfill(2)
+    if track_text in ISO_639_2_LANGUAGES:
+        return track_text
+    parser.error(option_name + ": '" + track_text + "' is neither a track id nor a known language name")
+
+
+def find_tool(tool_name, tool_path):
+    if tool_path:
+        return tool_path if os.path.isfile(tool_path) else None
+    tool_in_system_path = shutil.which(tool_name)
+    if tool_in_system_path is not None:
+        return tool_in_system_path
+    repository_folder = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for tool_file_name in (tool_name, tool_name + ".exe"):
+        bundled_tool_path = os.path.join(repository_folder, "Resources", "Tools", tool_file_name)
+        if os.path.isfile(bundled_tool_path):
+            return bundled_tool_path
+    return None
+
+
+def create_arguments_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m packages.CommandLine",
+        description="Batch mux videos with subtitles, chapters and attachments without the GUI. "
+                    "Subtitle and chapter files are matched to videos by their sorted order, like in the GUI.")
+    parser.add_argument("--video-folder", required=True, help="folder that contains the source videos")
+    parser.add_argument("--video-extensions", default=Default_Video_Extension,
+                        help="comma separated video extensions (default: %(default)s)")
+    parser.add_argument("--video-recursive", action="store_true",
+                        help="also take the videos of every subfolder, the destination gets the same subfolders")
+    parser.add_argument("--destination", required=True, help="folder for the muxed videos")
+    parser.add_argument("--subtitle-folder", help="folder that contains the subtitles")
+    parser.add_argument("--subtitle-extensions", default=Default_Subtitle_Extension,
+                        help="comma separated subtitle extensions (default: %(default)s)")
+    parser.add_argument("--subtitle-language", default=Default_Subtitle_Language,
+                        help="subtitle language name (default: %(default)s)")
+    parser.add_argument("--subtitle-track-name", default="", help="subtitle track name")
+    parser.add_argument("--subtitle-delay", type=float, default=0.0, help="subtitle delay in seconds")
+    parser.add_argument("--subtitle-default", action="store_true", help="set the new subtitle as default")
+    parser.add_argument("--subtitle-forced", action="store_true", help="set the new subtitle as forced")
+    parser.add_argument("--chapter-folder", help="folder that contains the chapters")
+    parser.add_argument("--chapter-extensions", default=Default_Chapter_Extension,
+                        help="comma separated chapter extensions (default: %(default)s)")
+    parser.add_argument("--attachment-folder", help="attach every file of this folder to every video")
+    parser.add_argument("--attach-file", action="append", default=[], metavar="FILE",
+                        help="attach this file to every video, can be repeated")
+    parser.add_argument("--discard-old-attachments", action="store_true", help="remove the old attachments")
+    parser.add_argument("--only-keep-subtitles", metavar="TRACKS",
+                        help="comma separated track ids and language names of the subtitles to keep, "
+                             "an empty value removes all old subtitles")
+    parser.add_argument("--only-keep-audios", metavar="TRACKS",
+                        help="comma separated track ids and language names of the audios to keep, "
+                             "an empty value removes all old audios")
+    parser.add_argument("--default-subtitle", metavar="TRACK",
+                        help="track id or language name of the old subtitle to make default")
+    parser.add_argument("--default-subtitle-forced", action="store_true",
+                        help="also make it forced and every other subtitle not forced")
+    parser.add_argument("--default-audio", metavar="TRACK",
+                        help="track id or language name of the old audio to make default")
+    parser.add_argument("--default-audio-forced", action="store_true",
+                        help="also make it forced and every other audio not forced")
+    parser.add_argument("--jobs", type=int, default=1, help="number of parallel jobs (default: %(default)s)")
+    parser.add_argument("--abort-on-errors", action="store_true", help="do not start new jobs after a failed one")
+    parser.add_argument("--mkvmerge", help="path of mkvmerge, searched in PATH and Resources/Tools by default")
+    parser.add_argument("--log-file", help="path of the muxing log file")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    return parser
+
+
+def check_folder_argument(parser, folder_path, option_name):
+    if folder_path is not None and not os.path.isdir(folder_path):
+        parser.error(option_name + ": '" + folder_path + "' is not a folder")
+
+
+# runs a whole batch from the command line with the same job builder, process runner and output parser as the gui
+class CommandLineBatch:
+    def __init__(self, jobs, batch_settings: MuxingBatchSettings, mkvmerge_path, log_file_path, number_of_parallel_jobs,
+                 abort_on_errors=False, quiet=False):
+        self.jobs = jobs  # type: list[SingleJobData]
+        self.batch_settings = batch_settings
+        self.mkvmerge_path = mkvmerge_path
+        self.log_file_path = log_file_path
+        self.number_of_parallel_jobs = max(1, number_of_parallel_jobs)
+        self.abort_on_errors = abort_on_errors
+        self.quiet = quiet
+        self.jobs_folder_path = tempfile.mkdtemp(prefix="Jobs_", dir=GlobalPaths.TempFolderPath)
+        self.log_file_lock = threading.Lock()
+        self.print_lock = threading.Lock()
+        self.results = [JOB_SKIPPED] * len(self.jobs)
+        self.warnings = [0] * len(self.jobs)
+        self.number_of_finished_jobs = 0
+        self.stop_starting_jobs = False
+
+    def run(self):
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.number_of_parallel_jobs) as executor:
+            for job_index in range(len(self.jobs)):
+                executor.submit(self.run_job, job_index)
+        shutil.rmtree(self.jobs_folder_path, ignore_errors=True)
+        self.print_summary(time.time() - start_time)
+        if all(result == JOB_SUCCEEDED for result in self.results):
+            return EXIT_CODE_ALL_JOBS_SUCCEEDED
+        return EXIT_CODE_SOME_JOBS_FAILED
+
+    def run_job(self, job_index):
+        if self.stop_starting_jobs:
+            return
+        job = self.jobs[job_index]
+        job_start_time = get_time()
+        job_file_path = os.path.join(self.jobs_folder_path, "MkvmergeJob_" + str(job_index) + ".json")
+        job_log_file_path = os.path.join(self.jobs_folder_path, "log_job_" + str(job_index) + ".txt")
+        muxing_params = MuxingParams()
+        muxing_params.index = job_index
+        try:
+            GetJsonForMkvmergeJob(job, job_file_path=job_file_path, batch_settings=self.batch_settings)
+        except (OSError, ValueError, KeyError) as error:
+            muxing_params.error = True
+            muxing_params.message = "Error: " + str(error)
+            with open(job_log_file_path, "w", encoding="UTF-8") as job_log_file:
+                job_log_file.write(muxing_params.message + "\n")
+            exit_code = 2
+        else:
+            muxing_process_runner = MuxingProcessRunner(
+                command=[self.mkvmerge_path, "@" + job_file_path], log_file_path=job_log_file_path,
+                line_callback=lambda line: self.read_output_line(muxing_params, line))
+            exit_code = muxing_process_runner.run()
+        with self.log_file_lock:
+            add_job_log_to_log_file(log_file_path=self.log_file_path, job_log_file_path=job_log_file_path,
+                                    video_name=job.video_name, start_time=job_start_time)
+        self.finish_job(job_index, exit_code, muxing_params)
+
+    def read_output_line(self, muxing_params, line):
+        event = parse_muxing_output_line(line)
+        if event is not None:
+            update_muxing_params(muxing_params, event)
+
+    def finish_job(self, job_index, exit_code, muxing_params: MuxingParams):
+        failed = exit_code == FAILED_EXIT_CODE or muxing_params.error
+        self.results[job_index] = JOB_FAILED if failed else JOB_SUCCEEDED
+        self.warnings[job_index] = muxing_params.warnings
+        if failed and self.abort_on_errors:
+            self.stop_starting_jobs = True
+        with self.print_lock:
+            self.number_of_finished_jobs += 1
+            if self.quiet:
+                return
+            line = "[" + str(self.number_of_finished_jobs) + "/" + str(len(self.jobs)) + "] " + \
+                   self.results[job_index] + " " + self.jobs[job_index].video_name
+            if muxing_params.warnings > 0:
+                line += " (" + str(muxing_params.warnings) + " warnings)"
+            if failed:
+                line += ": " + muxing_params.message.strip()
+            print(line, flush=True)
+
+    def print_summary(self, elapsed_time):
+        print("Muxed " + str(len(self.jobs)) + " videos in " + str(round(elapsed_time, 1)) + "s: " +
+              str(self.results.count(JOB_SUCCEEDED)) + " succeeded, " +
+              str(self.results.count(JOB_FAILED)) + " failed, " +
+              str(self.results.count(JOB_SKIPPED)) + " skipped, " +
+              str(sum(self.warnings)) + " warnings", flush=True)
+        print("Log file: " + self.log_file_path, flush=True)
+
+
+def create_jobs(arguments):
+    video_extensions = get_extensions_list(arguments.video_extensions)
+    videos = get_files_list(arguments.video_folder, video_extensions, recursive=arguments.video_recursive)
+    subtitles = []
+    if arguments.subtitle_folder is not None:
+        subtitles = get_files_list(arguments.subtitle_folder, get_extensions_list(arguments.subtitle_extensions))
+    chapters = []
+    if arguments.chapter_folder is not None:
+        chapters = get_files_list(arguments.chapter_folder, get_extensions_list(arguments.chapter_extensions))
+    jobs = []
+    for i in range(len(videos)):
+        job = SingleJobData()
+        job.video_name = videos[i]
+        job.video_name_absolute = get_file_name_absolute_path(file_name=videos[i], folder_path=arguments.video_folder)
+        if i < len(subtitles):
+            job.subtitle_found = True
+            job.subtitle_name = subtitles[i]
+            job.subtitle_name_absolute = get_file_name_absolute_path(file_name=subtitles[i],
+                                                                     folder_path=arguments.subtitle_folder)
+            job.subtitle_language = arguments.subtitle_language
+            job.subtitle_track_name = arguments.subtitle_track_name
+            job.subtitle_delay = arguments.subtitle_delay
+            job.subtitle_set_default = arguments.subtitle_default
+            job.subtitle_set_forced = arguments.subtitle_forced
+        if i < len(chapters):
+            job.chapter_found = True
+            job.chapter_name = chapters[i]
+            job.chapter_name_absolute = get_file_name_absolute_path(file_name=chapters[i],
+                                                                    folder_path=arguments.chapter_folder)
+        jobs.append(job)
+    return jobs, len(subtitles) > 0
+
+
+def create_batch_settings(arguments, parser, jobs, have_subtitle_files):
+    attachments = []
+    if arguments.attachment_folder is not None:
+        for file_entry in get_files_entries(arguments.attachment_folder):
+            attachments.append(file_entry.absolute_path)
+    for file_to_attach in arguments.attach_file:
+        if not os.path.isfile(file_to_attach):
+            parser.error("--attach-file: '" + file_to_attach + "' is not a file")
+        attachments.append(os.path.abspath(file_to_attach))
+    only_keep_those_subtitles = ()
+    if arguments.only_keep_subtitles is not None:
+        only_keep_those_subtitles = get_only_keep_those_tracks(
+            *get_tracks_and_languages(arguments.only_keep_subtitles, parser, "--only-keep-subtitles"))
+    only_keep_those_audios = ()
+    if arguments.only_keep_audios is not None:
+        only_keep_those_audios = get_only_keep_those_tracks(
+            *get_tracks_and_languages(arguments.only_keep_audios, parser, "--only-keep-audios"))
+    default_subtitle = get_default_track_setting(arguments.default_subtitle, parser, "--default-subtitle")
+    default_audio = get_default_track_setting(arguments.default_audio, parser, "--default-audio")
+    return generate_muxing_batch_settings(
+        destination_folder_path=arguments.destination,
+        video_source_mkv_only=all(job.video_name.lower().endswith(".mkv") for job in jobs),
+        have_subtitle_files=have_subtitle_files,
+        subtitle_enabled=have_subtitle_files,
+        chapter_enabled=arguments.chapter_folder is not None,
+        attachment_enabled=len(attachments) > 0 or arguments.discard_old_attachments,
+        attachment_discard_old=arguments.discard_old_attachments,
+        attachments=attachments,
+        only_keep_those_subtitles_enabled=arguments.only_keep_subtitles is not None,
+        only_keep_those_subtitles=only_keep_those_subtitles,
+        only_keep_those_audios_enabled=arguments.only_keep_audios is not None,
+        only_keep_those_audios=only_keep_those_audios,
+        make_this_subtitle_default_semi_enabled=default_subtitle != "" and not arguments.default_subtitle_forced,
+        make_this_subtitle_default_full_enabled=default_subtitle != "" and arguments.default_subtitle_forced,
+        make_this_subtitle_default_track=default_subtitle,
+        make_this_audio_default_semi_enabled=default_audio != "" and not arguments.default_audio_forced,
+        make_this_audio_default_full_enabled=default_audio != "" and arguments.default_audio_forced,
+        make_this_audio_default_track=default_audio,
+    )
+
+
+def main(argv=None):
+    parser = create_arguments_parser()
+    arguments = parser.parse_args(argv)
+    check_folder_argument(parser, arguments.video_folder, "--video-folder")
+    check_folder_argument(parser, arguments.subtitle_folder, "--subtitle-folder")
+    check_folder_argument(parser, arguments.chapter_folder, "--chapter-folder")
+    check_folder_argument(parser, arguments.attachment_folder, "--attachment-folder")
+    if arguments.subtitle_language not in ISO_639_2_LANGUAGES:
+        parser.error("--subtitle-language: unknown language '" + arguments.subtitle_language + "'")
+    mkvmerge_path = find_tool("mkvmerge", arguments.mkvmerge)
+    if mkvmerge_path is None:
+        parser.error("can't find mkvmerge, install MKVToolNix or pass --mkvmerge")
+    GlobalPaths.MKVMERGE_PATH = mkvmerge_path
+    GlobalPaths.create_temp_folders()
+    os.makedirs(arguments.destination, exist_ok=True)
+    jobs, have_subtitle_files = create_jobs(arguments)
+    if len(jobs) == 0:
+        print("No videos found in " + arguments.video_folder, file=sys.stderr)
+        return EXIT_CODE_ALL_JOBS_SUCCEEDED
+    batch_settings = create_batch_settings(arguments, parser, jobs, have_subtitle_files)
+    log_file_path = arguments.log_file or os.path.join(GlobalPaths.MergeLogsFolderPath,
+                                                       "log_file_" + time.strftime('%Y_%m_%d_%H_%M_%S') + ".txt")
+    command_line_batch = CommandLineBatch(jobs=jobs, batch_settings=batch_settings, mkvmerge_path=mkvmerge_path,
+                                          log_file_path=log_file_path, number_of_parallel_jobs=arguments.jobs,
+                                          abort_on_errors=arguments.abort_on_errors, quiet=arguments.quiet)
+    return command_line_batch.run()
@@ -0,0 +1,5 @@
+import sys
+
+from packages.CommandLine.CommandLineBatch import main
+
+sys.exit(main())
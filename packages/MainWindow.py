@@ -1,3 +1,5 @@
+import sys
+
 import PySide2
 from PySide2.QtGui import Qt
 from PySide2.QtWidgets import QMainWindow, QFrame, QVBoxLayout
@@ -7,7 +9,14 @@ from packages.Startup.InitializeScreenResolution import width_factor, height_fac
 from packages.Tabs.GlobalSetting import GlobalSetting
 from packages.Tabs.TabsManager import TabsManager
 from packages.Widgets.CloseDialog import CloseDialog
-from packages.Widgets.TaskBarProgress import TaskBarProgress
+
+
+def create_task_bar_progress(window_handle):
+    # the task bar progress uses QtWinExtras which only exists on windows
+    if sys.platform != "win32":
+        return None
+    from packages.Widgets.TaskBarProgress import TaskBarProgress
+    return TaskBarProgress(window_handle=window_handle)
 
 
 def check_if_exit_when_muxing_on():
@@ -35,11 +44,13 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.tabs_frame)
         self.setAttribute(Qt.WA_DeleteOnClose)
         self.show_window()
-        self.task_bar_progress = TaskBarProgress(window_handle=self.windowHandle())
+        self.task_bar_progress = create_task_bar_progress(window_handle=self.windowHandle())
         self.connect_signals()
 
     def connect_signals(self):
         self.tabs.currentChanged.connect(self.update_minimum_size)
+        if self.task_bar_progress is None:
+            return
         self.tabs.task_bar_start_muxing_signal.connect(self.task_bar_progress.start_muxing)
         self.tabs.update_task_bar_progress_signal.connect(self.task_bar_progress.update_progress)
         self.tabs.update_task_bar_paused_signal.connect(self.task_bar_progress.pause_progress)
@@ -0,0 +1,16 @@
+from PySide2.QtCore import QObject, QEvent, QTimer
+
+
+# calls first_paint_function once, right after the watched widget finished its first paint
+class FirstPaintWatcher(QObject):
+    def __init__(self, widget, first_paint_function):
+        super().__init__()
+        self.widget = widget
+        self.first_paint_function = first_paint_function
+        self.widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            self.widget.removeEventFilter(self)
+            QTimer.singleShot(0, self.first_paint_function)
+        return False
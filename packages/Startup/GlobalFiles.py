@@ -1,30 +1,12 @@
 import os
-import sys
-from pathlib import Path
+
 from PySide2.QtGui import QPixmap, QIcon
-import tempfile
 
+from packages.Startup.GlobalPaths import FontFolderPath, IconFolderPath
 from packages.Widgets.MissingFilesMessage import MissingFilesMessage
 # noinspection PyUnresolvedReferences
 import packages.Startup.MainApplication
 
-
-def get_temp_folder_path():
-    temp_folder_path = tempfile.gettempdir()
-    my_temp_folder_path = os.path.join(os.path.abspath(temp_folder_path), Path('MKV Muxing Batch GUI'))
-    os.makedirs(my_temp_folder_path, exist_ok=True)
-    return my_temp_folder_path
-
-
-script_path = sys.argv[0]  # get path of the this file
-script_folder = os.path.dirname(script_path)
-resources_folder = os.path.join(os.path.abspath(script_folder), Path('Resources'))
-FontFolderPath = os.path.join(os.path.abspath(resources_folder), Path('Fonts'))
-IconFolderPath = os.path.join(os.path.abspath(resources_folder), Path('Icons'))
-ToolsFolderPath = os.path.join(os.path.abspath(resources_folder), Path('Tools'))
-TempFolderPath = get_temp_folder_path()
-MergeLogsFolderPath = os.path.join(os.path.abspath(TempFolderPath), Path('Logs'))
-os.makedirs(MergeLogsFolderPath, exist_ok=True)
 try:
     MyFontPath = os.path.join(os.path.abspath(FontFolderPath), 'OpenSans.ttf')
     WarningCheckBigIconPath = os.path.join(os.path.abspath(IconFolderPath), 'WarningCheckBig.png')
@@ -53,35 +35,47 @@ try:
     SpinnerIconPath = os.path.join(os.path.abspath(IconFolderPath), 'Spinner.gif')
     GoodJobIconPath = os.path.join(os.path.abspath(IconFolderPath), 'GoodJob.png')
     AppIconPath = os.path.join(os.path.abspath(IconFolderPath), 'App.ico')
-    OkIcon = QIcon(QPixmap(OkIconPath))
-    ErrorIcon = QIcon(QPixmap(ErrorIconPath))
-    ErrorBigIcon = QIcon(QPixmap(ErrorBigIconPath))
-    SubtitleIcon = QIcon(QPixmap(SubtitleIconPath))
-    SwitchIcon = QIcon(QPixmap(SwitchIconPath))
-    RefreshIcon = QIcon(QPixmap(RefreshIconPath))
-    QuestionIcon = QIcon(QPixmap(QuestionIconPath))
-    InfoIcon = QIcon(QPixmap(InfoIconPath))
-    InfoSettingIcon = QIcon(QPixmap(InfoSettingIconPath))
-    WarningCheckBigIcon = QIcon(QPixmap(WarningCheckBigIconPath))
-    WarningCheckIcon = QIcon(QPixmap(WarningCheckIconPath))
-    StartMultiplexingIcon = QIcon(QPixmap(StartMultiplexingIconPath))
-    PauseMultiplexingIcon = QIcon(QPixmap(PauseMultiplexingIconPath))
-    AddToQueueIcon = QIcon(QPixmap(AddToQueueIconPath))
-    CleanIcon = QIcon(QPixmap(ClearIconPath))
-    TopIcon = QIcon(QPixmap(TopIconPath))
-    DownIcon = QIcon(QPixmap(DownIconPath))
-    UpIcon = QIcon(QPixmap(UpIconPath))
-    BottomIcon = QIcon(QPixmap(BottomIconPath))
-    SelectFolderIcon = QIcon(QPixmap(FolderIconPath))
-    AppIcon = QIcon(QPixmap(AppIconPath))
-
-    AppLogFilePath = os.path.join(os.path.abspath(TempFolderPath), "app_log.txt")
-    LogFilePath = os.path.join(os.path.abspath(TempFolderPath), "app_log.txt")
-    mkvpropeditJsonJobFilePath = os.path.join(os.path.abspath(TempFolderPath), "mkvpropeditJob.json")
-    mkvmergeJsonJobFilePath = os.path.join(os.path.abspath(TempFolderPath), "MkvmergeJob.json")
-    mkvmergeJsonInfoFilePath = os.path.join(os.path.abspath(TempFolderPath), "MkvmergeInfo.json")
-    MKVPROPEDIT_PATH = os.path.join(os.path.abspath(ToolsFolderPath), "mkvpropedit")
-    MKVMERGE_PATH = os.path.join(os.path.abspath(ToolsFolderPath), "mkvmerge")
 except Exception as e:
     missing_files_message = MissingFilesMessage(error_message=str(e))
     missing_files_message.execute()
+
+# icons are loaded on first use and then reused, GlobalFiles.OkIcon and the others still work through __getattr__
+ICONS_PATHS = {
+    "OkIcon": OkIconPath,
+    "ErrorIcon": ErrorIconPath,
+    "ErrorBigIcon": ErrorBigIconPath,
+    "SubtitleIcon": SubtitleIconPath,
+    "SwitchIcon": SwitchIconPath,
+    "RefreshIcon": RefreshIconPath,
+    "QuestionIcon": QuestionIconPath,
+    "InfoIcon": InfoIconPath,
+    "InfoSettingIcon": InfoSettingIconPath,
+    "WarningCheckBigIcon": WarningCheckBigIconPath,
+    "WarningCheckIcon": WarningCheckIconPath,
+    "TrueCheckIcon": TrueCheckIconPath,
+    "StartMultiplexingIcon": StartMultiplexingIconPath,
+    "PauseMultiplexingIcon": PauseMultiplexingIconPath,
+    "AddToQueueIcon": AddToQueueIconPath,
+    "CleanIcon": ClearIconPath,
+    "TopIcon": TopIconPath,
+    "DownIcon": DownIconPath,
+    "UpIcon": UpIconPath,
+    "BottomIcon": BottomIconPath,
+    "SelectFolderIcon": FolderIconPath,
+    "AppIcon": AppIconPath,
+}
+loaded_icons = {}  # type: dict[str, QIcon]
+
+
+def get_icon(icon_name):
+    icon = loaded_icons.get(icon_name)
+    if icon is None:
+        icon = QIcon(QPixmap(ICONS_PATHS[icon_name]))
+        loaded_icons[icon_name] = icon
+    return icon
+
+
+def __getattr__(name):
+    if name in ICONS_PATHS:
+        return get_icon(name)
+    raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
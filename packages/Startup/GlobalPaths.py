@@ -0,0 +1,53 @@
+# every path the muxing engine needs, kept free of Qt so it can be used without a display
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+
+def get_temp_folder_path():
+    temp_folder_path = tempfile.gettempdir()
+    my_temp_folder_path = os.path.join(os.path.abspath(temp_folder_path), Path('MKV Muxing Batch GUI'))
+    return my_temp_folder_path
+
+
+# the temp folders are created the first time something is written to them, not when the app starts
+def create_temp_folders():
+    global temp_folders_created
+    if temp_folders_created:
+        return
+    for folder_path in (TempFolderPath, MergeLogsFolderPath, JobsFolderPath, ProbeCacheFolderPath):
+        os.makedirs(folder_path, exist_ok=True)
+    temp_folders_created = True
+
+
+def get_mkvmerge_json_job_file_path(job_index):
+    return os.path.join(os.path.abspath(JobsFolderPath), "MkvmergeJob_" + str(job_index) + ".json")
+
+
+def get_mkvpropedit_json_job_file_path(job_index):
+    return os.path.join(os.path.abspath(JobsFolderPath), "mkvpropeditJob_" + str(job_index) + ".json")
+
+
+def get_job_log_file_path(job_index):
+    return os.path.join(os.path.abspath(JobsFolderPath), "log_job_" + str(job_index) + ".txt")
+
+
+script_path = sys.argv[0]  # get path of the this file
+script_folder = os.path.dirname(script_path)
+resources_folder = os.path.join(os.path.abspath(script_folder), Path('Resources'))
+FontFolderPath = os.path.join(os.path.abspath(resources_folder), Path('Fonts'))
+IconFolderPath = os.path.join(os.path.abspath(resources_folder), Path('Icons'))
+ToolsFolderPath = os.path.join(os.path.abspath(resources_folder), Path('Tools'))
+TempFolderPath = get_temp_folder_path()
+MergeLogsFolderPath = os.path.join(os.path.abspath(TempFolderPath), Path('Logs'))
+JobsFolderPath = os.path.join(os.path.abspath(TempFolderPath), Path('Jobs'))
+ProbeCacheFolderPath = os.path.join(os.path.abspath(TempFolderPath), Path('ProbeCache'))
+temp_folders_created = False
+
+AppLogFilePath = os.path.join(os.path.abspath(TempFolderPath), "app_log.txt")
+LogFilePath = os.path.join(os.path.abspath(TempFolderPath), "app_log.txt")
+mkvpropeditJsonJobFilePath = os.path.join(os.path.abspath(TempFolderPath), "mkvpropeditJob.json")
+mkvmergeJsonJobFilePath = os.path.join(os.path.abspath(TempFolderPath), "MkvmergeJob.json")
+MKVPROPEDIT_PATH = os.path.join(os.path.abspath(ToolsFolderPath), "mkvpropedit")
+MKVMERGE_PATH = os.path.join(os.path.abspath(ToolsFolderPath), "mkvmerge")
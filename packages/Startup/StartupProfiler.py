@@ -0,0 +1,44 @@
+import sys
+import time
+
+STARTUP_TIME_BUDGET_MS = 1500
+PROFILE_STARTUP_ARGUMENT = "--profile-startup"
+QUIT_AFTER_STARTUP_ARGUMENT = "--quit-after-startup"
+
+
+# measures how long each startup phase takes until the main window is painted for the first time
+# only active when the app is started with --profile-startup
+class StartupProfiler:
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.start_time = time.perf_counter()
+        self.last_phase_time = self.start_time
+        self.phases = []  # type: list[tuple[str, float]]
+
+    def end_phase(self, phase_name):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase_name, (now - self.last_phase_time) * 1000))
+        self.last_phase_time = now
+
+    def get_total_time(self):
+        return (self.last_phase_time - self.start_time) * 1000
+
+    def generate_report(self):
+        total_time = self.get_total_time()
+        report_lines = ["Startup profile (time to first paint):"]
+        for phase_name, phase_time in self.phases:
+            report_lines.append("  " + phase_name.ljust(32) + str(round(phase_time, 1)).rjust(8) + " ms")
+        if total_time > STARTUP_TIME_BUDGET_MS:
+            budget_result = "over the budget of " + str(STARTUP_TIME_BUDGET_MS) + " ms"
+        else:
+            budget_result = "within the budget of " + str(STARTUP_TIME_BUDGET_MS) + " ms"
+        report_lines.append("  " + "total".ljust(32) + str(round(total_time, 1)).rjust(8) + " ms, " + budget_result)
+        return "\n".join(report_lines)
+
+    def print_report(self):
+        print(self.generate_report(), flush=True)
+
+
+startup_profiler = StartupProfiler(enabled=PROFILE_STARTUP_ARGUMENT in sys.argv)
@@ -1,28 +1,25 @@
 from PySide2.QtCore import Signal
-from PySide2.QtWidgets import QVBoxLayout, QGroupBox
+from PySide2.QtWidgets import QVBoxLayout, QGroupBox, QWidget
 
 from packages.Tabs.AttachmentTab.Widgets.AttachmentSourceButton import AttachmentSourceButton
 from packages.Tabs.AttachmentTab.Widgets.AttachmentSourceLineEdit import AttachmentSourceLineEdit
 from packages.Tabs.AttachmentTab.Widgets.AttachmentTable import AttachmentTable
 from packages.Tabs.AttachmentTab.Widgets.AttachmentsTotalSizeValueLabel import AttachmentsTotalSizeValueLabel
 from packages.Tabs.AttachmentTab.Widgets.DiscardOldAttachmentsCheckBox import DiscardOldAttachmentsCheckBox
+from packages.Tabs.FolderIndex import FolderIndex, update_files_names_list, FILE_ROW_REMOVED, FILE_ROW_INSERTED
+from packages.Tabs.FolderIndexRegistry import folder_index_registry
 from packages.Tabs.GlobalSetting import *
-from packages.Tabs.GlobalSetting import sort_names_like_windows, get_readable_filesize, get_files_names_absolute_list, \
-    get_file_name_absolute_path
+from packages.Tabs.GlobalSetting import get_readable_filesize
+from packages.Widgets.FolderScanStatus import FolderScanStatus
 from packages.Widgets.InvalidPathDialog import *
 
 
 # noinspection PyAttributeOutsideInit
-def get_files_size_list(files_list, folder_path):
-    files_size_list = []
-    for i in range(len(files_list)):
-        file_name_absolute = get_file_name_absolute_path(file_name=files_list[i], folder_path=folder_path)
-        file_size_bytes = os.path.getsize(file_name_absolute)
-        files_size_list.append(get_readable_filesize(size_bytes=file_size_bytes))
-    return files_size_list
+def get_files_size_list(files_entries):
+    return [get_readable_filesize(size_bytes=file_entry.size) for file_entry in files_entries]
 
 
-class AttachmentSelectionSetting(GlobalSetting):
+class AttachmentSelectionSetting(QWidget, GlobalSetting):
     tab_clicked_signal = Signal()
     activation_signal = Signal(bool)
 
@@ -35,6 +32,8 @@ class AttachmentSelectionSetting(GlobalSetting):
         self.attachment_source_button = AttachmentSourceButton()
         self.discard_old_attachments_checkBox = DiscardOldAttachmentsCheckBox()
         self.table = AttachmentTable()
+        self.folder_scan_status = FolderScanStatus()
+        self.folder_index = None  # type: FolderIndex
         self.MainLayout = QVBoxLayout()
         self.attachment_main_groupBox = QGroupBox(self)
         self.attachment_main_layout = QGridLayout()
@@ -43,6 +42,7 @@ class AttachmentSelectionSetting(GlobalSetting):
         self.files_checked_list = []
         self.files_names_absolute_list = []
         self.files_size_list = []
+        self.files_sizes_bytes = []
         self.setup_layouts()
         self.connect_signals()
 
@@ -63,37 +63,73 @@ class AttachmentSelectionSetting(GlobalSetting):
             self.attachment_source_lineEdit.setText(new_path)
             self.update_files_lists(new_path)
 
-            self.update_total_size()
-            self.show_files_list()
-
     def update_total_size(self):
-        self.attachment_total_size_value_label.update_total_size(self.files_names_absolute_list)
+        self.attachment_total_size_value_label.update_total_size(files_names_absolute_list=self.files_names_absolute_list,
+                                                                 files_sizes_bytes=self.files_sizes_bytes)
 
     def update_files_lists(self, folder_path):
         if folder_path == "" or folder_path.isspace():
             self.folder_path = ""
             self.attachment_source_lineEdit.setText("")
             return
-        try:
-            self.folder_path = folder_path
-            self.files_names_list = self.get_files_list(self.folder_path)
-            self.files_names_absolute_list = get_files_names_absolute_list(self.files_names_list, self.folder_path)
-            self.files_size_list = get_files_size_list(files_list=self.files_names_list, folder_path=self.folder_path)
-        except Exception as e:
-            invalid_path_dialog = InvalidPathDialog()
-            invalid_path_dialog.execute()
-
-    def get_files_list(self, folder_path):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, folder_path)
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            if os.path.getsize(temp_files_names_absolute[i]) == 0:
-                continue
-            result.append(temp_files_names[i])
-        return result
+        self.folder_scan_status.start_scan(folder_path)
+
+    def folder_scan_finished(self, folder_index: FolderIndex):
+        self.folder_index = folder_index
+        self.folder_path = folder_index.folder_path
+        files_entries = folder_index.get_files_entries()
+        self.files_names_list = [file_entry.name for file_entry in files_entries]
+        self.files_names_absolute_list = [file_entry.absolute_path for file_entry in files_entries]
+        self.files_size_list = get_files_size_list(files_entries)
+        self.files_sizes_bytes = [file_entry.size for file_entry in files_entries]
+        self.update_total_size()
+        self.show_files_list()
+        folder_index_registry.watch_folder(self, folder_index)
+
+    def is_ready_for_folder_changes(self):
+        return not self.folder_scan_status.is_scanning()
+
+    def apply_folder_changes(self, folder_changes):
+        # the lists are changed in place, the new files come checked like after a scan
+        files_checking_list = GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST
+        rows_updates = update_files_names_list(self.files_names_list, folder_changes)
+        for row_update_type, row_index, file_entry in rows_updates:
+            if row_update_type == FILE_ROW_REMOVED:
+                self.attachment_total_size_value_label.attachment_removed(
+                    file_absolute_name=self.files_names_absolute_list.pop(row_index),
+                    is_checked=files_checking_list.pop(row_index))
+                self.files_size_list.pop(row_index)
+                self.files_sizes_bytes.pop(row_index)
+                self.table.remove_file_row(row_index)
+            elif row_update_type == FILE_ROW_INSERTED:
+                file_size = get_readable_filesize(size_bytes=file_entry.size)
+                self.files_names_absolute_list.insert(row_index, file_entry.absolute_path)
+                self.files_size_list.insert(row_index, file_size)
+                self.files_sizes_bytes.insert(row_index, file_entry.size)
+                files_checking_list.insert(row_index, True)
+                self.attachment_total_size_value_label.attachment_added(file_absolute_name=file_entry.absolute_path,
+                                                                        file_size=file_entry.size)
+                self.table.insert_file_row(row_index=row_index, file_name=file_entry.name, file_size=file_size)
+            else:
+                file_size = get_readable_filesize(size_bytes=file_entry.size)
+                self.attachment_total_size_value_label.attachment_removed(
+                    file_absolute_name=self.files_names_absolute_list[row_index],
+                    is_checked=files_checking_list[row_index])
+                self.attachment_total_size_value_label.attachment_added(file_absolute_name=file_entry.absolute_path,
+                                                                        file_size=file_entry.size,
+                                                                        is_checked=files_checking_list[row_index])
+                self.files_names_absolute_list[row_index] = file_entry.absolute_path
+                self.files_size_list[row_index] = file_size
+                self.files_sizes_bytes[row_index] = file_entry.size
+                self.table.update_file_row(row_index=row_index, file_name=file_entry.name, file_size=file_size)
+
+    def folder_scan_failed(self, error_message):
+        invalid_path_dialog = InvalidPathDialog()
+        invalid_path_dialog.execute()
+        self.attachment_source_lineEdit.setText(self.folder_path)
+
+    def folder_scan_canceled(self):
+        self.attachment_source_lineEdit.setText(self.folder_path)
 
     def show_files_list(self):
         self.table.show_files_list(files_names_list=self.files_names_list, files_size_list=self.files_size_list)
@@ -112,7 +148,8 @@ class AttachmentSelectionSetting(GlobalSetting):
         self.attachment_main_layout.addWidget(self.attachment_total_size_value_label, 1, 1)
         self.attachment_main_layout.addWidget(self.discard_old_attachments_checkBox, 1, 40, 1, -1,
                                               alignment=Qt.AlignRight)
-        self.attachment_main_layout.addWidget(self.table, 2, 0, 1, -1)
+        self.attachment_main_layout.addWidget(self.folder_scan_status, 2, 0, 1, -1)
+        self.attachment_main_layout.addWidget(self.table, 3, 0, 1, -1)
 
     def change_global_last_path_directory(self):
         if self.folder_path != "" and not self.folder_path.isspace():
@@ -128,6 +165,9 @@ class AttachmentSelectionSetting(GlobalSetting):
         self.attachment_source_lineEdit.edit_finished_signal.connect(self.update_folder_path)
         self.attachment_main_groupBox.toggled.connect(self.activate_tab)
         self.tab_clicked_signal.connect(self.tab_clicked)
+        self.folder_scan_status.scan_finished_signal.connect(self.folder_scan_finished)
+        self.folder_scan_status.scan_failed_signal.connect(self.folder_scan_failed)
+        self.folder_scan_status.scan_canceled_signal.connect(self.folder_scan_canceled)
         self.table.update_checked_attachment_signal.connect(self.attachment_total_size_value_label.attachment_checked)
         self.table.update_unchecked_attachment_signal.connect(
             self.attachment_total_size_value_label.attachment_unchecked)
@@ -157,6 +197,9 @@ class AttachmentSelectionSetting(GlobalSetting):
 
     def activate_tab(self, on):
         if not on:
+            self.folder_scan_status.cancel_scan()
+            folder_index_registry.stop_watching(self)
+            self.folder_index = None
             self.table.clear_table()
             self.attachment_source_lineEdit.setText("")
             self.attachment_total_size_value_label.set_total_size_zero()
@@ -165,6 +208,7 @@ class AttachmentSelectionSetting(GlobalSetting):
             self.files_names_list = []
             self.files_names_absolute_list = []
             self.files_size_list = []
+            self.files_sizes_bytes = []
             GlobalSetting.ATTACHMENT_FILES_LIST = []
             GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST = []
             GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST = []
@@ -1,34 +1,36 @@
 import PySide2
 from PySide2.QtCore import Signal
-from PySide2.QtGui import Qt, QColor
-from PySide2.QtWidgets import QAbstractItemView, QHeaderView, QTableWidgetItem
+from PySide2.QtGui import Qt
+from PySide2.QtWidgets import QAbstractItemView, QHeaderView
 
 from packages.Startup.InitializeScreenResolution import screen_size
 from packages.Tabs.GlobalSetting import GlobalSetting
-from packages.Widgets.TableWidget import TableWidget
+from packages.Widgets.FilesTableModel import FilesTableModel
+from packages.Widgets.TableView import TableView
 
 
-class AttachmentTable(TableWidget):
+class AttachmentTable(TableView):
     update_unchecked_attachment_signal = Signal(str)
     update_checked_attachment_signal = Signal(str)
 
     def __init__(self):
         super().__init__()
-        self.checking_row_updates = False
-        self.setColumnCount(2)
-        self.setRowCount(0)
         self.column_ids = {
             "Name": 0,
             "Size": 1,
         }
+        # the check state and the grey text of an unchecked attachment come from the model
+        self.files_model = FilesTableModel(columns_names=["Name", "Size"], name_prefix=" ", checkable=True,
+                                           parent=self)
+        self.setModel(self.files_model)
         self.disable_table_bold_column()
         self.disable_table_edit()
         self.force_select_whole_row()
         self.force_single_row_selection()
         self.make_column_expand_as_possible(column_index=self.column_ids["Name"])
         self.set_row_height(new_height=screen_size.height() // 27)
-        self.setup_columns()
-        self.itemChanged.connect(self.update_checked_attachments_state)
+        self.center_row_numbers()
+        self.files_model.file_check_state_changed_signal.connect(self.update_checked_attachments_state)
 
     def disable_table_bold_column(self):
         self.horizontalHeader().setHighlightSections(False)
@@ -46,14 +48,9 @@ class AttachmentTable(TableWidget):
     def force_single_row_selection(self):
         self.setSelectionMode(QAbstractItemView.SingleSelection)
 
-    def setup_columns(self):
-        self.set_column_name(column_index=self.column_ids["Name"], name="Name")
-        self.set_column_name(column_index=self.column_ids["Size"], name="Size")
-
-    def set_column_name(self, column_index, name, alignment=Qt.AlignLeft):
-        column = QTableWidgetItem(name)
-        column.setTextAlignment(alignment)
-        self.setHorizontalHeaderItem(column_index, column)
+    def center_row_numbers(self):
+        # the header numbers the rows by itself so inserting or removing a row never renumbers the others
+        self.verticalHeader().setDefaultAlignment(Qt.AlignCenter)
 
     def set_row_height(self, new_height):
         self.verticalHeader().setDefaultSectionSize(new_height)
@@ -67,56 +64,33 @@ class AttachmentTable(TableWidget):
         self.resize_2nd_column()
 
     def show_files_list(self, files_names_list, files_size_list):
-        self.checking_row_updates = False
-        self.setRowCount(len(files_names_list))
+        self.files_model.show_files(files_names_list=files_names_list, files_size_list=files_size_list)
         self.set_row_height(new_height=screen_size.height() // 27)
-        for i in range(len(files_names_list)):
-            self.set_row_number(row_number=i + 1, row_index=i)
-            self.set_row_file_name(file_name=files_names_list[i], row_index=i)
-            self.set_row_file_size(file_size=files_size_list[i], row_index=i)
         self.show()
-        self.checking_row_updates = True
 
-    def set_row_number(self, row_number, row_index):
-        row_number_item = QTableWidgetItem(str(row_number))
-        row_number_item.setTextAlignment(Qt.AlignCenter)
-        self.setVerticalHeaderItem(row_index, row_number_item)
+    def insert_file_row(self, row_index, file_name, file_size):
+        self.files_model.insert_file_row(row_index=row_index, file_name=file_name, file_size=file_size)
 
-    def set_row_file_size(self, file_size, row_index):
-        file_size_item = QTableWidgetItem(file_size)
-        self.setItem(row_index, self.column_ids["Size"], file_size_item)
+    def update_file_row(self, row_index, file_name, file_size):
+        self.files_model.update_file_row(row_index=row_index, file_name=file_name, file_size=file_size)
 
-    def set_row_file_name(self, file_name, row_index):
-        file_name_item = QTableWidgetItem(" " + file_name)
-        file_name_item.setCheckState(Qt.Checked)
-        self.setItem(row_index, self.column_ids["Name"], file_name_item)
+    def remove_file_row(self, row_index):
+        self.files_model.remove_file_row(row_index)
 
     def clear_table(self):
-        self.setRowCount(0)
+        self.files_model.clear_files()
         self.clearSelection()
 
-    def update_checked_attachments_state(self, item: QTableWidgetItem):
-        attachment_index = item.row()
-        if self.checking_row_updates:
-            self.checking_row_updates = False
-            self.update_selected_row(row_index=attachment_index)
-            if attachment_index < len(GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST):
-                if item.checkState() == Qt.Unchecked:
-                    GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST[attachment_index] = False
-                    self.update_row_text_color(row_index=attachment_index, color_string="#787878")
-                    self.update_unchecked_attachment_signal.emit(
-                        GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST[attachment_index])
-                elif item.checkState() == Qt.Checked:
-                    GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST[attachment_index] = True
-                    self.update_row_text_color(row_index=attachment_index, color_string="#000000")
-                    self.update_checked_attachment_signal.emit(
-                        GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST[attachment_index])
-            self.checking_row_updates = True
-
-    def update_row_text_color(self, row_index, color_string):
-        new_color = QColor(color_string)
-        self.item(row_index, self.column_ids["Name"]).setTextColor(new_color)
-        self.item(row_index, self.column_ids["Size"]).setTextColor(new_color)
+    def update_checked_attachments_state(self, attachment_index, is_checked):
+        self.update_selected_row(row_index=attachment_index)
+        if attachment_index < len(GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST):
+            GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST[attachment_index] = is_checked
+            if is_checked:
+                self.update_checked_attachment_signal.emit(
+                    GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST[attachment_index])
+            else:
+                self.update_unchecked_attachment_signal.emit(
+                    GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST[attachment_index])
 
     def update_selected_row(self, row_index):
         self.selectRow(row_index)
@@ -1,5 +1,3 @@
-import os
-
 from PySide2.QtWidgets import QLabel
 
 from packages.Tabs.GlobalSetting import get_readable_filesize
@@ -11,29 +9,39 @@ class AttachmentsTotalSizeValueLabel(QLabel):
         self.setText("0.0 B")
         self.total_size_bytes = 0
         self.total_size_readable = "0.0 B"
+        self.files_sizes = {}  # type: dict[str, int]
 
-    def update_total_size(self, files_names_absolute_list):
-        total_size_bytes = 0
-        for i in range(len(files_names_absolute_list)):
-            file_size = os.path.getsize(files_names_absolute_list[i])
-            total_size_bytes += file_size
-        self.total_size_bytes = total_size_bytes
+    def update_total_size(self, files_names_absolute_list, files_sizes_bytes):
+        # the sizes come from the folder scan so checking and unchecking never stat the files again
+        self.files_sizes = dict(zip(files_names_absolute_list, files_sizes_bytes))
+        self.total_size_bytes = sum(files_sizes_bytes)
         self.total_size_readable = get_readable_filesize(self.total_size_bytes)
         self.setText(self.total_size_readable)
 
     def set_total_size_zero(self):
+        self.files_sizes = {}
         self.total_size_bytes = 0
         self.total_size_readable = "0.0 B"
         self.setText(self.total_size_readable)
 
     def attachment_checked(self, file_absolute_name):
-        file_size = os.path.getsize(file_absolute_name)
+        file_size = self.files_sizes.get(file_absolute_name, 0)
         self.total_size_bytes += file_size
         self.total_size_readable = get_readable_filesize(self.total_size_bytes)
         self.setText(self.total_size_readable)
 
     def attachment_unchecked(self, file_absolute_name):
-        file_size = os.path.getsize(file_absolute_name)
+        file_size = self.files_sizes.get(file_absolute_name, 0)
         self.total_size_bytes -= file_size
         self.total_size_readable = get_readable_filesize(self.total_size_bytes)
         self.setText(self.total_size_readable)
+
+    def attachment_added(self, file_absolute_name, file_size, is_checked=True):
+        self.files_sizes[file_absolute_name] = file_size
+        if is_checked:
+            self.attachment_checked(file_absolute_name)
+
+    def attachment_removed(self, file_absolute_name, is_checked):
+        if is_checked:
+            self.attachment_unchecked(file_absolute_name)
+        self.files_sizes.pop(file_absolute_name, None)
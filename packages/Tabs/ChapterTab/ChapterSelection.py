@@ -2,6 +2,7 @@ from PySide2.QtCore import Signal
 from PySide2.QtWidgets import (
     QGroupBox,
     QVBoxLayout,
+    QWidget,
 )
 
 from packages.Startup.DefaultOptions import Default_Chapter_Extension
@@ -9,13 +10,16 @@ from packages.Tabs.ChapterTab.Widgets.ChapterExtensionsCheckableComboBox import
 from packages.Tabs.ChapterTab.Widgets.ChapterSourceButton import ChapterSourceButton
 from packages.Tabs.ChapterTab.Widgets.ChapterSourceLineEdit import ChapterSourceLineEdit
 from packages.Tabs.ChapterTab.Widgets.MatchChapterLayout import MatchChapterLayout
+from packages.Tabs.FolderIndex import FolderIndex, update_files_names_list, FILE_ROW_REMOVED, FILE_ROW_INSERTED
+from packages.Tabs.FolderIndexRegistry import folder_index_registry
 from packages.Tabs.GlobalSetting import *
+from packages.Widgets.FolderScanStatus import FolderScanStatus
 from packages.Widgets.InvalidPathDialog import *
 from packages.Widgets.ReloadFilesDialog import *
 
 
 # noinspection PyAttributeOutsideInit
-class ChapterSelectionSetting(GlobalSetting):
+class ChapterSelectionSetting(QWidget, GlobalSetting):
     tab_clicked_signal = Signal()
     activation_signal = Signal(bool)
 
@@ -33,6 +37,7 @@ class ChapterSelectionSetting(GlobalSetting):
         self.chapter_source_button = ChapterSourceButton()
         self.chapter_extensions_comboBox = ChapterExtensionsCheckableComboBox()
         self.chapter_match_layout = MatchChapterLayout(parent=self)
+        self.folder_scan_status = FolderScanStatus()
         self.chapter_options_layout = QHBoxLayout()
         self.MainLayout = QVBoxLayout()
         self.main_layout = QGridLayout()
@@ -53,9 +58,13 @@ class ChapterSelectionSetting(GlobalSetting):
         self.chapter_match_layout.sync_chapter_files_with_global_files_after_swap_signal.connect(
             self.sync_chapter_files_with_global_files)
         self.tab_clicked_signal.connect(self.tab_clicked)
+        self.folder_scan_status.scan_finished_signal.connect(self.folder_scan_finished)
+        self.folder_scan_status.scan_failed_signal.connect(self.folder_scan_failed)
+        self.folder_scan_status.scan_canceled_signal.connect(self.folder_scan_canceled)
 
     def create_properties(self):
         self.folder_path = ""
+        self.folder_index = None  # type: FolderIndex
         self.files_names_list = []
         self.files_names_absolute_list = []
         self.current_chapter_extensions = [Default_Chapter_Extension]
@@ -76,7 +85,8 @@ class ChapterSelectionSetting(GlobalSetting):
         self.main_layout.addWidget(self.chapter_source_button, 0, 2)
         self.main_layout.addWidget(self.chapter_extension_label, 1, 0)
         self.main_layout.addLayout(self.chapter_options_layout, 1, 1, 1, 2)
-        self.main_layout.addWidget(self.chapter_match_groupBox, 2, 0, 1, -1)
+        self.main_layout.addWidget(self.folder_scan_status, 2, 0, 1, -1)
+        self.main_layout.addWidget(self.chapter_match_groupBox, 3, 0, 1, -1)
 
     def setup_chapter_main_groupBox(self):
         self.chapter_main_groupBox.setParent(self)
@@ -89,46 +99,63 @@ class ChapterSelectionSetting(GlobalSetting):
         if new_path != "":
             self.chapter_source_lineEdit.setText(new_path)
             self.update_files_lists(new_path)
-            self.show_chapter_files_list()
 
     def update_files_lists(self, folder_path):
         if folder_path == "" or folder_path.isspace():
             self.folder_path = ""
             self.chapter_source_lineEdit.setText("")
             return
-        try:
-            self.folder_path = folder_path
-            self.files_names_list = self.get_files_list(self.folder_path)
-            self.files_names_absolute_list = get_files_names_absolute_list(self.files_names_list, self.folder_path)
-        except Exception as e:
-            invalid_path_dialog = InvalidPathDialog()
-            invalid_path_dialog.execute()
+        self.folder_scan_status.start_scan(folder_path)
+
+    def folder_scan_finished(self, folder_index: FolderIndex):
+        self.folder_index = folder_index
+        self.folder_path = folder_index.folder_path
+        self.update_files_lists_from_folder_index()
+        self.show_chapter_files_list()
+        folder_index_registry.watch_folder(self, folder_index)
+
+    def update_files_lists_from_folder_index(self):
+        files_entries = self.folder_index.get_files_entries(
+            extensions=self.chapter_extensions_comboBox.currentData())
+        self.files_names_list = [file_entry.name for file_entry in files_entries]
+        self.files_names_absolute_list = [file_entry.absolute_path for file_entry in files_entries]
+
+    def is_ready_for_folder_changes(self):
+        return not self.folder_scan_status.is_scanning()
+
+    def apply_folder_changes(self, folder_changes):
+        # the lists are changed in place, they are the same lists the matching table and the swaps use
+        chapter_table = self.chapter_match_layout.chapter_table
+        rows_updates = update_files_names_list(self.files_names_list, folder_changes,
+                                               extensions=self.chapter_extensions_comboBox.currentData())
+        for row_update_type, row_index, file_entry in rows_updates:
+            if row_update_type == FILE_ROW_REMOVED:
+                self.files_names_absolute_list.pop(row_index)
+                chapter_table.remove_file_row(row_index)
+            elif row_update_type == FILE_ROW_INSERTED:
+                self.files_names_absolute_list.insert(row_index, file_entry.absolute_path)
+                chapter_table.insert_file_row(row_index=row_index, file_name=file_entry.name)
+            else:
+                self.files_names_absolute_list[row_index] = file_entry.absolute_path
+                chapter_table.update_file_row(row_index=row_index, file_name=file_entry.name)
+        if len(rows_updates) > 0:
+            self.update_other_classes_variables()
+        self.chapter_extensions_comboBox.update_extensions_counts()
+
+    def folder_scan_failed(self, error_message):
+        invalid_path_dialog = InvalidPathDialog()
+        invalid_path_dialog.execute()
+        self.chapter_source_lineEdit.setText(self.folder_path)
+
+    def folder_scan_canceled(self):
+        self.chapter_source_lineEdit.setText(self.folder_path)
 
     def check_extension_changes(self, new_extensions):
         if self.current_chapter_extensions != new_extensions:
             self.current_chapter_extensions = new_extensions
-            self.update_files_lists(self.folder_path)
-            self.show_chapter_files_list()
-
-    def get_files_list(self, folder_path):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, folder_path)
-        current_extensions = self.chapter_extensions_comboBox.currentData()
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            if os.path.getsize(temp_files_names_absolute[i]) == 0:
-                continue
-            for j in range(len(current_extensions)):
-                temp_file_extension_start_index = temp_files_names[i].rfind(".")
-                if temp_file_extension_start_index == -1:
-                    continue
-                temp_file_extension = temp_files_names[i][temp_file_extension_start_index + 1:]
-                if temp_file_extension.lower() == current_extensions[j].lower():
-                    result.append(temp_files_names[i])
-                    break
-        return result
+            if self.folder_index is not None:
+                self.update_files_lists_from_folder_index()
+                self.show_chapter_files_list()
 
     def show_chapter_files_list(self):
         self.update_other_classes_variables()
@@ -143,6 +170,7 @@ class ChapterSelectionSetting(GlobalSetting):
         self.chapter_source_lineEdit.set_current_folder_path(self.folder_path)
         self.chapter_extensions_comboBox.set_current_folder_path(self.folder_path)
         self.chapter_extensions_comboBox.set_current_files_list(self.files_names_list)
+        self.chapter_extensions_comboBox.set_folder_index(self.folder_index)
 
     def change_global_chapter_list(self):
         GlobalSetting.CHAPTER_FILES_LIST = self.files_names_list
@@ -156,6 +184,9 @@ class ChapterSelectionSetting(GlobalSetting):
         if on:
             self.show_video_files_list()
         else:
+            self.folder_scan_status.cancel_scan()
+            folder_index_registry.stop_watching(self)
+            self.folder_index = None
             self.chapter_source_lineEdit.setText("")
             self.chapter_match_layout.clear_tables()
             self.folder_path = ""
@@ -1,50 +1,46 @@
 from PySide2.QtGui import Qt
-from PySide2.QtWidgets import QHeaderView, QTableWidgetItem, QAbstractItemView
+from PySide2.QtWidgets import QHeaderView, QAbstractItemView
 
 from packages.Startup.InitializeScreenResolution import screen_size
 from packages.Tabs.GlobalSetting import GlobalSetting
 from packages.Widgets.TableFixedHeader import TableFixedHeaderWidget
-from packages.Widgets.TableWidget import TableWidget
+from packages.Widgets.TableView import TableView
 
 
 class ChapterMatchingTable(TableFixedHeaderWidget):
     def __init__(self):
-        super().__init__(primarytable=TableWidget(), headername="Chapter Name")
-        self.current_files_list = []
+        super().__init__(primarytable=TableView(), headername="Chapter Name", name_prefix=" ")
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.horizontalHeader().setHighlightSections(False)
         self.table.verticalScrollBar().setSingleStep(1)
-        self.table.setRowCount(0)
         self.table.verticalHeader().setDefaultSectionSize(screen_size.height() // 27)
+        self.table.verticalHeader().setDefaultAlignment(Qt.AlignCenter)  # rows are numbered by the header
 
     def clear_table(self):
-        self.table.setRowCount(0)
+        self.reset_rows_width()
+        self.files_model.clear_files()
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
     def show_files(self):
-        files_list = GlobalSetting.CHAPTER_FILES_LIST
-        self.table.setRowCount(len(files_list))
+        self.reset_rows_width()
+        self.files_model.show_files(files_names_list=GlobalSetting.CHAPTER_FILES_LIST)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        for i in range(len(files_list)):
-            item = QTableWidgetItem(" " + files_list[i])
-            self.table.setItem(i, 0, item)
-            item = QTableWidgetItem(str(i + 1))
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setVerticalHeaderItem(i, item)
-        self.current_files_list = files_list[:]  # for copy the rel elements not refrences
 
     def show_files_after_swapping(self):
-        files_list = GlobalSetting.CHAPTER_FILES_LIST
-        for i in range(len(files_list)):
-            if files_list[i] != self.current_files_list[i]:
-                item = QTableWidgetItem(" " + files_list[i])
-                self.table.setItem(i, 0, item)
-                item = QTableWidgetItem(str(i + 1))
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table.setVerticalHeaderItem(i, item)
-                self.current_files_list[i] = files_list[i]
+        self.files_model.show_files_after_swapping(files_names_list=GlobalSetting.CHAPTER_FILES_LIST)
+
+    def insert_file_row(self, row_index, file_name):
+        self.files_model.insert_file_row(row_index=row_index, file_name=file_name)
+        self.measure_inserted_row(row_index)
+
+    def update_file_row(self, row_index, file_name):
+        self.files_model.update_file_row(row_index=row_index, file_name=file_name)
+
+    def remove_file_row(self, row_index):
+        self.files_model.remove_file_row(row_index)
+        self.forget_removed_row(row_index)
 
     def clear_selection(self):
         self.table.clearSelection()
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+# one file found by the folder scanner, the size and modification time are read once during the scan
+@dataclass(frozen=True)
+class FileEntry:
+    name: str
+    absolute_path: str
+    extension: str
+    size: int
+    modification_time_ns: int
@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+
+
+# what changed in a watched folder since the last time its index was updated
+@dataclass(frozen=True)
+class FolderChanges:
+    added: list = field(default_factory=list)  # type: list[FileEntry]
+    removed: list = field(default_factory=list)  # type: list[FileEntry]
+    renamed: list = field(default_factory=list)  # type: list[tuple[FileEntry, FileEntry]]
+    modified: list = field(default_factory=list)  # type: list[FileEntry]
+    # subfolders of a folder scanned with its subfolders, relative to it
+    added_folders: list = field(default_factory=list)  # type: list[str]
+    removed_folders: list = field(default_factory=list)  # type: list[str]
+
+    def is_empty(self):
+        return len(self.added) == 0 and len(self.removed) == 0 and len(self.renamed) == 0 and \
+               len(self.modified) == 0 and len(self.added_folders) == 0 and len(self.removed_folders) == 0
@@ -0,0 +1,18 @@
+from PySide2.QtCore import QObject, Signal
+
+from packages.Tabs.FolderIndex import FolderIndex
+
+
+# reads the changes of the watched folders on its own thread, the folder key and the index go with every
+# signal so the registry can tell if the folder was forgotten while its changes were read
+class FolderChangesWorker(QObject):
+    changes_read_signal = Signal(object, object, object)  # folder key, folder index, folder changes
+    read_failed_signal = Signal(object, object)  # folder key, folder index
+
+    def read_changes(self, folder_key, folder_index: FolderIndex, changed_folders):
+        try:
+            folder_changes = folder_index.read_changes(changed_folders)
+        except OSError:
+            self.read_failed_signal.emit(folder_key, folder_index)
+            return
+        self.changes_read_signal.emit(folder_key, folder_index, folder_changes)
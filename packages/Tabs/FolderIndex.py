@@ -0,0 +1,295 @@
+import heapq
+import os
+import time
+from operator import itemgetter
+
+from packages.Tabs.FileEntry import FileEntry
+from packages.Tabs.FolderChanges import FolderChanges
+from packages.Tabs.FolderScanner import list_files_names, read_file_entry, filter_files_entries, \
+    is_file_entry_included, get_lower_extensions, read_folder_files_names
+from packages.Tabs.GlobalSetting import get_sorted_insert_index, get_sorted_index
+from packages.Tabs.SortedFilesNames import SortedFilesNames
+
+# files changed this recently may still be copied, they are checked again on the next change
+PENDING_FILE_SECONDS = 10
+FILE_ROW_REMOVED = "Removed"
+FILE_ROW_INSERTED = "Inserted"
+FILE_ROW_UPDATED = "Updated"
+MERGE_FILES_NAMES_MAX_RATIO = 0.25
+
+
+def merge_files_names(sorted_files_names_list):
+    # the buckets are already sorted, merging them by their keys keeps the order without sorting again
+    if len(sorted_files_names_list) == 1:
+        return iter(sorted_files_names_list[0])
+    return map(itemgetter(1), heapq.merge(*[zip(sorted_files_names.sort_keys, sorted_files_names.names)
+                                            for sorted_files_names in sorted_files_names_list],
+                                          key=itemgetter(0)))
+
+
+def is_file_entry_pending(file_entry: FileEntry):
+    return file_entry.size == 0 or \
+           time.time_ns() - file_entry.modification_time_ns < PENDING_FILE_SECONDS * 1_000_000_000
+
+
+def get_file_stat_key(file_entry: FileEntry):
+    return file_entry.size, file_entry.modification_time_ns
+
+
+def find_renamed_files(removed, added):
+    # a rename keeps the size and the modification time, a removed and an added file with the same ones
+    # are only taken for the same file when no other removed or added file has them too
+    removed_by_stat = {}  # type: dict[tuple[int, int], list[FileEntry]]
+    for file_entry in removed:
+        removed_by_stat.setdefault(get_file_stat_key(file_entry), []).append(file_entry)
+    added_by_stat = {}  # type: dict[tuple[int, int], list[FileEntry]]
+    for file_entry in added:
+        added_by_stat.setdefault(get_file_stat_key(file_entry), []).append(file_entry)
+    renamed = []
+    for stat_key, added_files_entries in added_by_stat.items():
+        removed_files_entries = removed_by_stat.get(stat_key, [])
+        if len(added_files_entries) == 1 and len(removed_files_entries) == 1:
+            renamed.append((removed_files_entries[0], added_files_entries[0]))
+    return renamed
+
+
+# every file of one folder sorted like windows, kept up to date with the changes read from the folder
+# so a change costs a listing of the names and a stat of the new files instead of a whole scan,
+# with its subfolders only the folders that changed are listed again
+# the names are also kept in one bucket per extension, so a tab that shows one extension never goes
+# through the other files, the buckets share the sort keys of the whole folder
+class FolderIndex:
+    def __init__(self, folder_path, files_entries, recursive=False, subfolders_relative_paths=None):
+        self.folder_path = folder_path
+        self.recursive = recursive
+        self.subfolders_relative_paths = set(subfolders_relative_paths or [])
+        self.files_entries_by_name = {file_entry.name: file_entry for file_entry in files_entries}
+        self.files_names = SortedFilesNames(self.files_entries_by_name.keys())
+        self.files_entries = [self.files_entries_by_name[file_name] for file_name in self.files_names]
+        self.files_names_by_extension = {}  # type: dict[str, SortedFilesNames]
+        self.files_names_by_folder = {}  # type: dict[str, set[str]]
+        for file_entry in self.files_entries:
+            self.files_names_by_folder.setdefault(os.path.dirname(file_entry.name), set()).add(file_entry.name)
+        for file_entry, sort_key in zip(self.files_entries, self.files_names.sort_keys):
+            extension = file_entry.extension.lower()
+            if extension not in self.files_names_by_extension:
+                self.files_names_by_extension[extension] = SortedFilesNames()
+            self.files_names_by_extension[extension].append(file_entry.name, sort_key)
+        self.pending_files_names = set(file_entry.name for file_entry in files_entries
+                                       if is_file_entry_pending(file_entry))
+
+    def get_files_entries(self, extensions=None):
+        lower_extensions = get_lower_extensions(extensions)
+        if lower_extensions is None:
+            return filter_files_entries(self.files_entries)
+        extensions_files_names = [self.files_names_by_extension[extension] for extension in lower_extensions
+                                  if extension in self.files_names_by_extension]
+        # a merge costs a few times more per name than a filter of the whole folder does, it is only
+        # worth it when the selected extensions are a small part of the folder
+        if len(extensions_files_names) > 1 and MERGE_FILES_NAMES_MAX_RATIO * len(self.files_names) < \
+                sum(len(extension_files_names) for extension_files_names in extensions_files_names):
+            return filter_files_entries(self.files_entries, lower_extensions)
+        return [file_entry for file_entry in map(self.files_entries_by_name.__getitem__,
+                                                 merge_files_names(extensions_files_names))
+                if is_file_entry_included(file_entry)]
+
+    def get_extensions_counts(self):
+        # number of files every extension would list, empty files are not listed so they are not counted
+        extensions_counts = {}
+        for extension, extension_files_names in self.files_names_by_extension.items():
+            extensions_counts[extension] = sum(1 for file_name in extension_files_names
+                                               if self.files_entries_by_name[file_name].size > 0)
+        return extensions_counts
+
+    def has_pending_files(self):
+        return len(self.pending_files_names) > 0
+
+    def read_changes(self, changed_folders=None):
+        # runs on the folder changes thread, the index is only changed by apply_changes on the gui thread
+        # and never while its changes are read
+        # changed_folders are the folders to list again relative to the top one, None lists the whole folder
+        if changed_folders is None or not self.recursive:
+            current_subfolders_relative_paths = []
+            current_files_names = set(list_files_names(self.folder_path, recursive=self.recursive,
+                                                       subfolders_relative_paths=current_subfolders_relative_paths))
+            removed_names = self.files_entries_by_name.keys() - current_files_names
+            added_names = current_files_names - self.files_entries_by_name.keys()
+            added_folders = set(current_subfolders_relative_paths) - self.subfolders_relative_paths
+            removed_folders = self.subfolders_relative_paths - set(current_subfolders_relative_paths)
+        else:
+            removed_names, added_names, added_folders, removed_folders = self.read_folders_changes(changed_folders)
+        removed = [self.files_entries_by_name[file_name] for file_name in removed_names]
+        added = []
+        for file_name in added_names:
+            file_entry = read_file_entry(self.folder_path, file_name)
+            if file_entry is not None:
+                added.append(file_entry)
+        modified = []
+        for file_name in self.pending_files_names - removed_names:
+            file_entry = read_file_entry(self.folder_path, file_name)
+            if file_entry is not None and get_file_stat_key(file_entry) != \
+                    get_file_stat_key(self.files_entries_by_name[file_name]):
+                modified.append(file_entry)
+        renamed = find_renamed_files(removed, added)
+        renamed_names = set()
+        for old_file_entry, new_file_entry in renamed:
+            renamed_names.add(old_file_entry.name)
+            renamed_names.add(new_file_entry.name)
+        return FolderChanges(added=[file_entry for file_entry in added if file_entry.name not in renamed_names],
+                             removed=[file_entry for file_entry in removed if file_entry.name not in renamed_names],
+                             renamed=renamed, modified=modified,
+                             added_folders=list(added_folders), removed_folders=list(removed_folders))
+
+    def get_child_subfolders(self, relative_folder_path):
+        return set(subfolder_relative_path for subfolder_relative_path in self.subfolders_relative_paths
+                   if os.path.dirname(subfolder_relative_path) == relative_folder_path)
+
+    def get_subfolders_tree(self, relative_folder_path):
+        subfolder_prefix = os.path.join(relative_folder_path, "")
+        return set(subfolder_relative_path for subfolder_relative_path in self.subfolders_relative_paths
+                   if subfolder_relative_path == relative_folder_path or
+                   subfolder_relative_path.startswith(subfolder_prefix))
+
+    def read_folders_changes(self, changed_folders):
+        # every changed folder is listed alone, a new subfolder is walked with its own subfolders
+        # and a subfolder that is gone takes all the files and folders under it
+        removed_names = set()
+        added_names = set()
+        added_folders = set()
+        removed_folders = set()
+        for relative_folder_path in changed_folders:
+            if relative_folder_path != "" and (relative_folder_path not in self.subfolders_relative_paths or
+                                               relative_folder_path in removed_folders):
+                continue
+            try:
+                files_names, subfolders_relative_paths = read_folder_files_names(self.folder_path,
+                                                                                 relative_folder_path)
+            except OSError:
+                if relative_folder_path == "":
+                    raise
+                continue  # gone with its folder, the listing of its parent removes it
+            known_files_names = self.files_names_by_folder.get(relative_folder_path, set())
+            removed_names.update(known_files_names - set(files_names))
+            added_names.update(set(files_names) - known_files_names)
+            known_subfolders = self.get_child_subfolders(relative_folder_path)
+            for removed_subfolder in known_subfolders - set(subfolders_relative_paths):
+                for subfolder_relative_path in self.get_subfolders_tree(removed_subfolder):
+                    removed_folders.add(subfolder_relative_path)
+                    removed_names.update(self.files_names_by_folder.get(subfolder_relative_path, set()))
+            folders_to_read = list(set(subfolders_relative_paths) - known_subfolders)
+            while len(folders_to_read) > 0:
+                new_subfolder = folders_to_read.pop()
+                try:
+                    files_names, subfolders_relative_paths = read_folder_files_names(self.folder_path,
+                                                                                     new_subfolder)
+                except OSError:
+                    continue
+                added_folders.add(new_subfolder)
+                added_names.update(files_names)
+                folders_to_read.extend(subfolders_relative_paths)
+        return removed_names, added_names, added_folders, removed_folders
+
+    def apply_changes(self, folder_changes: FolderChanges):
+        self.subfolders_relative_paths.difference_update(folder_changes.removed_folders)
+        self.subfolders_relative_paths.update(folder_changes.added_folders)
+        for file_entry in folder_changes.removed:
+            self.remove_file_entry(file_entry.name)
+        for old_file_entry, new_file_entry in folder_changes.renamed:
+            self.remove_file_entry(old_file_entry.name)
+            self.insert_file_entry(new_file_entry)
+        for file_entry in folder_changes.added:
+            self.insert_file_entry(file_entry)
+        for file_entry in folder_changes.modified:
+            self.files_entries[self.get_file_index(file_entry.name)] = file_entry
+            self.files_entries_by_name[file_entry.name] = file_entry
+            if not is_file_entry_pending(file_entry):
+                self.pending_files_names.discard(file_entry.name)
+
+    def get_file_index(self, file_name):
+        return self.files_names.index(file_name)
+
+    def remove_file_entry(self, file_name):
+        file_entry = self.files_entries.pop(self.files_names.remove(file_name))
+        self.files_entries_by_name.pop(file_name)
+        self.pending_files_names.discard(file_name)
+        folder_files_names = self.files_names_by_folder[os.path.dirname(file_name)]
+        folder_files_names.discard(file_name)
+        if len(folder_files_names) == 0:
+            self.files_names_by_folder.pop(os.path.dirname(file_name))
+        extension = file_entry.extension.lower()
+        extension_files_names = self.files_names_by_extension[extension]
+        extension_files_names.remove(file_name)
+        if len(extension_files_names) == 0:
+            self.files_names_by_extension.pop(extension)
+
+    def insert_file_entry(self, file_entry: FileEntry):
+        self.files_entries.insert(self.files_names.insert(file_entry.name), file_entry)
+        self.files_entries_by_name[file_entry.name] = file_entry
+        self.files_names_by_folder.setdefault(os.path.dirname(file_entry.name), set()).add(file_entry.name)
+        extension = file_entry.extension.lower()
+        if extension not in self.files_names_by_extension:
+            self.files_names_by_extension[extension] = SortedFilesNames()
+        self.files_names_by_extension[extension].insert(file_entry.name)
+        if is_file_entry_pending(file_entry):
+            self.pending_files_names.add(file_entry.name)
+
+
+# applies the changes of a folder to a list of names shown in a tab and returns the rows to change
+# in the same order, so the tab can update its other lists and its table one row at a time
+def update_files_names_list(files_names_list, folder_changes: FolderChanges, extensions=None):
+    lower_extensions = get_lower_extensions(extensions)
+    rows_updates = []
+
+    def find_row(file_name):
+        # a binary search, the names are only gone through one by one when the list was reordered,
+        # like after the files were swapped
+        row_index = get_sorted_index(files_names_list, file_name)
+        if row_index != -1:
+            return row_index
+        try:
+            return files_names_list.index(file_name)
+        except ValueError:
+            return -1
+
+    def find_listed_row(old_file_entry):
+        # a file the list did not show is not searched for
+        if not is_file_entry_included(old_file_entry, lower_extensions):
+            return -1
+        return find_row(old_file_entry.name)
+
+    def remove_row(row_index, file_entry):
+        files_names_list.pop(row_index)
+        rows_updates.append((FILE_ROW_REMOVED, row_index, file_entry))
+
+    def insert_row(file_entry):
+        if is_file_entry_included(file_entry, lower_extensions):
+            row_index = get_sorted_insert_index(files_names_list, file_entry.name)
+            files_names_list.insert(row_index, file_entry.name)
+            rows_updates.append((FILE_ROW_INSERTED, row_index, file_entry))
+
+    for file_entry in folder_changes.removed:
+        row_index = find_listed_row(file_entry)
+        if row_index != -1:
+            remove_row(row_index, file_entry)
+    # a renamed file keeps its row so it stays matched with the same video
+    for old_file_entry, new_file_entry in folder_changes.renamed:
+        row_index = find_listed_row(old_file_entry)
+        if row_index != -1 and is_file_entry_included(new_file_entry, lower_extensions):
+            files_names_list[row_index] = new_file_entry.name
+            rows_updates.append((FILE_ROW_UPDATED, row_index, new_file_entry))
+        else:
+            if row_index != -1:
+                remove_row(row_index, old_file_entry)
+            insert_row(new_file_entry)
+    # an added file was not in the folder so it has no row yet
+    for file_entry in folder_changes.added:
+        insert_row(file_entry)
+    for file_entry in folder_changes.modified:
+        row_index = find_row(file_entry.name)
+        if row_index == -1:
+            insert_row(file_entry)
+        elif is_file_entry_included(file_entry, lower_extensions):
+            rows_updates.append((FILE_ROW_UPDATED, row_index, file_entry))
+        else:
+            remove_row(row_index, file_entry)
+    return rows_updates
@@ -0,0 +1,178 @@
+import os
+from pathlib import Path
+
+from PySide2.QtCore import QObject, QThread, Signal, QCoreApplication
+
+from packages.Tabs.FolderChanges import FolderChanges
+from packages.Tabs.FolderChangesWorker import FolderChangesWorker
+from packages.Tabs.FolderIndex import FolderIndex
+from packages.Tabs.FolderWatcher import FolderWatcher
+from packages.Tabs.GlobalSetting import GlobalSetting
+
+
+def get_folder_key(folder_path, recursive=False):
+    # a folder scanned with its subfolders has other files than the same folder alone
+    return os.path.normcase(str(Path(folder_path))), recursive
+
+
+# one index and one watcher per folder for the whole program, the tabs that show files of the same folder
+# share them, so the folder is scanned once and every change is read once and given to all of these tabs
+# a tab that uses the registry has is_ready_for_folder_changes() and apply_folder_changes(folder_changes)
+# the changes are read on one thread for all the folders, only their result is applied on the gui thread
+class FolderIndexRegistry(QObject):
+    read_folder_changes_signal = Signal(object, object, object)  # folder key, folder index, changed folders
+
+    def __init__(self):
+        super().__init__()
+        self.folders_indexes = {}  # type: dict[str, FolderIndex]
+        self.folders_watchers = {}  # type: dict[str, FolderWatcher]
+        self.folders_tabs = {}  # type: dict[str, list]
+        self.reading_folders = set()
+        self.folders_to_read_again = set()
+        self.folders_to_list_whole = set()
+        self.refreshed_callbacks = {}  # type: dict[str, list]
+        self.reading_refreshed_callbacks = {}  # type: dict[str, list]
+        self.folder_changes_thread = None  # type: QThread
+        self.folder_changes_worker = None  # type: FolderChangesWorker
+
+    def setup_folder_changes_thread(self):
+        self.folder_changes_worker = FolderChangesWorker()
+        self.folder_changes_thread = QThread()
+        self.folder_changes_worker.moveToThread(self.folder_changes_thread)
+        self.read_folder_changes_signal.connect(self.folder_changes_worker.read_changes)
+        self.folder_changes_worker.changes_read_signal.connect(self.folder_changes_read)
+        self.folder_changes_worker.read_failed_signal.connect(self.folder_changes_read_failed)
+        QCoreApplication.instance().aboutToQuit.connect(self.stop_folder_changes_thread)
+        self.folder_changes_thread.start()
+
+    def stop_folder_changes_thread(self):
+        self.folder_changes_thread.quit()
+        self.folder_changes_thread.wait()
+
+    def get_folder_index(self, folder_path, recursive=False):
+        return self.folders_indexes.get(get_folder_key(folder_path, recursive), None)
+
+    def get_shared_folder_index(self, folder_index: FolderIndex):
+        # a folder scanned by two tabs at the same time keeps the index that is watched first
+        shared_folder_index = self.get_folder_index(folder_index.folder_path, folder_index.recursive)
+        if shared_folder_index is None:
+            return folder_index
+        return shared_folder_index
+
+    def watch_folder(self, tab, folder_index: FolderIndex):
+        self.stop_watching(tab)
+        folder_key = get_folder_key(folder_index.folder_path, folder_index.recursive)
+        self.folders_indexes.setdefault(folder_key, folder_index)
+        self.folders_tabs.setdefault(folder_key, []).append(tab)
+        if folder_key not in self.folders_watchers:
+            if self.folder_changes_thread is None:
+                self.setup_folder_changes_thread()
+            folder_watcher = FolderWatcher()
+            folder_watcher.folder_changed_signal.connect(lambda: self.folder_changed(folder_key))
+            folder_watcher.watch_folder(folder_index.folder_path)
+            folder_watcher.watch_subfolders(folder_index.folder_path, folder_index.subfolders_relative_paths)
+            self.folders_watchers[folder_key] = folder_watcher
+
+    def stop_watching(self, tab):
+        # a folder that no tab shows anymore is forgotten, it would not be kept up to date without its watcher
+        for folder_key, folder_tabs in list(self.folders_tabs.items()):
+            if tab in folder_tabs:
+                folder_tabs.remove(tab)
+                if len(folder_tabs) == 0:
+                    self.forget_folder(folder_key)
+
+    def forget_folder(self, folder_key):
+        self.folders_tabs.pop(folder_key, None)
+        self.folders_indexes.pop(folder_key, None)
+        self.reading_folders.discard(folder_key)
+        self.folders_to_read_again.discard(folder_key)
+        self.folders_to_list_whole.discard(folder_key)
+        folder_watcher = self.folders_watchers.pop(folder_key, None)
+        if folder_watcher is not None:
+            folder_watcher.stop_watching()
+            folder_watcher.deleteLater()
+        self.call_refreshed_callbacks(self.reading_refreshed_callbacks.pop(folder_key, []) +
+                                      self.refreshed_callbacks.pop(folder_key, []))
+
+    def refresh_folder(self, folder_path, recursive=False, refreshed_callback=None):
+        # the whole folder is listed again, refreshed_callback is called once its index is up to date
+        # or once it is forgotten because it cannot be read anymore
+        folder_key = get_folder_key(folder_path, recursive)
+        if folder_key not in self.folders_watchers:
+            self.call_refreshed_callbacks([refreshed_callback])
+            return
+        self.refreshed_callbacks.setdefault(folder_key, []).append(refreshed_callback)
+        self.folders_to_list_whole.add(folder_key)
+        self.folder_changed(folder_key)
+
+    @staticmethod
+    def call_refreshed_callbacks(refreshed_callbacks):
+        for refreshed_callback in refreshed_callbacks:
+            if refreshed_callback is not None:
+                refreshed_callback()
+
+    def is_folder_ready_for_changes(self, folder_key):
+        # the job queue was made from the current lists, the changes wait until it is empty
+        return GlobalSetting.JOB_QUEUE_EMPTY and \
+            all(tab.is_ready_for_folder_changes() for tab in self.folders_tabs[folder_key])
+
+    def get_changed_folders(self, folder_key, folder_index: FolderIndex):
+        changed_folders_paths = self.folders_watchers[folder_key].take_changed_folders_paths()
+        if folder_key in self.folders_to_list_whole:
+            self.folders_to_list_whole.discard(folder_key)
+            return None
+        changed_folders = set()
+        for changed_folder_path in changed_folders_paths:
+            relative_folder_path = os.path.relpath(changed_folder_path, folder_index.folder_path)
+            changed_folders.add("" if relative_folder_path == os.curdir else relative_folder_path)
+        return changed_folders
+
+    def folder_changed(self, folder_key):
+        folder_index = self.folders_indexes.get(folder_key, None)
+        if folder_index is None:
+            return
+        if folder_key in self.reading_folders:
+            self.folders_to_read_again.add(folder_key)
+            return
+        if not self.is_folder_ready_for_changes(folder_key):
+            self.folders_watchers[folder_key].check_again_later()
+            self.call_refreshed_callbacks(self.refreshed_callbacks.pop(folder_key, []))
+            return
+        self.reading_folders.add(folder_key)
+        self.reading_refreshed_callbacks[folder_key] = self.refreshed_callbacks.pop(folder_key, [])
+        self.read_folder_changes_signal.emit(folder_key, folder_index,
+                                             self.get_changed_folders(folder_key, folder_index))
+
+    def finish_reading_folder(self, folder_key):
+        self.reading_folders.discard(folder_key)
+        self.call_refreshed_callbacks(self.reading_refreshed_callbacks.pop(folder_key, []))
+        if folder_key in self.folders_to_read_again:
+            self.folders_to_read_again.discard(folder_key)
+            self.folder_changed(folder_key)
+
+    def folder_changes_read_failed(self, folder_key, folder_index: FolderIndex):
+        if self.folders_indexes.get(folder_key, None) is folder_index:
+            self.forget_folder(folder_key)
+
+    def folder_changes_read(self, folder_key, folder_index: FolderIndex, folder_changes: FolderChanges):
+        if self.folders_indexes.get(folder_key, None) is not folder_index:
+            return  # forgotten while its changes were read
+        folder_watcher = self.folders_watchers[folder_key]
+        if not self.is_folder_ready_for_changes(folder_key):
+            # these changes are dropped, the folder is listed whole once it is ready
+            self.folders_to_list_whole.add(folder_key)
+            folder_watcher.check_again_later()
+            self.finish_reading_folder(folder_key)
+            return
+        folder_index.apply_changes(folder_changes)
+        folder_watcher.stop_watching_subfolders(folder_index.folder_path, folder_changes.removed_folders)
+        folder_watcher.watch_subfolders(folder_index.folder_path, folder_changes.added_folders)
+        if not folder_changes.is_empty():
+            for tab in self.folders_tabs[folder_key][:]:
+                tab.apply_folder_changes(folder_changes)
+        if folder_index.has_pending_files():
+            folder_watcher.check_again_later()
+        self.finish_reading_folder(folder_key)
+
+
+folder_index_registry = FolderIndexRegistry()
@@ -0,0 +1,46 @@
+from PySide2.QtCore import QObject, Signal
+
+from packages.Tabs.FolderIndex import FolderIndex
+from packages.Tabs.FolderScanner import scan_folder_in_chunks, scan_folder_tree_in_chunks
+
+
+# lists and sorts a folder on its own thread, every signal carries the scan id
+# so the results of a scan that got replaced by a newer one can be ignored
+class FolderScanWorker(QObject):
+    files_found_signal = Signal(int, int)  # scan id, number of files found so far
+    finished_signal = Signal(int, object)  # scan id, folder index
+    failed_signal = Signal(int, str)  # scan id, error message
+    canceled_signal = Signal(int)
+
+    def __init__(self, scan_id, folder_path, recursive=False):
+        super().__init__()
+        self.scan_id = scan_id
+        self.folder_path = folder_path
+        self.recursive = recursive
+        self.cancel = False
+
+    def run(self):
+        files_entries = []
+        subfolders_relative_paths = []
+        if self.recursive:
+            files_entries_chunks = scan_folder_tree_in_chunks(self.folder_path,
+                                                              subfolders_relative_paths=subfolders_relative_paths)
+        else:
+            files_entries_chunks = scan_folder_in_chunks(self.folder_path)
+        try:
+            for files_entries_chunk in files_entries_chunks:
+                if self.cancel:
+                    files_entries_chunks.close()
+                    self.canceled_signal.emit(self.scan_id)
+                    return
+                files_entries.extend(files_entries_chunk)
+                self.files_found_signal.emit(self.scan_id, len(files_entries))
+            folder_index = FolderIndex(folder_path=self.folder_path, files_entries=files_entries,
+                                       recursive=self.recursive, subfolders_relative_paths=subfolders_relative_paths)
+        except OSError as error:
+            self.failed_signal.emit(self.scan_id, str(error))
+            return
+        if self.cancel:
+            self.canceled_signal.emit(self.scan_id)
+            return
+        self.finished_signal.emit(self.scan_id, folder_index)
@@ -0,0 +1,207 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+
+from packages.Tabs.FileEntry import FileEntry
+from packages.Tabs.GlobalSetting import sort_names_like_windows
+
+
+def get_file_extension(file_name):
+    file_extension_start_index = file_name.rfind(".")
+    if file_extension_start_index == -1:
+        return ""
+    return file_name[file_extension_start_index + 1:]
+
+
+FOLDER_SCAN_CHUNK_SIZE = 256
+FOLDER_TREE_SCAN_THREADS = 8
+
+
+# reads the folder in one pass, the type of every entry comes with the directory listing and the size and
+# modification time come from the same stat, so nothing has to stat the files again later
+# the entries come in chunks in the order of the listing so a slow folder can report its progress and be canceled
+def scan_folder_in_chunks(folder_path, chunk_size=FOLDER_SCAN_CHUNK_SIZE):
+    files_entries_chunk = []
+    normalized_folder_path = str(Path(folder_path))
+    with os.scandir(folder_path) as folder_entries:
+        for folder_entry in folder_entries:
+            try:
+                if folder_entry.is_dir():
+                    continue
+                file_stat = folder_entry.stat()
+            except OSError:
+                continue
+            files_entries_chunk.append(FileEntry(
+                name=folder_entry.name,
+                absolute_path=os.path.join(normalized_folder_path, folder_entry.name),
+                extension=get_file_extension(folder_entry.name),
+                size=file_stat.st_size,
+                modification_time_ns=file_stat.st_mtime_ns))
+            if len(files_entries_chunk) >= chunk_size:
+                yield files_entries_chunk
+                files_entries_chunk = []
+    if len(files_entries_chunk) > 0:
+        yield files_entries_chunk
+
+
+def read_folder_files_entries(folder_path, relative_folder_path):
+    # one folder of a tree, the names of its files are relative to the top folder
+    files_entries = []
+    subfolders_relative_paths = []
+    with os.scandir(os.path.join(folder_path, relative_folder_path)) as folder_entries:
+        for folder_entry in folder_entries:
+            relative_file_path = os.path.join(relative_folder_path, folder_entry.name)
+            try:
+                # linked folders are not followed so a link to a parent folder can not make the walk endless
+                if folder_entry.is_dir(follow_symlinks=False):
+                    subfolders_relative_paths.append(relative_file_path)
+                    continue
+                if folder_entry.is_dir():
+                    continue
+                file_stat = folder_entry.stat()
+            except OSError:
+                continue
+            files_entries.append(FileEntry(
+                name=relative_file_path,
+                absolute_path=os.path.join(folder_path, relative_file_path),
+                extension=get_file_extension(folder_entry.name),
+                size=file_stat.st_size,
+                modification_time_ns=file_stat.st_mtime_ns))
+    return files_entries, subfolders_relative_paths
+
+
+def read_folder_files_names(folder_path, relative_folder_path):
+    files_names = []
+    subfolders_relative_paths = []
+    with os.scandir(os.path.join(folder_path, relative_folder_path)) as folder_entries:
+        for folder_entry in folder_entries:
+            relative_file_path = os.path.join(relative_folder_path, folder_entry.name)
+            try:
+                if folder_entry.is_dir(follow_symlinks=False):
+                    subfolders_relative_paths.append(relative_file_path)
+                    continue
+                if folder_entry.is_dir():
+                    continue
+            except OSError:
+                continue
+            files_names.append(relative_file_path)
+    return files_names, subfolders_relative_paths
+
+
+def walk_folder_tree(folder_path, read_folder_function, subfolders_relative_paths=None,
+                     max_threads=FOLDER_TREE_SCAN_THREADS):
+    # the folders of a tree are read on a bounded thread pool, a folder found in one listing is read
+    # while the others are still listed, the files of every folder come as soon as its listing is done
+    # a subfolder that can not be read is skipped, only the top folder has to be readable
+    normalized_folder_path = str(Path(folder_path))
+    top_folder_files, top_subfolders = read_folder_function(normalized_folder_path, "")
+    yield top_folder_files
+    executor = ThreadPoolExecutor(max_workers=max_threads)
+    running_reads = set()
+
+    def read_subfolders(relative_paths):
+        for relative_path in relative_paths:
+            if subfolders_relative_paths is not None:
+                subfolders_relative_paths.append(relative_path)
+            running_reads.add(executor.submit(read_folder_function, normalized_folder_path, relative_path))
+
+    try:
+        read_subfolders(top_subfolders)
+        while len(running_reads) > 0:
+            finished_reads, _ = wait(running_reads, return_when=FIRST_COMPLETED)
+            for finished_read in finished_reads:
+                running_reads.discard(finished_read)
+                try:
+                    folder_files, subfolders = finished_read.result()
+                except OSError:
+                    continue
+                read_subfolders(subfolders)
+                yield folder_files
+    finally:
+        # a walk that is not read to its end, like a canceled scan, does not start the folders left
+        for running_read in running_reads:
+            running_read.cancel()
+        executor.shutdown(wait=True)
+
+
+def scan_folder_tree_in_chunks(folder_path, subfolders_relative_paths=None, chunk_size=FOLDER_SCAN_CHUNK_SIZE):
+    files_entries_chunk = []
+    for folder_files_entries in walk_folder_tree(folder_path, read_folder_files_entries,
+                                                 subfolders_relative_paths=subfolders_relative_paths):
+        files_entries_chunk.extend(folder_files_entries)
+        if len(files_entries_chunk) >= chunk_size:
+            yield files_entries_chunk
+            files_entries_chunk = []
+    if len(files_entries_chunk) > 0:
+        yield files_entries_chunk
+
+
+def sort_files_entries(files_entries):
+    files_entries_by_name = {file_entry.name: file_entry for file_entry in files_entries}
+    return [files_entries_by_name[file_name] for file_name in
+            sort_names_like_windows(names_list=list(files_entries_by_name))]
+
+
+def scan_folder(folder_path, recursive=False):
+    files_entries = []
+    if recursive:
+        files_entries_chunks = scan_folder_tree_in_chunks(folder_path)
+    else:
+        files_entries_chunks = scan_folder_in_chunks(folder_path)
+    for files_entries_chunk in files_entries_chunks:
+        files_entries.extend(files_entries_chunk)
+    return sort_files_entries(files_entries)
+
+
+def get_lower_extensions(extensions):
+    if extensions is None:
+        return None
+    return set(extension.lower() for extension in extensions)
+
+
+def is_file_entry_included(file_entry, lower_extensions=None):
+    # empty files are never listed, extensions are compared without case
+    if file_entry.size == 0:
+        return False
+    if lower_extensions is not None and file_entry.extension.lower() not in lower_extensions:
+        return False
+    return True
+
+
+def filter_files_entries(files_entries, extensions=None):
+    lower_extensions = get_lower_extensions(extensions)
+    return [file_entry for file_entry in files_entries if is_file_entry_included(file_entry, lower_extensions)]
+
+
+def list_files_names(folder_path, recursive=False, subfolders_relative_paths=None):
+    # names only, the listing gives the entry type without a stat
+    if recursive:
+        files_names = []
+        for folder_files_names in walk_folder_tree(folder_path, read_folder_files_names,
+                                                   subfolders_relative_paths=subfolders_relative_paths):
+            files_names.extend(folder_files_names)
+        return files_names
+    files_names = []
+    with os.scandir(folder_path) as folder_entries:
+        for folder_entry in folder_entries:
+            try:
+                if folder_entry.is_dir():
+                    continue
+            except OSError:
+                continue
+            files_names.append(folder_entry.name)
+    return files_names
+
+
+def read_file_entry(folder_path, file_name):
+    file_path = os.path.join(str(Path(folder_path)), file_name)
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    return FileEntry(name=file_name, absolute_path=file_path, extension=get_file_extension(file_name),
+                     size=file_stat.st_size, modification_time_ns=file_stat.st_mtime_ns)
+
+
+def get_files_entries(folder_path, extensions=None, recursive=False):
+    return filter_files_entries(scan_folder(folder_path, recursive=recursive), extensions)
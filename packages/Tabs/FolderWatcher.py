@@ -0,0 +1,57 @@
+import os
+
+from PySide2.QtCore import QObject, Signal, QFileSystemWatcher, QTimer
+
+# copying many files fires many notifications, they are answered once the folder is quiet for this long
+FOLDER_CHANGES_DELAY_MS = 500
+PENDING_FILES_CHECK_DELAY_MS = 2000
+
+
+class FolderWatcher(QObject):
+    folder_changed_signal = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.file_system_watcher = QFileSystemWatcher(self)
+        self.delay_timer = QTimer(self)
+        self.delay_timer.setSingleShot(True)
+        self.changed_folders_paths = set()  # type: set[str]
+        self.file_system_watcher.directoryChanged.connect(self.directory_changed)
+        self.delay_timer.timeout.connect(self.folder_changed_signal.emit)
+
+    def watch_folder(self, folder_path):
+        self.stop_watching()
+        if folder_path != "" and not folder_path.isspace():
+            self.file_system_watcher.addPath(folder_path)
+
+    def watch_subfolders(self, folder_path, subfolders_relative_paths):
+        subfolders_paths = [os.path.join(folder_path, relative_path) for relative_path in subfolders_relative_paths]
+        if len(subfolders_paths) > 0:
+            self.file_system_watcher.addPaths(subfolders_paths)
+
+    def stop_watching_subfolders(self, folder_path, subfolders_relative_paths):
+        subfolders_paths = [os.path.join(folder_path, relative_path) for relative_path in subfolders_relative_paths]
+        if len(subfolders_paths) > 0:
+            self.file_system_watcher.removePaths(subfolders_paths)
+
+    def stop_watching(self):
+        self.delay_timer.stop()
+        self.changed_folders_paths.clear()
+        watched_folders = self.file_system_watcher.directories()
+        if len(watched_folders) > 0:
+            self.file_system_watcher.removePaths(watched_folders)
+
+    def directory_changed(self, folder_path):
+        self.changed_folders_paths.add(folder_path)
+        self.delay_timer.start(FOLDER_CHANGES_DELAY_MS)
+
+    def take_changed_folders_paths(self):
+        # the folders that changed since the last call
+        changed_folders_paths = self.changed_folders_paths
+        self.changed_folders_paths = set()
+        return changed_folders_paths
+
+    def check_again_later(self):
+        # files still being copied or changes that could not be applied yet
+        if not self.delay_timer.isActive():
+            self.delay_timer.start(PENDING_FILES_CHECK_DELAY_MS)
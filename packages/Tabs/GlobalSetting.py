@@ -3,15 +3,61 @@ import os
 import re
 from pathlib import Path
 
-from PySide2.QtWidgets import QWidget
-
 from packages.Startup.DefaultOptions import Default_Subtitle_Language
 
 
+NAME_NUMBERS_PATTERN = re.compile('([0-9]+)')
+PATH_SEPARATORS_PATTERN = re.compile(r'[\\/]')
+SUBFOLDER_FILE_SORT_KEY_START = chr(0x10FFFF)
+
+
+def get_name_sort_key(name):
+    # the split keeps the numbers at the odd indices, they are compared as numbers like windows does
+    name_sort_key = NAME_NUMBERS_PATTERN.split(name.lower())
+    name_sort_key[1::2] = map(int, name_sort_key[1::2])
+    return name_sort_key
+
+
+def get_windows_sort_key(name):
+    # a name can be a path relative to a scanned folder, the files of a folder come before its subfolders
+    # and every folder keeps its files sorted like windows, the key of a path starts with a text
+    # after every lower case name so it is only compared part by part with the keys of other paths
+    if "/" not in name and "\\" not in name:
+        return get_name_sort_key(name)
+    names_parts = PATH_SEPARATORS_PATTERN.split(name)
+    sort_key = [SUBFOLDER_FILE_SORT_KEY_START]
+    sort_key.extend((1, get_name_sort_key(folder_name)) for folder_name in names_parts[:-1])
+    sort_key.append((0, get_name_sort_key(names_parts[-1])))
+    return sort_key
+
+
 def sort_names_like_windows(names_list):
-    convert = lambda text: int(text) if text.isdigit() else text.lower()
-    alphanum_key = lambda key: [convert(c) for c in re.split('([0-9]+)', key)]
-    return sorted(names_list, key=alphanum_key)
+    return sorted(names_list, key=get_windows_sort_key)
+
+
+def get_sorted_insert_index(names_list, name):
+    # binary search on a list sorted like windows, only the names it visits get a sort key
+    name_sort_key = get_windows_sort_key(name)
+    low = 0
+    high = len(names_list)
+    while low < high:
+        middle = (low + high) // 2
+        if get_windows_sort_key(names_list[middle]) <= name_sort_key:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def get_sorted_index(names_list, name):
+    # the row of a name in a list sorted like windows, -1 when it is not at its sorted place
+    name_sort_key = get_windows_sort_key(name)
+    name_index = get_sorted_insert_index(names_list, name) - 1
+    while name_index >= 0 and get_windows_sort_key(names_list[name_index]) == name_sort_key:
+        if names_list[name_index] == name:
+            return name_index
+        name_index -= 1
+    return -1
 
 
 def get_readable_filesize(size_bytes, suffix='B'):
@@ -23,9 +69,10 @@ def get_readable_filesize(size_bytes, suffix='B'):
 
 
 def get_files_names_absolute_list(files_names, folder_path):
+    folder_path = str(Path(folder_path))  # parsed once instead of once per file
     result = []
     for i in range(len(files_names)):
-        result.append(get_file_name_absolute_path(file_name=files_names[i], folder_path=folder_path))
+        result.append(os.path.join(folder_path, files_names[i]))
     return result
 
 
@@ -33,7 +80,7 @@ def get_file_name_absolute_path(file_name, folder_path):
     return os.path.join(Path(folder_path), file_name)
 
 
-class GlobalSetting(QWidget):
+class GlobalSetting:
     LAST_DIRECTORY_PATH = ""
     VIDEO_SOURCE_PATH = ""
     VIDEO_FILES_LIST = []
@@ -79,12 +126,11 @@ class GlobalSetting(QWidget):
 
     MUX_SETTING_ABORT_ON_ERRORS = False
     MUX_SETTING_KEEP_LOG_FILE = False
+    MUX_SETTING_NUMBER_OF_PARALLEL_JOBS = 1
+    MUX_SETTING_EDIT_SOURCE_FILES = False
 
     DESTINATION_FOLDER_PATH = ""
     JOB_QUEUE_EMPTY = True
     MUXING_ON = False
     LogFilePath = ""
     DISABLE_TOOLTIP = "<b>[Disabled]</b> because job queue has unfinished job(s)"
-
-    def __init__(self):
-        super().__init__()
@@ -8,8 +8,9 @@ from PySide2.QtGui import QPaintEvent, QResizeEvent
 from PySide2.QtWidgets import (
     QVBoxLayout,
     QGroupBox,
-    QFileDialog, QCheckBox, QLineEdit, QSizePolicy, )
+    QFileDialog, QCheckBox, QLineEdit, QSizePolicy, QWidget, )
 
+from packages.Startup import GlobalPaths
 from packages.Tabs.GlobalSetting import *
 from packages.Tabs.MuxSetting.Widgets.AudioTracksCheckableComboBox import AudioTracksCheckableComboBox
 from packages.Tabs.MuxSetting.Widgets.ControlQueueButton import ControlQueueButton
@@ -19,6 +20,7 @@ from packages.Tabs.MuxSetting.Widgets.MakeThisSubtitleDefaultCheckBox import Mak
 from packages.Tabs.MuxSetting.Widgets.MakeThisTrackDefaultComboBox import MakeThisTrackDefaultComboBox
 from packages.Tabs.MuxSetting.Widgets.OnlyKeepThoseAudiosCheckBox import OnlyKeepThoseAudiosCheckBox
 from packages.Tabs.MuxSetting.Widgets.OnlyKeepThoseSubtitlesCheckBox import OnlyKeepThoseSubtitlesCheckBox
+from packages.Tabs.MuxSetting.Widgets.ParallelJobsSpinBox import ParallelJobsSpinBox
 from packages.Tabs.MuxSetting.Widgets.SubtitleTracksCheckableComboBox import SubtitleTracksCheckableComboBox
 from packages.Widgets.ErrorDialog import ErrorDialog
 from packages.Widgets.InfoDialog import InfoDialog
@@ -27,7 +29,8 @@ from packages.Widgets.InvalidPathDialog import *
 
 # noinspection PyAttributeOutsideInit
 def write_to_log_file(e):
-    with open(GlobalFiles.AppLogFilePath, 'a+') as log_file:
+    GlobalPaths.create_temp_folders()
+    with open(GlobalPaths.AppLogFilePath, 'a+') as log_file:
         log_file.write(str(datetime.utcnow()) + ' ' + str(e) + '\n')
 
 
@@ -39,8 +42,9 @@ def get_time():
 def change_global_LogFilePath():
     t = get_time()
     log_file_name = "log_file_" + t + ".txt"
-    GlobalFiles.LogFilePath = get_file_name_absolute_path(file_name=log_file_name,
-                                                          folder_path=GlobalFiles.MergeLogsFolderPath)
+    GlobalPaths.create_temp_folders()
+    GlobalPaths.LogFilePath = get_file_name_absolute_path(file_name=log_file_name,
+                                                          folder_path=GlobalPaths.MergeLogsFolderPath)
 
 
 # noinspection PyAttributeOutsideInit
@@ -65,7 +69,7 @@ def check_if_at_least_one_muxing_setting_has_been_selected():
 def check_if_want_to_keep_log_file():
     if GlobalSetting.MUX_SETTING_KEEP_LOG_FILE:
         try:
-            copy2(GlobalFiles.LogFilePath, GlobalSetting.VIDEO_SOURCE_PATH)
+            copy2(GlobalPaths.LogFilePath, GlobalSetting.VIDEO_SOURCE_PATH)
         except Exception as e:
             write_to_log_file(e)
             error_dialog = ErrorDialog(window_title="Permission Denied",
@@ -123,9 +127,9 @@ class MuxSettingTab(QWidget):
         self.abort_on_errors_checkBox.stateChanged.connect(self.abort_on_errors_state_changed)
 
         self.keep_log_file_checkBox.stateChanged.connect(self.keep_log_file_state_changed)
+        self.edit_source_files_checkBox.stateChanged.connect(self.edit_source_files_state_changed)
         self.job_queue_layout.update_task_bar_progress_signal.connect(self.update_task_bar_progress)
         self.job_queue_layout.paused_done_signal.connect(self.paused_done)
-        self.job_queue_layout.cancel_done_signal.connect(self.cancel_done)
         self.job_queue_layout.finished_all_jobs_signal.connect(self.finished_all_jobs)
         self.job_queue_layout.pause_from_error_occurred_signal.connect(self.pause_multiplexing_button_clicked)
 
@@ -138,6 +142,8 @@ class MuxSettingTab(QWidget):
         self.setup_abort_on_errors_checkBox()
         self.setup_discard_old_attachments_checkBox()
         self.setup_keep_log_file_checkBox()
+        self.setup_edit_source_files_checkBox()
+        self.setup_parallel_jobs_label()
         self.setup_clear_job_queue_button()
         self.setup_tool_tip_hint()
         self.setup_layouts()
@@ -172,6 +178,9 @@ class MuxSettingTab(QWidget):
         self.abort_on_errors_checkBox = QCheckBox()
         self.discard_old_attachments_checkBox = QCheckBox()
         self.keep_log_file_checkBox = QCheckBox()
+        self.edit_source_files_checkBox = QCheckBox()
+        self.parallel_jobs_label = QLabel()
+        self.parallel_jobs_spinBox = ParallelJobsSpinBox()
         self.control_queue_button = ControlQueueButton()
         self.clear_job_queue_button = QPushButton()
         self.mux_tools_layout_first_row = QHBoxLayout()
@@ -193,6 +202,9 @@ class MuxSettingTab(QWidget):
         self.mux_tools_layout_first_row.addWidget(self.make_this_audio_default_comboBox, 2)
         self.mux_tools_layout_first_row.addWidget(self.abort_on_errors_checkBox, 1)
         self.mux_tools_layout_first_row.addWidget(self.keep_log_file_checkBox)
+        self.mux_tools_layout_first_row.addWidget(self.edit_source_files_checkBox)
+        self.mux_tools_layout_first_row.addWidget(self.parallel_jobs_label)
+        self.mux_tools_layout_first_row.addWidget(self.parallel_jobs_spinBox)
 
     def setup_mux_tools_layout_second_row(self):
         self.mux_tools_layout_second_row.addWidget(self.only_keep_those_subtitles_multi_choose_comboBox, 2)
@@ -210,6 +222,16 @@ class MuxSettingTab(QWidget):
         self.keep_log_file_checkBox.setText("Keep Log File")
         self.keep_log_file_checkBox.setToolTip("log file will located in the source folder after finished muxing")
 
+    def setup_edit_source_files_checkBox(self):
+        self.edit_source_files_checkBox.setText("Edit Sources When Possible")
+        self.edit_source_files_checkBox.setToolTip("<nobr>Videos that only need their track flags, chapters or "
+                                                   "attachments changed are edited directly<br>This will "
+                                                   "<b>overwrite</b> them and can't be undone, the other videos "
+                                                   "are muxed into the destination folder")
+
+    def setup_parallel_jobs_label(self):
+        self.parallel_jobs_label.setText("Parallel Jobs:")
+
     def setup_discard_old_attachments_checkBox(self):
         self.discard_old_attachments_checkBox.setText("Discard Old Attachments ")
 
@@ -473,12 +495,16 @@ class MuxSettingTab(QWidget):
         self.destination_path_button.setEnabled(True)
         self.abort_on_errors_checkBox.setEnabled(True)
         self.keep_log_file_checkBox.setEnabled(True)
+        self.edit_source_files_checkBox.setEnabled(True)
+        self.parallel_jobs_spinBox.setEnabled(True)
 
     def disable_muxing_setting(self):
         self.destination_path_lineEdit.setEnabled(False)
         self.destination_path_button.setEnabled(False)
         self.abort_on_errors_checkBox.setEnabled(False)
         self.keep_log_file_checkBox.setEnabled(False)
+        self.edit_source_files_checkBox.setEnabled(False)
+        self.parallel_jobs_spinBox.setEnabled(False)
 
     @staticmethod
     def abort_on_errors_state_changed(state):
@@ -488,6 +514,10 @@ class MuxSettingTab(QWidget):
     def keep_log_file_state_changed(state):
         GlobalSetting.MUX_SETTING_KEEP_LOG_FILE = bool(state)
 
+    @staticmethod
+    def edit_source_files_state_changed(state):
+        GlobalSetting.MUX_SETTING_EDIT_SOURCE_FILES = bool(state)
+
     def start_multiplexing_button_clicked(self):
         at_least_one_muxing_setting_has_been_selected = check_if_at_least_one_muxing_setting_has_been_selected()
         if at_least_one_muxing_setting_has_been_selected:
@@ -511,13 +541,6 @@ class MuxSettingTab(QWidget):
         self.control_queue_button.setDisabled(False)
         self.update_task_bar_paused_signal.emit()
 
-    def cancel_done(self):
-        self.disable_editable_widgets()
-        self.enable_muxing_setting()
-        self.control_queue_button.set_state_start_multiplexing()
-        self.clear_job_queue_button.setDisabled(False)
-        change_global_LogFilePath()
-
     def finished_all_jobs(self):
         self.enable_editable_widgets()
         self.enable_muxing_setting()
@@ -531,4 +554,4 @@ class MuxSettingTab(QWidget):
 
     def setup_log_file(self):
         if self.control_queue_button.state == "START":
-            open(GlobalFiles.LogFilePath, 'w+').close()
+            open(GlobalPaths.LogFilePath, 'w+').close()
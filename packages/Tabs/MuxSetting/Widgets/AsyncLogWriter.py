@@ -0,0 +1,28 @@
+import queue
+import threading
+
+
+# writes the muxing output to the log file from its own thread so reading the process pipe never waits on the disk
+class AsyncLogWriter:
+    def __init__(self, log_file_path):
+        self.log_file_path = log_file_path
+        self.chunks_queue = queue.Queue()
+        self.writer_thread = threading.Thread(target=self.write_chunks, daemon=True)
+        self.writer_thread.start()
+
+    def write(self, chunk):
+        self.chunks_queue.put(chunk)
+
+    def close(self):
+        self.chunks_queue.put(None)
+        self.writer_thread.join()
+
+    def write_chunks(self):
+        with open(self.log_file_path, "ab") as log_file:
+            while True:
+                chunk = self.chunks_queue.get()
+                if chunk is None:
+                    break
+                log_file.write(chunk)
+                if self.chunks_queue.empty():
+                    log_file.flush()
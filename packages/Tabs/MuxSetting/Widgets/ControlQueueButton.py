@@ -38,9 +38,9 @@ class ControlQueueButton(QPushButton):
 
     def set_state_pausing_multiplexing(self):
         self.state = "PAUSING"
-        self.setText(" Waiting Current Job")
+        self.setText(" Waiting Current Jobs")
         self.setIcon(GlobalFiles.PauseMultiplexingIcon)
-        self.setToolTip("will pause muxing after current job finished")
+        self.setToolTip("will pause muxing after current running jobs finished")
         self.setDisabled(True)
 
     def set_state_resume_multiplexing(self):
@@ -1,35 +1,19 @@
-import json
 import os
-import subprocess
 from pathlib import Path
 
-from packages.Startup import GlobalFiles
+from packages.Startup import GlobalPaths
 from packages.Startup.PreDefined import ISO_639_2_LANGUAGES
-from packages.Tabs.GlobalSetting import GlobalSetting
+from packages.Tabs.MuxSetting.Widgets.MkvmergeProbeCache import get_mkvmerge_json_info
+from packages.Tabs.MuxSetting.Widgets.MuxingBatchSettings import MuxingBatchSettings, create_muxing_batch_settings
+from packages.Tabs.MuxSetting.Widgets.MuxingJsonOptions import add_json_line, fix_windows_backslash_path
 from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
 from packages.Tabs.MuxSetting.Widgets.SingleTrackData import SingleTrackData
 
 
-def add_two_spaces():
-    return "  "
-
-
-def add_double_quotation(string):
-    return add_two_spaces() + "\"" + str(string) + "\""
-
-
-def add_json_line(string):
-    return "\n" + add_double_quotation(string) + ","
-
-
 def delete_trailing_zero_string(string):
     return str(int(str(string)))
 
 
-def fix_windows_backslash_path(string):
-    return string.replace('\\', '\\\\')
-
-
 def get_attribute(data, attribute, default_value):
     return data.get(attribute) or default_value
 
@@ -41,8 +25,11 @@ def change_file_extension_to_mkv(file_name):
 
 
 class GetJsonForMkvmergeJob:
-    def __init__(self, job: SingleJobData):
+    def __init__(self, job: SingleJobData, job_file_path=GlobalPaths.mkvmergeJsonJobFilePath,
+                 batch_settings: MuxingBatchSettings = None):
         self.job = job
+        self.batch_settings = batch_settings or create_muxing_batch_settings()
+        self.job_file_path = job_file_path
         self.file_info_json = ""
         self.ui_language_command = ""
         self.output_video_command = ""
@@ -79,13 +66,7 @@ class GetJsonForMkvmergeJob:
         self.setup_final_command()
 
     def generate_info_file(self):
-        info_file_path = GlobalFiles.mkvmergeJsonInfoFilePath
-        with open(info_file_path, 'w+') as info_file:
-            command = add_double_quotation(GlobalFiles.MKVMERGE_PATH) + " -J " + add_double_quotation(
-                self.job.video_name_absolute)
-            subprocess.run(command, shell=True, stdout=info_file)
-        with open(info_file_path, 'r') as info_file:
-            self.json_info = json.load(info_file)
+        self.json_info = get_mkvmerge_json_info(self.job.video_name_absolute)
         self.tracks_json_info = self.json_info["tracks"]
         for track in self.tracks_json_info:
             new_track_info = SingleTrackData()
@@ -104,27 +85,18 @@ class GetJsonForMkvmergeJob:
                 self.videos_track_json_info.append(new_track_info)
 
     def setup_attachments_options(self):
-        if GlobalSetting.ATTACHMENT_ENABLED:
-            attachments_list_with_attach_command = []
-            if GlobalSetting.ATTACHMENT_DISCARD_OLD:
-                self.discard_old_attachments_command = add_json_line("--no-attachments")
-            for i in range(len(GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST)):
-                if GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST[i]:
-                    file_to_attach = GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST[i]
-                    attachments_list_with_attach_command.append(add_json_line("--attach-file"))
-                    attachments_list_with_attach_command.append(
-                        add_json_line(fix_windows_backslash_path(file_to_attach)))
-            self.attachments_attach_command = "".join(attachments_list_with_attach_command)
+        self.discard_old_attachments_command = self.batch_settings.mkvmerge_discard_old_attachments_command
+        self.attachments_attach_command = self.batch_settings.mkvmerge_attachments_attach_command
 
     def setup_chapter_options(self):
-        if GlobalSetting.CHAPTER_ENABLED:
+        if self.batch_settings.chapter_enabled:
             if self.job.chapter_found:
                 self.chapter_attach_command = add_json_line("--chapters") + \
                                               add_json_line(fix_windows_backslash_path(self.job.chapter_name_absolute))
 
     def setup_subtitle_options(self):
 
-        if GlobalSetting.SUBTITLE_ENABLED:
+        if self.batch_settings.subtitle_enabled:
             subtitle_command_list = []
             if self.job.subtitle_found:
                 # add subtitle language
@@ -162,34 +134,14 @@ class GetJsonForMkvmergeJob:
             change_forced_subtitle_commands_list)
 
     def setup_only_keep_those_subtitles(self):
-        if GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_ENABLED:
-            if len(GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_LANGUAGES) == 0 and \
-                    len(GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_TRACKS) == 0:
-                self.specify_subtitle_track_source_video_command = add_json_line("--no-subtitles")
-            else:
-                only_keep_those_subtitle_list = GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_TRACKS
-                for language in GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_LANGUAGES:
-                    only_keep_those_subtitle_list.append(ISO_639_2_LANGUAGES[language])
-                self.specify_subtitle_track_source_video_command = add_json_line("--subtitle-tracks")
-                self.specify_subtitle_track_source_video_command += add_json_line(
-                    ",".join(only_keep_those_subtitle_list))
+        self.specify_subtitle_track_source_video_command = self.batch_settings.mkvmerge_specify_subtitle_track_command
 
     def setup_only_keep_those_audios(self):
-        if GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_ENABLED:
-            if len(GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_LANGUAGES) == 0 and \
-                    len(GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_TRACKS) == 0:
-                self.specify_audio_track_source_video_command = add_json_line("--no-audio")
-            else:
-                only_keep_those_audios_list = GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_TRACKS
-                for audio in GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_LANGUAGES:
-                    only_keep_those_audios_list.append(ISO_639_2_LANGUAGES[audio])
-                self.specify_audio_track_source_video_command = add_json_line("--audio-tracks")
-                self.specify_audio_track_source_video_command += add_json_line(
-                    ",".join(only_keep_those_audios_list))
+        self.specify_audio_track_source_video_command = self.batch_settings.mkvmerge_specify_audio_track_command
 
     def make_this_subtitle_default_forced(self):
-        if GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_SEMI_ENABLED:
-            subtitle_track = GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_TRACK
+        if self.batch_settings.make_this_subtitle_default_semi_enabled:
+            subtitle_track = self.batch_settings.make_this_subtitle_default_track
             if (not subtitle_track.isspace()) and subtitle_track != "":
                 change_default_subtitle_commands_list = []
                 subtitle_track_id = ""
@@ -215,8 +167,8 @@ class GetJsonForMkvmergeJob:
                     self.change_default_forced_subtitle_track_setting_source_video_command += ''.join(
                         change_default_subtitle_commands_list)
 
-        elif GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_FULL_ENABLED:
-            subtitle_track = GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_TRACK
+        elif self.batch_settings.make_this_subtitle_default_full_enabled:
+            subtitle_track = self.batch_settings.make_this_subtitle_default_track
             if (not subtitle_track.isspace()) and subtitle_track != "":
                 change_default_subtitle_commands_list = []
                 subtitle_track_id = ""
@@ -262,8 +214,8 @@ class GetJsonForMkvmergeJob:
                             change_default_subtitle_commands_list)
 
     def make_this_audio_default_forced(self):
-        if GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_SEMI_ENABLED:
-            audio_track = GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_TRACK
+        if self.batch_settings.make_this_audio_default_semi_enabled:
+            audio_track = self.batch_settings.make_this_audio_default_track
             if (not audio_track.isspace()) and audio_track != "":
                 change_default_audio_commands_list = []
                 audio_track_id = ""
@@ -289,8 +241,8 @@ class GetJsonForMkvmergeJob:
                     self.change_default_forced_audio_track_setting_source_video_command += ''.join(
                         change_default_audio_commands_list)
 
-        elif GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_FULL_ENABLED:
-            audio_track = GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_TRACK
+        elif self.batch_settings.make_this_audio_default_full_enabled:
+            audio_track = self.batch_settings.make_this_audio_default_track
             if (not audio_track.isspace()) and audio_track != "":
                 change_default_audio_commands_list = []
                 audio_track_id = ""
@@ -335,18 +287,16 @@ class GetJsonForMkvmergeJob:
                         self.change_default_forced_audio_track_setting_source_video_command += ''.join(
                             change_default_audio_commands_list)
 
-    # noinspection PyListCreation
     def setup_ui_language(self):
-        ui_language_commands_list = []
-        ui_language_commands_list.append(add_double_quotation("--ui-language") + ",")
-        ui_language_commands_list.append(add_json_line("en"))
-        self.ui_language_command = "".join(ui_language_commands_list)
+        self.ui_language_command = self.batch_settings.ui_language_command
 
     # noinspection PyListCreation
     def setup_output_video_command(self):
-        folder_path = Path(GlobalSetting.DESTINATION_FOLDER_PATH)
+        folder_path = Path(self.batch_settings.destination_folder_path)
         output_video_name = Path(change_file_extension_to_mkv(self.job.video_name))
         output_video_name_absolute = os.path.join(folder_path, output_video_name)
+        # videos taken from subfolders go to the same subfolders of the destination
+        os.makedirs(os.path.dirname(output_video_name_absolute), exist_ok=True)
 
         output_video_commands_list = []
         output_video_commands_list.append(add_json_line("--output"))
@@ -383,6 +333,5 @@ class GetJsonForMkvmergeJob:
         self.final_command += "]"
 
     def generate_mkvmerge_json_job_file(self):
-        job_file_path = GlobalFiles.mkvmergeJsonJobFilePath
-        with open(job_file_path, 'w+', encoding="utf-8") as job_file:
+        with open(self.job_file_path, 'w+', encoding="utf-8") as job_file:
             job_file.write(self.final_command)
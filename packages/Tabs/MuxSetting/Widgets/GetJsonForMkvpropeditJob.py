@@ -1,33 +1,17 @@
-import json
-import subprocess
 
-from packages.Startup import GlobalFiles
+from packages.Startup import GlobalPaths
 from packages.Startup.PreDefined import ISO_639_2_LANGUAGES
-from packages.Tabs.GlobalSetting import GlobalSetting
+from packages.Tabs.MuxSetting.Widgets.MkvmergeProbeCache import get_mkvmerge_json_info
+from packages.Tabs.MuxSetting.Widgets.MuxingBatchSettings import MuxingBatchSettings, create_muxing_batch_settings
+from packages.Tabs.MuxSetting.Widgets.MuxingJsonOptions import add_json_line, fix_windows_backslash_path
 from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
 from packages.Tabs.MuxSetting.Widgets.SingleTrackData import SingleTrackData
 
 
-def add_two_spaces():
-    return "  "
-
-
-def add_double_quotation(string):
-    return add_two_spaces() + "\"" + str(string) + "\""
-
-
-def add_json_line(string):
-    return "\n" + add_double_quotation(string) + ","
-
-
 def delete_trailing_zero_string(string):
     return str(int(str(string)))
 
 
-def fix_windows_backslash_path(string):
-    return string.replace('\\', '\\\\')
-
-
 def increase_id_by_one(string):
     return str(int(string) + 1)
 
@@ -37,8 +21,11 @@ def get_attribute(data, attribute, default_value):
 
 
 class GetJsonForMkvpropeditJob:
-    def __init__(self, job: SingleJobData):
+    def __init__(self, job: SingleJobData, job_file_path=GlobalPaths.mkvpropeditJsonJobFilePath,
+                 batch_settings: MuxingBatchSettings = None):
         self.job = job
+        self.batch_settings = batch_settings or create_muxing_batch_settings()
+        self.job_file_path = job_file_path
         self.file_info_json = ""
         self.ui_language_command = ""
         self.input_video_command = ""
@@ -68,13 +55,7 @@ class GetJsonForMkvpropeditJob:
         self.setup_final_command()
 
     def generate_info_file(self):
-        info_file_path = GlobalFiles.mkvmergeJsonInfoFilePath
-        with open(info_file_path, 'w+') as info_file:
-            command = add_double_quotation(GlobalFiles.MKVMERGE_PATH) + " -J " + add_double_quotation(
-                self.job.video_name_absolute)
-            subprocess.run(command, shell=True, stdout=info_file)
-        with open(info_file_path, 'r') as info_file:
-            self.json_info = json.load(info_file)
+        self.json_info = get_mkvmerge_json_info(self.job.video_name_absolute)
         self.number_of_old_attachments = len(self.json_info["attachments"])
         self.tracks_json_info = self.json_info["tracks"]
         for track in self.tracks_json_info:
@@ -94,24 +75,17 @@ class GetJsonForMkvpropeditJob:
                 self.videos_track_json_info.append(new_track_info)
 
     def setup_attachments_options(self):
-        if GlobalSetting.ATTACHMENT_ENABLED:
-            attachments_list_with_attach_command = []
+        if self.batch_settings.attachment_enabled:
             discard_old_attachments_list_command = []
-            if GlobalSetting.ATTACHMENT_DISCARD_OLD:
+            if self.batch_settings.attachment_discard_old:
                 for i in range(self.number_of_old_attachments + 2):
-                    attachments_list_with_attach_command.append(add_json_line("--delete-attachment"))
-                    attachments_list_with_attach_command.append(add_json_line(str(i)))
-            for i in range(len(GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST)):
-                if GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST[i]:
-                    file_to_attach = GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST[i]
-                    attachments_list_with_attach_command.append(add_json_line("--add-attachment"))
-                    attachments_list_with_attach_command.append(
-                        add_json_line(fix_windows_backslash_path(file_to_attach)))
-            self.attachments_attach_command = "".join(attachments_list_with_attach_command)
+                    discard_old_attachments_list_command.append(add_json_line("--delete-attachment"))
+                    discard_old_attachments_list_command.append(add_json_line(str(i)))
             self.discard_old_attachments_command = "".join(discard_old_attachments_list_command)
+            self.attachments_attach_command = self.batch_settings.mkvpropedit_attachments_attach_command
 
     def setup_chapter_options(self):
-        if GlobalSetting.CHAPTER_ENABLED:
+        if self.batch_settings.chapter_enabled:
             if self.job.chapter_found:
                 self.chapter_attach_command = add_json_line("--chapters") + \
                                               add_json_line(fix_windows_backslash_path(self.job.chapter_name_absolute))
@@ -125,8 +99,8 @@ class GetJsonForMkvpropeditJob:
             change_forced_subtitle_commands_list)
 
     def make_this_subtitle_default_forced(self):
-        if GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_SEMI_ENABLED:
-            subtitle_track = GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_TRACK
+        if self.batch_settings.make_this_subtitle_default_semi_enabled:
+            subtitle_track = self.batch_settings.make_this_subtitle_default_track
             if (not subtitle_track.isspace()) and subtitle_track != "":
                 change_default_subtitle_commands_list = []
                 subtitle_track_id = ""
@@ -176,8 +150,8 @@ class GetJsonForMkvpropeditJob:
                         self.change_default_forced_subtitle_track_setting_source_video_command += ''.join(
                             change_default_subtitle_commands_list)
 
-        elif GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_FULL_ENABLED:
-            subtitle_track = GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_TRACK
+        elif self.batch_settings.make_this_subtitle_default_full_enabled:
+            subtitle_track = self.batch_settings.make_this_subtitle_default_track
             if (not subtitle_track.isspace()) and subtitle_track != "":
                 change_default_subtitle_commands_list = []
                 subtitle_track_id = ""
@@ -236,8 +210,8 @@ class GetJsonForMkvpropeditJob:
                             change_default_subtitle_commands_list)
 
     def make_this_audio_default_forced(self):
-        if GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_SEMI_ENABLED:
-            audio_track = GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_TRACK
+        if self.batch_settings.make_this_audio_default_semi_enabled:
+            audio_track = self.batch_settings.make_this_audio_default_track
             if (not audio_track.isspace()) and audio_track != "":
                 change_default_audio_commands_list = []
                 audio_track_id = ""
@@ -287,8 +261,8 @@ class GetJsonForMkvpropeditJob:
                         self.change_default_forced_audio_track_setting_source_video_command += ''.join(
                             change_default_audio_commands_list)
 
-        elif GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_FULL_ENABLED:
-            audio_track = GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_TRACK
+        elif self.batch_settings.make_this_audio_default_full_enabled:
+            audio_track = self.batch_settings.make_this_audio_default_track
             if (not audio_track.isspace()) and audio_track != "":
                 change_default_audio_commands_list = []
                 audio_track_id = ""
@@ -346,12 +320,8 @@ class GetJsonForMkvpropeditJob:
                         self.change_default_forced_audio_track_setting_source_video_command += ''.join(
                             change_default_audio_commands_list)
 
-    # noinspection PyListCreation
     def setup_ui_language(self):
-        ui_language_commands_list = []
-        ui_language_commands_list.append(add_double_quotation("--ui-language") + ",")
-        ui_language_commands_list.append(add_json_line("en"))
-        self.ui_language_command = "".join(ui_language_commands_list)
+        self.ui_language_command = self.batch_settings.ui_language_command
 
     # noinspection PyListCreation
     def setup_input_video_command(self):
@@ -374,6 +344,5 @@ class GetJsonForMkvpropeditJob:
         self.final_command += "]"
 
     def generate_mkvpropedit_json_file(self):
-        job_file_path = GlobalFiles.mkvpropeditJsonJobFilePath
-        with open(job_file_path, 'w+', encoding="utf-8") as job_file:
+        with open(self.job_file_path, 'w+', encoding="utf-8") as job_file:
             job_file.write(self.final_command)
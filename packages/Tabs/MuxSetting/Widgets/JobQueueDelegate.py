@@ -0,0 +1,72 @@
+from PySide2.QtCore import Qt, QRect, QSize, QEvent
+from PySide2.QtGui import QIcon, QPalette
+from PySide2.QtWidgets import QStyle, QStyleFactory, QStyleOptionProgressBar, QToolTip
+
+from packages.Tabs.MuxSetting.Widgets.JobQueueModel import JOB_QUEUE_COLUMNS_IDS, JOB_QUEUE_CENTERED_COLUMNS, \
+    JOB_PROGRESS_ROLE
+from packages.Widgets.TableViewDelegate import TableViewDelegate
+
+TOOL_TIP_DURATION = 10000
+
+
+# paints the cells of the job queue that used to be widgets: the icons with their text centered in
+# the cell and the progress bars, the other cells are painted like in every other table
+class JobQueueDelegate(TableViewDelegate):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # one style for every progress bar of the queue, it is None where the style does not exist
+        self.progress_bar_style = QStyleFactory.create("windowsvista")
+
+    def paint(self, painter, option, index):
+        column_index = index.column()
+        if column_index == JOB_QUEUE_COLUMNS_IDS["Progress"]:
+            self.paint_selected_background(painter, option, index)
+            self.paint_progress_bar(painter, option, index.data(JOB_PROGRESS_ROLE) or 0)
+        elif column_index in JOB_QUEUE_CENTERED_COLUMNS:
+            self.paint_selected_background(painter, option, index)
+            self.paint_icon_with_text(painter, option, index.data(Qt.DecorationRole), index.data(Qt.DisplayRole))
+        else:
+            super().paint(painter, option, index)
+
+    def paint_selected_background(self, painter, option, index):
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, self.selected_background(option, index))
+
+    def paint_progress_bar(self, painter, option, progress):
+        progress_bar_option = QStyleOptionProgressBar()
+        progress_bar_option.rect = option.rect
+        progress_bar_option.palette = option.palette
+        progress_bar_option.state = QStyle.State_Enabled | QStyle.State_Horizontal
+        progress_bar_option.minimum = 0
+        progress_bar_option.maximum = 100
+        progress_bar_option.progress = progress
+        progress_bar_option.textVisible = False
+        style = self.progress_bar_style or option.widget.style()
+        style.drawControl(QStyle.CE_ProgressBar, progress_bar_option, painter)
+
+    @staticmethod
+    def paint_icon_with_text(painter, option, icon, text):
+        if icon is None:
+            return
+        if not isinstance(icon, QIcon):
+            icon = QIcon(icon)
+        icon_size = icon.actualSize(QSize(option.rect.height(), option.rect.height()))
+        text_width = option.fontMetrics.horizontalAdvance(text) if text else 0
+        left = option.rect.x() + (option.rect.width() - icon_size.width() - text_width) // 2
+        painter.save()
+        painter.setClipRect(option.rect)
+        icon.paint(painter, QRect(left, option.rect.y(), icon_size.width(), option.rect.height()), Qt.AlignCenter)
+        if text:
+            painter.setPen(option.palette.color(QPalette.Text))
+            painter.drawText(QRect(left + icon_size.width(), option.rect.y(), text_width, option.rect.height()),
+                             Qt.AlignLeft | Qt.AlignVCenter, text)
+        painter.restore()
+
+    def helpEvent(self, event, view, option, index):
+        # the tool tips stay as long as the ones of the cell widgets did
+        if event.type() == QEvent.ToolTip and index.isValid():
+            tool_tip = index.data(Qt.ToolTipRole)
+            if tool_tip:
+                QToolTip.showText(event.globalPos(), tool_tip, view, option.rect, TOOL_TIP_DURATION)
+                return True
+        return super().helpEvent(event, view, option, index)
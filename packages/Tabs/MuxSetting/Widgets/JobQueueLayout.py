@@ -10,7 +10,6 @@ from packages.Tabs.MuxSetting.Widgets.ProgreeBar import ProgressBar
 class JobQueueLayout(QGridLayout):
     update_task_bar_progress_signal = Signal(int)
     paused_done_signal = Signal()
-    cancel_done_signal = Signal()
     finished_all_jobs_signal = Signal()
     pause_from_error_occurred_signal = Signal()
 
@@ -24,7 +23,6 @@ class JobQueueLayout(QGridLayout):
         self.setup_layout()
         self.table.update_total_progress_signal.connect(self.update_total_progress)
         self.table.paused_done_signal.connect(self.paused_done)
-        self.table.cancel_done_signal.connect(self.cancel_done)
         self.table.pause_from_error_occurred_signal.connect(self.pause_from_error_occurred)
         self.table.finished_all_jobs_signal.connect(self.finished_all_jobs)
         self.table.increase_number_of_done_jobs_signal.connect(
@@ -58,9 +56,6 @@ class JobQueueLayout(QGridLayout):
     def paused_done(self):
         self.paused_done_signal.emit()
 
-    def cancel_done(self):
-        self.cancel_done_signal.emit()
-
     def update_total_progress(self, new_progress):
         self.total_progress_progressBar.setValue(new_progress)
         self.update_task_bar_progress_signal.emit(new_progress)
@@ -0,0 +1,210 @@
+from PySide2.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide2.QtGui import QMovie
+
+from packages.Startup import GlobalFiles
+from packages.Startup.DefaultOptions import Default_Subtitle_Language
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+
+JOB_PROGRESS_ROLE = Qt.UserRole + 1
+JOB_QUEUE_COLUMNS_IDS = {
+    "Name": 0,
+    "Status": 1,
+    "Subtitle": 2,
+    "Chapter": 3,
+    "Size Before": 4,
+    "Progress": 5,
+    "Size After": 6,
+}
+JOB_QUEUE_COLUMNS_NAMES = list(JOB_QUEUE_COLUMNS_IDS.keys())
+JOB_QUEUE_CENTERED_COLUMNS = (JOB_QUEUE_COLUMNS_IDS["Status"], JOB_QUEUE_COLUMNS_IDS["Subtitle"],
+                              JOB_QUEUE_COLUMNS_IDS["Chapter"])
+
+
+def generate_tool_tip_for_chapter_file(chapter_full_path="C:/Test", chapter_name="Test", show_full_path=True):
+    if show_full_path:
+        return (
+                "Chapter Full Path: " + str(chapter_full_path) +
+                "\nChapter Name: " + str(chapter_name) +
+                "\nDouble click for more details")
+    else:
+        return ("Chapter Name: " + str(chapter_name) +
+                "\nDouble click for more details")
+
+
+def generate_tool_tip_for_subtitle_file(subtitle_full_path="C:/Test", subtitle_name="Test",
+                                        subtitle_delay=0.0, subtitle_language=Default_Subtitle_Language,
+                                        subtitle_track_name="Test",
+                                        subtitle_set_default=False, subtitle_set_forced=False,
+                                        show_full_path=False):
+    if show_full_path:
+        return (
+                "Subtitle Full Path: " + str(subtitle_full_path) +
+                "\nSubtitle Name: " + str(subtitle_name) +
+                "\nSubtitle Delay: " + str(subtitle_delay) + "s" +
+                "\nSubtitle Language: " + str(subtitle_language) +
+                "\nSubtitle Track Name: " + str(subtitle_track_name) +
+                "\nSet Default: " + str(subtitle_set_default) +
+                "\nSet Forced: " + str(subtitle_set_forced) +
+                "\nDouble click for more details")
+    else:
+        return (
+                "Subtitle Name: " + str(subtitle_name) +
+                "\nSubtitle Delay: " + str(subtitle_delay) + "s" +
+                "\nSubtitle Language: " + str(subtitle_language) +
+                "\nSubtitle Track Name: " + str(subtitle_track_name) +
+                "\nSet Default: " + str(subtitle_set_default) +
+                "\nSet Forced: " + str(subtitle_set_forced) +
+                "\nDouble click for more details")
+
+
+def generate_tool_tip_for_done_job(number_of_warnings=0):
+    if number_of_warnings == 0:
+        return "Done"
+    elif number_of_warnings == 1:
+        return "Done with 1 warning\nyou can review log file for more details"
+    else:
+        return "Done with " + str(number_of_warnings) + " warnings\nyou can review log file for more details"
+
+
+def get_job_name_text(job: SingleJobData):
+    return " " + job.video_name + "   "
+
+
+def get_job_name_displayed(name_text):
+    # the mark keeps names that start with a right to left letter aligned to the left
+    return chr(0x200E) + name_text
+
+
+# the queued jobs shown without a widget per cell, the view asks only for the rows it paints and the
+# delegate draws the icons and the progress bars, the icons are shared by every row
+# the running jobs share one spinner, every frame repaints only their status cells
+class JobQueueModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = []  # type: list[SingleJobData]
+        self.running_jobs_rows = set()  # type: set[int]
+        self.sizes_after_muxing = {}  # type: dict[int, str]
+        self.spinner_movie = QMovie(GlobalFiles.SpinnerIconPath)
+        self.spinner_movie.frameChanged.connect(self.update_running_jobs_status)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(JOB_QUEUE_COLUMNS_NAMES)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row_index = index.row()
+        column_index = index.column()
+        job = self.jobs[row_index]
+        if column_index == JOB_QUEUE_COLUMNS_IDS["Name"]:
+            if role == Qt.DisplayRole:
+                return get_job_name_displayed(get_job_name_text(job))
+        elif column_index == JOB_QUEUE_COLUMNS_IDS["Status"]:
+            return self.get_status_data(row_index, job, role)
+        elif column_index == JOB_QUEUE_COLUMNS_IDS["Subtitle"]:
+            if role == Qt.DecorationRole:
+                return GlobalFiles.get_icon("InfoSettingIcon" if job.subtitle_found else "WarningCheckIcon")
+            if role == Qt.ToolTipRole:
+                if not job.subtitle_found:
+                    return "No Subtitle File"
+                return generate_tool_tip_for_subtitle_file(subtitle_full_path=job.subtitle_name_absolute,
+                                                           subtitle_name=job.subtitle_name,
+                                                           subtitle_delay=job.subtitle_delay,
+                                                           subtitle_language=job.subtitle_language,
+                                                           subtitle_track_name=job.subtitle_track_name,
+                                                           subtitle_set_default=job.subtitle_set_default,
+                                                           subtitle_set_forced=job.subtitle_set_forced,
+                                                           show_full_path=False)
+        elif column_index == JOB_QUEUE_COLUMNS_IDS["Chapter"]:
+            if role == Qt.DecorationRole:
+                return GlobalFiles.get_icon("InfoIcon" if job.chapter_found else "WarningCheckIcon")
+            if role == Qt.ToolTipRole:
+                if not job.chapter_found:
+                    return "No Chapter File"
+                return generate_tool_tip_for_chapter_file(chapter_full_path=job.chapter_name_absolute,
+                                                          chapter_name=job.chapter_name,
+                                                          show_full_path=False)
+        elif column_index == JOB_QUEUE_COLUMNS_IDS["Size Before"]:
+            if role == Qt.DisplayRole:
+                return " " + job.size_before_muxing
+        elif column_index == JOB_QUEUE_COLUMNS_IDS["Progress"]:
+            if role == JOB_PROGRESS_ROLE:
+                return job.progress
+        elif column_index == JOB_QUEUE_COLUMNS_IDS["Size After"]:
+            if role == Qt.DisplayRole and row_index in self.sizes_after_muxing:
+                return " " + self.sizes_after_muxing[row_index]
+        return None
+
+    def get_status_data(self, row_index, job: SingleJobData, role):
+        if row_index in self.running_jobs_rows:
+            if role == Qt.DecorationRole:
+                return self.spinner_movie.currentPixmap()
+            if role == Qt.DisplayRole:
+                return str(job.progress) + "%"
+        elif job.error_occurred:
+            if role == Qt.DecorationRole:
+                return GlobalFiles.get_icon("ErrorIcon")
+            if role == Qt.ToolTipRole:
+                return "Error Happened\nDouble click for more details"
+        elif job.done:
+            if role == Qt.DecorationRole:
+                return GlobalFiles.get_icon("TrueCheckIcon")
+            if role == Qt.ToolTipRole:
+                return generate_tool_tip_for_done_job(number_of_warnings=job.number_of_warnings)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole:
+                return JOB_QUEUE_COLUMNS_NAMES[section]
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter if section in JOB_QUEUE_CENTERED_COLUMNS else Qt.AlignLeft
+            return None
+        if role == Qt.DisplayRole:
+            return str(section + 1)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def show_jobs(self, jobs):
+        # the list is the one the table keeps, the jobs are changed in place and their rows updated after
+        self.beginResetModel()
+        self.jobs = jobs
+        self.running_jobs_rows.clear()
+        self.sizes_after_muxing.clear()
+        self.spinner_movie.stop()
+        self.endResetModel()
+
+    def clear_jobs(self):
+        self.show_jobs(jobs=[])
+
+    def update_job_row(self, row_index):
+        self.dataChanged.emit(self.index(row_index, 0), self.index(row_index, self.columnCount() - 1))
+
+    def start_job(self, row_index):
+        self.running_jobs_rows.add(row_index)
+        if self.spinner_movie.state() != QMovie.Running:
+            self.spinner_movie.start()
+        self.update_job_row(row_index)
+
+    def finish_job(self, row_index):
+        self.running_jobs_rows.discard(row_index)
+        if len(self.running_jobs_rows) == 0:
+            self.spinner_movie.stop()
+        self.update_job_row(row_index)
+
+    def set_size_after_muxing(self, row_index, size_after_muxing):
+        self.sizes_after_muxing[row_index] = size_after_muxing
+        self.update_job_row(row_index)
+
+    def update_running_jobs_status(self):
+        for row_index in self.running_jobs_rows:
+            status_index = self.index(row_index, JOB_QUEUE_COLUMNS_IDS["Status"])
+            self.dataChanged.emit(status_index, status_index)
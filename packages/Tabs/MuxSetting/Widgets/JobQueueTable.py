@@ -1,68 +1,25 @@
 from pathlib import Path
 import os
-from PySide2.QtCore import QThread, Signal
-from PySide2.QtGui import Qt, QFontMetrics
-from PySide2.QtWidgets import QAbstractItemView, QTableWidgetItem, QHeaderView, QLabel
+from PySide2.QtCore import QThread, Signal, QModelIndex, QEvent
+from PySide2.QtGui import QFontMetrics
+from PySide2.QtWidgets import QAbstractItemView, QHeaderView
 
-from packages.Startup.DefaultOptions import Default_Subtitle_Language
 from packages.Startup.InitializeScreenResolution import screen_size
 from packages.Tabs.GlobalSetting import GlobalSetting, get_readable_filesize
-from packages.Tabs.MuxSetting.Widgets.ConfirmUsingMkvpropedit import ConfirmUsingMkvpropedit
+from packages.Tabs.MuxSetting.Widgets.JobQueueDelegate import JobQueueDelegate
+from packages.Tabs.MuxSetting.Widgets.JobQueueModel import JobQueueModel, JOB_QUEUE_COLUMNS_IDS, get_job_name_text
 from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
-from packages.Tabs.MuxSetting.Widgets.ProgreeBar import ProgressBar
+from packages.Tabs.MuxSetting.Widgets.MuxingProgressAggregator import MuxingProgressAggregator
 from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
 from packages.Tabs.MuxSetting.Widgets.StartMuxingWorker import StartMuxingWorker
-from packages.Tabs.MuxSetting.Widgets.StatusWidget import StatusWidget
 from packages.Widgets.ChapterInfoDialog import ChapterInfoDialog
-from packages.Widgets.ErrorCell import ErrorCell
 from packages.Widgets.ErrorDialog import ErrorDialog
-from packages.Widgets.InfoCell import InfoCell
-from packages.Widgets.InfoWithOptionsCell import InfoWithOptionsCell
-from packages.Widgets.OkCell import OkCell
 from packages.Widgets.OkDialog import OkDialog
 from packages.Widgets.SubtitleInfoDialog import SubtitleInfoDialog
-from packages.Widgets.TableWidget import TableWidget
-from packages.Widgets.WarningCell import WarningCell
+from packages.Widgets.TableView import TableView
 from packages.Widgets.WarningDialog import WarningDialog
 
 
-def generate_tool_tip_for_chapter_file(chapter_full_path="C:/Test", chapter_name="Test", show_full_path=True):
-    if show_full_path:
-        return (
-                "Chapter Full Path: " + str(chapter_full_path) +
-                "\nChapter Name: " + str(chapter_name) +
-                "\nDouble click for more details")
-    else:
-        return ("Chapter Name: " + str(chapter_name) +
-                "\nDouble click for more details")
-
-
-def generate_tool_tip_for_subtitle_file(subtitle_full_path="C:/Test", subtitle_name="Test",
-                                        subtitle_delay=0.0, subtitle_language=Default_Subtitle_Language,
-                                        subtitle_track_name="Test",
-                                        subtitle_set_default=False, subtitle_set_forced=False,
-                                        show_full_path=False):
-    if show_full_path:
-        return (
-                "Subtitle Full Path: " + str(subtitle_full_path) +
-                "\nSubtitle Name: " + str(subtitle_name) +
-                "\nSubtitle Delay: " + str(subtitle_delay) + "s" +
-                "\nSubtitle Language: " + str(subtitle_language) +
-                "\nSubtitle Track Name: " + str(subtitle_track_name) +
-                "\nSet Default: " + str(subtitle_set_default) +
-                "\nSet Forced: " + str(subtitle_set_forced) +
-                "\nDouble click for more details")
-    else:
-        return (
-                "Subtitle Name: " + str(subtitle_name) +
-                "\nSubtitle Delay: " + str(subtitle_delay) + "s" +
-                "\nSubtitle Language: " + str(subtitle_language) +
-                "\nSubtitle Track Name: " + str(subtitle_track_name) +
-                "\nSet Default: " + str(subtitle_set_default) +
-                "\nSet Forced: " + str(subtitle_set_forced) +
-                "\nDouble click for more details")
-
-
 def change_file_extension_to_mkv(file_name):
     file_extension_start_index = file_name.rfind(".")
     new_file_name_with_mkv_extension = file_name[:file_extension_start_index] + ".mkv"
@@ -72,12 +29,11 @@ def change_file_extension_to_mkv(file_name):
 # noinspection PyUnresolvedReferences
 
 
-class JobQueueTable(TableWidget):
+class JobQueueTable(TableView):
     update_total_progress_signal = Signal(int)
     increase_number_of_done_jobs_signal = Signal()
     set_number_of_jobs_signal = Signal(int)
     paused_done_signal = Signal()
-    cancel_done_signal = Signal()
     pause_from_error_occurred_signal = Signal()
     finished_all_jobs_signal = Signal()
 
@@ -88,23 +44,16 @@ class JobQueueTable(TableWidget):
         self.number_of_jobs = 0
         self.number_of_done_jobs = 0
         self.need_column_width_set = True
-        self.column_ids = {
-            "Name": 0,
-            "Status": 1,
-            "Subtitle": 2,
-            "Chapter": 3,
-            "Size Before": 4,
-            "Progress": 5,
-            "Size After": 6,
-
-        }
-        self.setColumnCount(len(self.column_ids))
-        self.setRowCount(0)
+        self.name_column_content_width = None  # type: int
+        self.column_ids = JOB_QUEUE_COLUMNS_IDS
+        self.jobs_model = JobQueueModel(parent=self)
+        self.setModel(self.jobs_model)
+        self.progress_aggregator = MuxingProgressAggregator(parent=self)
+        self.setItemDelegate(JobQueueDelegate(self))
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.create_horizontal_header()
         self.setup_horizontal_header()
-        self.setup_columns()
         self.connect_signals()
 
     def setup_horizontal_header(self):
@@ -120,81 +69,45 @@ class JobQueueTable(TableWidget):
     def create_horizontal_header(self):
         self.horizontal_header = self.horizontalHeader()
 
-    def setup_columns(self):
-        column = QTableWidgetItem("Name")
-        column.setTextAlignment(Qt.AlignLeft)
-        self.setHorizontalHeaderItem(self.column_ids["Name"], column)
-
-        column = QTableWidgetItem("Status")
-        column.setTextAlignment(Qt.AlignCenter)
-        self.setHorizontalHeaderItem(self.column_ids["Status"], column)
-
-        column = QTableWidgetItem("Subtitle")
-        column.setTextAlignment(Qt.AlignCenter)
-        self.setHorizontalHeaderItem(self.column_ids["Subtitle"], column)
-
-        column = QTableWidgetItem("Chapter")
-        column.setTextAlignment(Qt.AlignCenter)
-        self.setHorizontalHeaderItem(self.column_ids["Chapter"], column)
-
-        column = QTableWidgetItem("Size Before")
-        column.setTextAlignment(Qt.AlignLeft)
-        self.setHorizontalHeaderItem(self.column_ids["Size Before"], column)
-
-        column = QTableWidgetItem("Progress")
-        column.setTextAlignment(Qt.AlignLeft)
-        self.setHorizontalHeaderItem(self.column_ids["Progress"], column)
-
-        column = QTableWidgetItem("Size After")
-        column.setTextAlignment(Qt.AlignLeft)
-        self.setHorizontalHeaderItem(self.column_ids["Size After"], column)
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self.name_column_content_width = None
+        super().changeEvent(event)
 
     def connect_signals(self):
         self.horizontalHeader().sectionHandleDoubleClicked.connect(
             self.resize_name_column_to_fit_content)
-        self.horizontalHeader().sectionResized.connect(self.resize_column)
-        self.cellDoubleClicked.connect(self.cell_double_clicked)
-
-    def set_row_value_id(self, new_row_id):
-        vertical_header_item = QTableWidgetItem(str(new_row_id + 1))
-        vertical_header_item.setTextAlignment(Qt.AlignCenter)
-        self.setVerticalHeaderItem(new_row_id, vertical_header_item)
+        self.doubleClicked.connect(self.cell_double_clicked)
+        self.progress_aggregator.progress_flushed_signal.connect(self.update_progress)
 
     def set_row_value_size_before_muxing(self, new_job, new_row_id):
-        new_job.size_before_muxing = " " + GlobalSetting.VIDEO_FILES_SIZE_LIST[new_row_id]
-        self.setCellWidget(new_row_id, self.column_ids["Size Before"], QLabel(new_job.size_before_muxing))
+        new_job.size_before_muxing = GlobalSetting.VIDEO_FILES_SIZE_LIST[new_row_id]
+
+    @staticmethod
+    def get_output_video_name_absolute(job: SingleJobData):
+        if job.used_mkvpropedit:
+            return Path(job.video_name_absolute)
+        folder_path = Path(GlobalSetting.DESTINATION_FOLDER_PATH)
+        output_video_name = Path(change_file_extension_to_mkv(job.video_name))
+        return os.path.join(folder_path, output_video_name)
 
     def set_row_value_size_after_muxing(self, finished_job: SingleJobData, row_index):
-        if finished_job.used_mkvpropedit:
-            output_video_name_absolute = Path(finished_job.video_name_absolute)
-        else:
-            folder_path = Path(GlobalSetting.DESTINATION_FOLDER_PATH)
-            output_video_name = Path(change_file_extension_to_mkv(finished_job.video_name))
-            output_video_name_absolute = os.path.join(folder_path, output_video_name)
+        output_video_name_absolute = self.get_output_video_name_absolute(finished_job)
         try:
             output_video_size_bytes = os.path.getsize(output_video_name_absolute)
-        except:
+        except OSError:
             output_video_size_bytes = 0
         if output_video_size_bytes == 0:
-            self.delete_video_output_with_zero_size(file_path=output_video_name_absolute)
-        size_after_muxing = " " + get_readable_filesize(output_video_size_bytes)
-        self.setCellWidget(row_index, self.column_ids["Size After"], QLabel(size_after_muxing))
+            self.delete_job_output(finished_job)
+        self.jobs_model.set_size_after_muxing(row_index, get_readable_filesize(output_video_size_bytes))
 
     def set_row_value_chapter(self, new_job, new_row_id):
         if len(GlobalSetting.CHAPTER_FILES_LIST) > new_row_id:
             new_job.chapter_found = True
             new_job.chapter_name = GlobalSetting.CHAPTER_FILES_LIST[new_row_id]
             new_job.chapter_name_absolute = GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST[new_row_id]
-            self.setCellWidget(new_row_id, self.column_ids["Chapter"],
-                               InfoCell(tool_tip=generate_tool_tip_for_chapter_file(
-                                   chapter_full_path=new_job.chapter_name_absolute,
-                                   chapter_name=new_job.chapter_name,
-                                   show_full_path=False)))
-
         else:
             new_job.chapter_found = False
-            self.setCellWidget(new_row_id, self.column_ids["Chapter"],
-                               WarningCell(tool_tip="No Chapter File"))
 
     def set_row_value_subtitle(self, new_job, new_row_id):
         if len(GlobalSetting.SUBTITLE_FILES_LIST) > new_row_id:
@@ -206,70 +119,35 @@ class JobQueueTable(TableWidget):
             new_job.subtitle_track_name = GlobalSetting.SUBTITLE_TRACK_NAME
             new_job.subtitle_set_default = GlobalSetting.SUBTITLE_SET_DEFAULT
             new_job.subtitle_set_forced = GlobalSetting.SUBTITLE_SET_FORCED
-            self.setCellWidget(new_row_id, self.column_ids["Subtitle"],
-                               InfoWithOptionsCell(tool_tip=generate_tool_tip_for_subtitle_file(
-                                   subtitle_full_path=new_job.subtitle_name_absolute,
-                                   subtitle_name=new_job.subtitle_name,
-                                   subtitle_delay=new_job.subtitle_delay,
-                                   subtitle_language=new_job.subtitle_language,
-                                   subtitle_track_name=new_job.subtitle_track_name,
-                                   subtitle_set_default=new_job.subtitle_set_default,
-                                   subtitle_set_forced=new_job.subtitle_set_forced,
-                                   show_full_path=False)))
-
         else:
             new_job.subtitle_found = False
-            self.setCellWidget(new_row_id, self.column_ids["Subtitle"],
-                               WarningCell(tool_tip="No Subtitle File"))
-
-    def set_row_value_progressBar(self, new_job, new_row_id):
-        new_job.progress = 0
-        self.setCellWidget(new_row_id, self.column_ids["Progress"], ProgressBar(value=new_job.progress))
 
     def set_row_value_name(self, new_job, new_row_id):
         new_job.video_name = GlobalSetting.VIDEO_FILES_LIST[new_row_id]
         new_job.video_name_absolute = GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST[new_row_id]
-        new_job.video_name_with_spaces = " " + new_job.video_name + "   "
-        new_job.video_name_displayed = chr(0x200E) + new_job.video_name_with_spaces
-        self.setCellWidget(new_row_id, self.column_ids["Name"], QLabel(new_job.video_name_displayed))
+
+    def get_name_column_content_width(self):
+        # the names are measured once per queue and font, the queue is built again when its videos change
+        if self.name_column_content_width is None:
+            column_font_metrics = QFontMetrics(self.font())
+            self.name_column_content_width = max((column_font_metrics.horizontalAdvance(get_job_name_text(job))
+                                                  for job in self.data), default=0)
+        return self.name_column_content_width
 
     def check_if_name_need_resize_column_to_fit_content(self):
-        new_column_width = 0
-        for i in range(self.rowCount()):
-            column_font = self.cellWidget(i, self.column_ids["Name"]).font()
-            column_font_metrics = QFontMetrics(column_font)
-            new_column_width = max(new_column_width,
-                                   column_font_metrics.horizontalAdvance(self.data[i].video_name_with_spaces))
+        new_column_width = self.get_name_column_content_width()
         if new_column_width > self.columnWidth(self.column_ids["Name"]):
-            self.resize_name_column_to_fit_content()
+            self.setColumnWidth(self.column_ids["Name"], new_column_width)
 
     def resize_name_column_to_fit_content(self):
-        # Resize Name Column Only
-        new_column_width = 0
-        for i in range(self.rowCount()):
-            column_font = self.cellWidget(i, self.column_ids["Name"]).font()
-            column_font_metrics = QFontMetrics(column_font)
-            new_column_width = max(new_column_width,
-                                   column_font_metrics.horizontalAdvance(self.data[i].video_name_with_spaces))
+        # Resize Name Column Only, the view elides the names that do not fit when it paints them
+        new_column_width = self.get_name_column_content_width()
         if new_column_width != 0:
             self.setColumnWidth(self.column_ids["Name"], new_column_width)
-        for i in range(self.rowCount()):
-            self.data[i].video_name_displayed = chr(0x200E) + self.data[i].video_name_with_spaces
-            self.cellWidget(i, self.column_ids["Name"]).setText(self.data[i].video_name_displayed)
-
-    def resize_column(self, column_index):
-        if column_index == self.column_ids["Name"]:
-            for i in range(self.rowCount()):
-                metrics = QFontMetrics(
-                    self.cellWidget(i, self.column_ids["Name"]).font())
-                elided_text = metrics.elidedText(
-                    self.data[i].video_name_with_spaces, Qt.ElideRight,
-                    self.columnWidth(self.column_ids["Name"]))
-                self.data[i].video_name_displayed = chr(0x200E) + elided_text
-                self.cellWidget(i, self.column_ids["Name"]).setText(self.data[i].video_name_displayed)
-        self.update()
-
-    def cell_double_clicked(self, row_index, column_index):
+
+    def cell_double_clicked(self, index: QModelIndex):
+        row_index = index.row()
+        column_index = index.column()
         if column_index == self.column_ids["Subtitle"]:
             if self.data[row_index].subtitle_found:
                 subtitle_info_dialog = SubtitleInfoDialog(
@@ -295,16 +173,7 @@ class JobQueueTable(TableWidget):
                     self.data[row_index].subtitle_track_name = subtitle_info_dialog.current_subtitle_track_name
                     self.data[row_index].subtitle_set_default = subtitle_info_dialog.current_subtitle_set_default
                     self.data[row_index].subtitle_set_forced = subtitle_info_dialog.current_subtitle_set_forced
-                    current_cell_widget = self.cellWidget(row_index, self.column_ids["Subtitle"])
-                    current_cell_widget.update_tool_tip(tool_tip=generate_tool_tip_for_subtitle_file(
-                        subtitle_full_path=GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST[row_index],
-                        subtitle_name=GlobalSetting.SUBTITLE_FILES_LIST[row_index],
-                        subtitle_delay=self.data[row_index].subtitle_delay,
-                        subtitle_language=self.data[row_index].subtitle_language,
-                        subtitle_track_name=self.data[row_index].subtitle_track_name,
-                        subtitle_set_default=self.data[row_index].subtitle_set_default,
-                        subtitle_set_forced=self.data[row_index].subtitle_set_forced,
-                        show_full_path=False))
+                    self.jobs_model.update_job_row(row_index)
 
             else:
                 warning_dialog = WarningDialog(window_title="Subtitle Info", info_message="No subtitle found!")
@@ -352,19 +221,15 @@ class JobQueueTable(TableWidget):
 
     def setup_queue(self):
         self.clear_queue()
-        self.hide()
-        self.setRowCount(len(GlobalSetting.VIDEO_FILES_LIST))
         for i in range(len(GlobalSetting.VIDEO_FILES_LIST)):
             new_row_id = i
             new_job = SingleJobData()
-            self.set_row_value_id(new_row_id)
             self.set_row_value_name(new_job, new_row_id)
             self.set_row_value_subtitle(new_job, new_row_id)
             self.set_row_value_chapter(new_job, new_row_id)
             self.set_row_value_size_before_muxing(new_job, new_row_id)
-            self.set_row_value_progressBar(new_job, new_row_id)
             self.data.append(new_job)
-        self.show()
+        self.jobs_model.show_jobs(self.data)
         self.check_if_name_need_resize_column_to_fit_content()
         # self.resize_name_column_to_fit_content()
         self.update_widget()
@@ -381,7 +246,7 @@ class JobQueueTable(TableWidget):
     # noinspection PyAttributeOutsideInit
     def start_muxing(self):
         self.start_muxing_thread = QThread()
-        self.start_muxing_worker = StartMuxingWorker(self.data)
+        self.start_muxing_worker = StartMuxingWorker(self.data, self.progress_aggregator)
         self.start_muxing_worker.moveToThread(self.start_muxing_thread)
         self.start_muxing_thread.started.connect(self.start_muxing_worker.run)
         self.start_muxing_worker.finished_paused_signal.connect(self.start_muxing_thread.quit)
@@ -390,48 +255,34 @@ class JobQueueTable(TableWidget):
         self.start_muxing_worker.finished_all_jobs_signal.connect(self.finished_all_jobs)
         self.start_muxing_worker.finished_paused_signal.connect(self.start_muxing_worker.deleteLater)
         self.start_muxing_worker.finished_paused_signal.connect(self.paused_done)
-        self.start_muxing_worker.cancel_signal.connect(self.start_muxing_thread.quit)
-        self.start_muxing_worker.cancel_signal.connect(self.start_muxing_worker.deleteLater)
         self.start_muxing_thread.finished.connect(self.start_muxing_thread.deleteLater)
-        self.start_muxing_worker.mkvpropedit_good_signal.connect(self.show_confirm_using_mkvpropedit)
-        self.start_muxing_worker.progress_signal.connect(self.update_progress)
         self.start_muxing_worker.job_started_signal.connect(self.new_job_started)
         self.start_muxing_worker.job_succeeded_signal.connect(self.job_done_successfully)
         self.start_muxing_worker.job_failed_signal.connect(self.job_error_occurred)
+        self.start_muxing_worker.job_stopped_signal.connect(self.job_stopped)
         self.start_muxing_worker.pause_from_error_occurred_signal.connect(self.pause_from_error_occurred)
         self.start_muxing_thread.start()
 
     def clear_queue(self):
         self.data = []  # type: list[SingleJobData]
-        self.setRowCount(0)
+        self.name_column_content_width = None
+        self.jobs_model.clear_jobs()
+        self.progress_aggregator.clear()
         self.total_progress = 0
         self.number_of_jobs = 0
         self.number_of_done_jobs = 0
         GlobalSetting.JOB_QUEUE_EMPTY = True
 
-    def show_confirm_using_mkvpropedit(self):
-        confirm_dialog = ConfirmUsingMkvpropedit()
-        confirm_dialog.execute()
-        if confirm_dialog.result == "mkvpropedit":
-            self.start_muxing_worker.use_mkvpropedit = True
-            self.start_muxing_worker.waiting_for_mkvpropedit_confirm = False
-        elif confirm_dialog.result == "mkvmerge":
-            self.start_muxing_worker.use_mkvpropedit = False
-            self.start_muxing_worker.use_mkvmerge = True
-            self.start_muxing_worker.waiting_for_mkvpropedit_confirm = False
-        else:
-            self.start_muxing_worker.cancel = True
-            self.start_muxing_worker.use_mkvpropedit = False
-            self.start_muxing_worker.use_mkvmerge = False
-            self.start_muxing_worker.waiting_for_mkvpropedit_confirm = False
-            if self.start_muxing_worker.current_job == 0:
-                self.cancel_done_signal.emit()
-            else:
-                self.paused_done_signal.emit()
+    def update_progress(self, params_list):
+        # the last change of every job since the previous flush, the total is sent once for all of them
+        for params in params_list:
+            self.update_job_progress(params)
+        self.update_total_progress_signal.emit(self.total_progress // self.number_of_jobs)
 
-    def update_progress(self, params: MuxingParams):
+    def update_job_progress(self, params: MuxingParams):
         job_index = params.index
         new_progress = params.progress
+        self.data[job_index].number_of_warnings = params.warnings
         if params.error:
             self.data[job_index].done = True
             self.data[job_index].error_occurred = True
@@ -439,25 +290,18 @@ class JobQueueTable(TableWidget):
             if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
                 self.start_muxing_worker.pause = True
             self.set_job_status_bad(row_index=job_index)
-            self.update_muxing_progress(job_index, 0, params)
+            self.update_muxing_progress(job_index, 0)
         else:
-            self.update_muxing_progress(job_index, new_progress, params)
+            self.update_muxing_progress(job_index, new_progress)
 
-    def update_muxing_progress(self, job_index, new_progress, params):
+    def update_muxing_progress(self, job_index, new_progress):
         self.total_progress -= self.data[job_index].progress
         self.data[job_index].progress = new_progress
-        self.update_status_job_widget(new_progress)
         self.total_progress += self.data[job_index].progress
-        self.cellWidget(params.index, self.column_ids["Progress"]).setValue(new_progress)
-        self.update_total_progress_signal.emit(self.total_progress // self.number_of_jobs)
-
-    def update_status_job_widget(self, new_progress):
-        try:
-            self.job_status_widget.update_progress(new_progress=new_progress)
-        except:
-            pass
+        self.jobs_model.update_job_row(job_index)
 
     def job_done_successfully(self, job_index):
+        self.progress_aggregator.finish_job(job_index)
         self.data[job_index].done = True
         self.number_of_done_jobs += 1
         self.increase_number_of_done_jobs_signal.emit()
@@ -465,6 +309,7 @@ class JobQueueTable(TableWidget):
         self.set_row_value_size_after_muxing(self.data[job_index], job_index)
 
     def job_error_occurred(self, job_index):
+        self.progress_aggregator.finish_job(job_index)
         self.data[job_index].done = True
         self.data[job_index].error_occurred = True
         if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
@@ -472,22 +317,23 @@ class JobQueueTable(TableWidget):
         self.set_job_status_bad(row_index=job_index)
         self.set_row_value_size_after_muxing(self.data[job_index], job_index)
 
+    def job_stopped(self, job_index):
+        # killed because another job failed, it goes back to waiting and its unfinished output is removed
+        self.progress_aggregator.finish_job(job_index)
+        self.update_muxing_progress(job_index, 0)
+        self.update_total_progress_signal.emit(self.total_progress // self.number_of_jobs)
+        self.jobs_model.finish_job(job_index)
+        self.delete_job_output(self.data[job_index])
+
     def set_job_status_ok(self, row_index):
-        self.job_status_widget.stop_loading()
-        self.cellWidget(row_index, self.column_ids["Status"]).deleteLater()
-        self.setCellWidget(row_index, self.column_ids["Status"], OkCell(tool_tip="Done"))
+        self.jobs_model.finish_job(row_index)
 
     def set_job_status_bad(self, row_index):
-        self.job_status_widget.stop_loading()
-        self.cellWidget(row_index, self.column_ids["Status"]).deleteLater()
-        self.setCellWidget(row_index, self.column_ids["Status"], ErrorCell(tool_tip="Error Happened\nDouble click for "
-                                                                                    "more details"))
+        self.jobs_model.finish_job(row_index)
 
-    # noinspection PyAttributeOutsideInit
     def new_job_started(self, row_index):
-        self.job_status_widget = StatusWidget()
-        self.setCellWidget(row_index, self.column_ids["Status"], self.job_status_widget)
-        self.job_status_widget.start_loading()
+        self.jobs_model.start_job(row_index)
+        self.progress_aggregator.start_job(row_index)
 
     def pause_muxing(self):
         self.start_muxing_worker.pause = True
@@ -501,8 +347,14 @@ class JobQueueTable(TableWidget):
     def pause_from_error_occurred(self):
         self.pause_from_error_occurred_signal.emit()
 
-    def delete_video_output_with_zero_size(self, file_path):
+    def delete_job_output(self, job: SingleJobData):
+        # the output of a job editing in place is the source video itself, it is never deleted
+        if job.used_mkvpropedit:
+            return
+        self.delete_video_output(file_path=self.get_output_video_name_absolute(job))
+
+    def delete_video_output(self, file_path):
         try:
             os.remove(file_path)
-        except:
+        except OSError:
             pass
@@ -0,0 +1,131 @@
+import json
+import mmap
+import os
+import zlib
+
+from packages.Tabs.MuxSetting.Widgets.MatroskaHeaderReader import TRACKS_ID, iterate_child_elements, \
+    read_top_level_element, read_tracks_entries
+
+CRC_32_ID = 0xBF
+FLAGS_TRACK_ENTRY_KEYS = {"flag-default": "default_track", "flag-forced": "forced_track"}
+
+
+def read_flags_edits(job_file_path):
+    # reads the options file of a mkvpropedit job, returns the video with the flags to set as
+    # {(track index, track entry key): value}, or None when the job changes anything else than these flags
+    with open(job_file_path, "r", encoding="utf-8") as job_file:
+        options = json.load(job_file)
+    video_path = None
+    flags_edits = {}  # type: dict[tuple[int, str], bool]
+    track_index = None
+    option_index = 0
+    while option_index < len(options):
+        option = options[option_index]
+        if option == "--ui-language":
+            option_index += 1
+        elif option == "--edit":
+            option_index += 1
+            selector = options[option_index]
+            if not selector.startswith("track:") or not selector[len("track:"):].isdigit():
+                return None
+            track_index = int(selector[len("track:"):]) - 1
+        elif option == "--set":
+            option_index += 1
+            flag_name, _, flag_value = options[option_index].partition("=")
+            if track_index is None or flag_name not in FLAGS_TRACK_ENTRY_KEYS or flag_value not in ("0", "1"):
+                return None
+            flags_edits[(track_index, FLAGS_TRACK_ENTRY_KEYS[flag_name])] = flag_value == "1"
+        elif option != "--gui-mode":
+            if option.startswith("--") or video_path is not None:
+                return None
+            video_path = option
+        option_index += 1
+    if video_path is None:
+        return None
+    return video_path, flags_edits
+
+
+def get_crc_position(data, tracks_start, tracks_end):
+    # a crc-32 element has to be the first child, it covers everything after it in the tracks element
+    for element_id, data_start, data_end in iterate_child_elements(data, tracks_start, tracks_end):
+        if element_id == CRC_32_ID and data_end - data_start == 4:
+            return data_start, data_end
+        return None
+    return None
+
+
+def compute_crc(data, crc_position, tracks_end):
+    return zlib.crc32(data[crc_position[1]:tracks_end]).to_bytes(4, "little")
+
+
+def read_flags_layout(data):
+    # only the tracks are edited, they are enough even when the walk stopped before the end of the segment
+    tracks_entries, elements_positions, hidden_rest_position = read_tracks_entries(data)
+    tracks_start, tracks_end = read_top_level_element(data, elements_positions, TRACKS_ID)
+    crc_position = get_crc_position(data, tracks_start, tracks_end)
+    if crc_position is not None and data[crc_position[0]:crc_position[1]] != compute_crc(data, crc_position,
+                                                                                        tracks_end):
+        raise ValueError("the crc of the tracks does not match")
+    return tracks_entries, tracks_end, crc_position
+
+
+def write_flags_edits(data, flags_edits):
+    # every flag is checked before the first byte is written, a missing flag would need the track entry
+    # to grow so the whole job is left to mkvpropedit and the file stays as it was
+    # returns the bytes it replaced as [(position, original bytes)]
+    tracks_entries, tracks_end, crc_position = read_flags_layout(data)
+    values_positions = []
+    for (track_index, track_entry_key), value in flags_edits.items():
+        if track_index >= len(tracks_entries):
+            raise ValueError("track " + str(track_index + 1) + " does not exist")
+        value_position = tracks_entries[track_index][track_entry_key + "_value_position"]
+        if value_position is None or value_position[0] == value_position[1]:
+            raise ValueError("track " + str(track_index + 1) + " has no " + track_entry_key + " value to change")
+        values_positions.append((value_position, value))
+    original_values = []
+    for (value_start, value_end), value in values_positions:
+        original_values.append((value_start, data[value_start:value_end]))
+        data[value_start:value_end] = int(value).to_bytes(value_end - value_start, "big")
+    if crc_position is not None:
+        original_values.append((crc_position[0], data[crc_position[0]:crc_position[1]]))
+        data[crc_position[0]:crc_position[1]] = compute_crc(data, crc_position, tracks_end)
+    return original_values
+
+
+def restore_original_values(data, original_values):
+    for value_start, value_bytes in reversed(original_values):
+        data[value_start:value_start + len(value_bytes)] = value_bytes
+
+
+def check_flags_edits(data, flags_edits):
+    tracks_entries, tracks_end, crc_position = read_flags_layout(data)
+    for (track_index, track_entry_key), value in flags_edits.items():
+        if tracks_entries[track_index][track_entry_key] != value:
+            raise ValueError("track " + str(track_index + 1) + " did not get its " + track_entry_key)
+
+
+# sets the default and forced flags of a mkvpropedit job right in the video, through mmap and without starting
+# mkvpropedit, the flags keep their size so nothing else in the file moves
+# returns False when mkvpropedit has to do the job: other options, a flag not written in the file, a bad crc
+def edit_flags_in_place(job_file_path):
+    try:
+        flags_job = read_flags_edits(job_file_path)
+        if flags_job is None:
+            return False
+        video_path, flags_edits = flags_job
+        with open(video_path, "r+b") as video_file:
+            with mmap.mmap(video_file.fileno(), 0, access=mmap.ACCESS_WRITE) as data:
+                original_values = write_flags_edits(data, flags_edits)
+                try:
+                    check_flags_edits(data, flags_edits)
+                except (ValueError, IndexError, KeyError):
+                    # mkvpropedit gets the file as it was before this attempt
+                    restore_original_values(data, original_values)
+                    raise
+                finally:
+                    data.flush()
+        # writes through a mapping do not always update the modification time, the probe cache keys on it
+        os.utime(video_path)
+        return True
+    except (OSError, ValueError, IndexError, KeyError):
+        return False
@@ -0,0 +1,293 @@
+import mmap
+
+EBML_ID = 0x1A45DFA3
+DOC_TYPE_ID = 0x4282
+SEGMENT_ID = 0x18538067
+SEEK_HEAD_ID = 0x114D9B74
+SEEK_ID = 0x4DBB
+SEEK_ELEMENT_ID = 0x53AB
+SEEK_POSITION_ID = 0x53AC
+CLUSTER_ID = 0x1F43B675
+TRACKS_ID = 0x1654AE6B
+TRACK_ENTRY_ID = 0xAE
+TRACK_NUMBER_ID = 0xD7
+TRACK_UID_ID = 0x73C5
+TRACK_TYPE_ID = 0x83
+CODEC_ID_ID = 0x86
+TRACK_NAME_ID = 0x536E
+LANGUAGE_ID = 0x22B59C
+LANGUAGE_BCP47_ID = 0x22B59D
+FLAG_ENABLED_ID = 0xB9
+FLAG_DEFAULT_ID = 0x88
+FLAG_FORCED_ID = 0x55AA
+ATTACHMENTS_ID = 0x1941A469
+ATTACHED_FILE_ID = 0x61A7
+FILE_NAME_ID = 0x466E
+FILE_MIME_TYPE_ID = 0x4660
+FILE_DATA_ID = 0x465C
+FILE_UID_ID = 0x46AE
+
+MATROSKA_DOC_TYPES = ("matroska", "webm")
+TRACK_TYPES_NAMES = {1: "video", 2: "audio", 17: "subtitles", 18: "buttons"}
+UNKNOWN_SIZE = -1
+
+
+def read_element_id(data, position):
+    first_byte = data[position]
+    id_length = 9 - first_byte.bit_length()
+    if id_length > 4:
+        raise ValueError("invalid element id at " + str(position))
+    return int.from_bytes(data[position:position + id_length], "big"), position + id_length
+
+
+def read_element_size(data, position):
+    first_byte = data[position]
+    size_length = 9 - first_byte.bit_length()
+    if size_length > 8:
+        raise ValueError("invalid element size at " + str(position))
+    element_size = int.from_bytes(data[position:position + size_length], "big") & ((1 << (7 * size_length)) - 1)
+    if element_size == (1 << (7 * size_length)) - 1:
+        element_size = UNKNOWN_SIZE
+    return element_size, position + size_length
+
+
+def read_element_header(data, position):
+    element_id, data_start = read_element_id(data, position)
+    element_size, data_start = read_element_size(data, data_start)
+    return element_id, element_size, data_start
+
+
+def iterate_child_elements(data, start, end):
+    # yields the id, the data start and the data end of every child, a child is never allowed past its parent
+    position = start
+    while position < end:
+        element_id, element_size, data_start = read_element_header(data, position)
+        data_end = data_start + element_size
+        if element_size == UNKNOWN_SIZE or data_end > end:
+            raise ValueError("element " + hex(element_id) + " does not fit in its parent")
+        yield element_id, data_start, data_end
+        position = data_end
+
+
+def read_unsigned_integer(data, start, end):
+    if end - start > 8:
+        raise ValueError("unsigned integer longer than 8 bytes at " + str(start))
+    return int.from_bytes(data[start:end], "big")
+
+
+def read_string(data, start, end):
+    return data[start:end].rstrip(b"\0").decode("utf-8", errors="replace")
+
+
+def read_doc_type(data, start, end):
+    doc_type = "matroska"
+    for element_id, data_start, data_end in iterate_child_elements(data, start, end):
+        if element_id == DOC_TYPE_ID:
+            doc_type = read_string(data, data_start, data_end)
+    return doc_type
+
+
+def find_segment(data):
+    element_id, element_size, data_start = read_element_header(data, 0)
+    if element_id != EBML_ID or element_size == UNKNOWN_SIZE:
+        raise ValueError("not an ebml file")
+    if read_doc_type(data, data_start, data_start + element_size) not in MATROSKA_DOC_TYPES:
+        raise ValueError("not a matroska file")
+    position = data_start + element_size
+    while position < len(data):
+        element_id, element_size, data_start = read_element_header(data, position)
+        if element_id == SEGMENT_ID:
+            segment_end = len(data) if element_size == UNKNOWN_SIZE else min(data_start + element_size, len(data))
+            return data_start, segment_end
+        if element_size == UNKNOWN_SIZE:
+            break
+        position = data_start + element_size
+    raise ValueError("no segment found")
+
+
+def read_seek_head(data, start, end, segment_start):
+    seek_positions = []
+    for element_id, data_start, data_end in iterate_child_elements(data, start, end):
+        if element_id != SEEK_ID:
+            continue
+        seek_element_id = None
+        seek_position = None
+        for child_id, child_start, child_end in iterate_child_elements(data, data_start, data_end):
+            if child_id == SEEK_ELEMENT_ID:
+                seek_element_id = read_unsigned_integer(data, child_start, child_end)
+            elif child_id == SEEK_POSITION_ID:
+                seek_position = read_unsigned_integer(data, child_start, child_end)
+        if seek_element_id is not None and seek_position is not None:
+            seek_positions.append((seek_element_id, segment_start + seek_position))
+    return seek_positions
+
+
+def find_top_level_elements(data, segment_start, segment_end):
+    # the level 1 elements before the first cluster are read in order, the seek heads tell where the
+    # others are so the clusters are only walked through when the file has no seek head
+    # the second value is where the walk had to stop without a seek head, None when it read the whole segment
+    elements_positions = {}  # type: dict[int, int]
+    seek_positions = []
+    hidden_rest_position = None
+    position = segment_start
+    while position < segment_end:
+        element_id, element_size, data_start = read_element_header(data, position)
+        elements_positions.setdefault(element_id, position)
+        if element_size == UNKNOWN_SIZE or data_start + element_size > segment_end:
+            # the walk cannot go past this element, what follows it is only known from a seek head
+            if len(seek_positions) == 0:
+                hidden_rest_position = position
+            break
+        if element_id == SEEK_HEAD_ID:
+            seek_positions.extend(read_seek_head(data, data_start, data_start + element_size, segment_start))
+        elif element_id == CLUSTER_ID and len(seek_positions) > 0:
+            break
+        position = data_start + element_size
+    read_seek_heads_positions = set()
+    while len(seek_positions) > 0:
+        seek_element_id, seek_position = seek_positions.pop(0)
+        elements_positions.setdefault(seek_element_id, seek_position)
+        if seek_element_id == SEEK_HEAD_ID and seek_position not in read_seek_heads_positions:
+            read_seek_heads_positions.add(seek_position)
+            element_id, element_size, data_start = read_element_header(data, seek_position)
+            if element_id == SEEK_HEAD_ID and element_size != UNKNOWN_SIZE:
+                seek_positions.extend(read_seek_head(data, data_start, data_start + element_size, segment_start))
+    return elements_positions, hidden_rest_position
+
+
+def read_top_level_element(data, elements_positions, element_id):
+    # returns the data start and end of a level 1 element, or None when the file does not have it
+    position = elements_positions.get(element_id)
+    if position is None:
+        return None
+    found_element_id, element_size, data_start = read_element_header(data, position)
+    if found_element_id != element_id or element_size == UNKNOWN_SIZE or data_start + element_size > len(data):
+        raise ValueError("the seek head points to a wrong element for " + hex(element_id))
+    return data_start, data_start + element_size
+
+
+def read_track_entry(data, start, end):
+    # the defaults are the ones of the matroska specifications, a missing language is eng once the bcp47 one
+    # is checked, the flags keep where their values are in the file
+    track_entry = {
+        "number": 0,
+        "uid": 0,
+        "type": 0,
+        "codec_id": "",
+        "track_name": None,
+        "language": None,
+        "language_bcp47": None,
+        "enabled_track": True,
+        "default_track": True,
+        "forced_track": False,
+        "default_track_value_position": None,
+        "forced_track_value_position": None,
+    }
+    for element_id, data_start, data_end in iterate_child_elements(data, start, end):
+        if element_id == TRACK_NUMBER_ID:
+            track_entry["number"] = read_unsigned_integer(data, data_start, data_end)
+        elif element_id == TRACK_UID_ID:
+            track_entry["uid"] = read_unsigned_integer(data, data_start, data_end)
+        elif element_id == TRACK_TYPE_ID:
+            track_entry["type"] = read_unsigned_integer(data, data_start, data_end)
+        elif element_id == CODEC_ID_ID:
+            track_entry["codec_id"] = read_string(data, data_start, data_end)
+        elif element_id == TRACK_NAME_ID:
+            track_entry["track_name"] = read_string(data, data_start, data_end)
+        elif element_id == LANGUAGE_ID:
+            track_entry["language"] = read_string(data, data_start, data_end)
+        elif element_id == LANGUAGE_BCP47_ID:
+            track_entry["language_bcp47"] = read_string(data, data_start, data_end)
+        elif element_id == FLAG_ENABLED_ID:
+            track_entry["enabled_track"] = read_unsigned_integer(data, data_start, data_end) != 0
+        elif element_id == FLAG_DEFAULT_ID:
+            track_entry["default_track"] = read_unsigned_integer(data, data_start, data_end) != 0
+            track_entry["default_track_value_position"] = (data_start, data_end)
+        elif element_id == FLAG_FORCED_ID:
+            track_entry["forced_track"] = read_unsigned_integer(data, data_start, data_end) != 0
+            track_entry["forced_track_value_position"] = (data_start, data_end)
+    return track_entry
+
+
+def read_tracks_entries(data):
+    segment_start, segment_end = find_segment(data)
+    elements_positions, hidden_rest_position = find_top_level_elements(data, segment_start, segment_end)
+    tracks_range = read_top_level_element(data, elements_positions, TRACKS_ID)
+    if tracks_range is None:
+        raise ValueError("no tracks found")
+    tracks_entries = [read_track_entry(data, data_start, data_end)
+                      for element_id, data_start, data_end in iterate_child_elements(data, *tracks_range)
+                      if element_id == TRACK_ENTRY_ID]
+    return tracks_entries, elements_positions, hidden_rest_position
+
+
+def read_attachments(data, elements_positions):
+    attachments_range = read_top_level_element(data, elements_positions, ATTACHMENTS_ID)
+    if attachments_range is None:
+        return []
+    attachments = []
+    for element_id, data_start, data_end in iterate_child_elements(data, *attachments_range):
+        if element_id != ATTACHED_FILE_ID:
+            continue
+        attachment = {"id": len(attachments) + 1, "file_name": "", "content_type": "", "size": 0,
+                      "properties": {}}
+        for child_id, child_start, child_end in iterate_child_elements(data, data_start, data_end):
+            if child_id == FILE_NAME_ID:
+                attachment["file_name"] = read_string(data, child_start, child_end)
+            elif child_id == FILE_MIME_TYPE_ID:
+                attachment["content_type"] = read_string(data, child_start, child_end)
+            elif child_id == FILE_DATA_ID:
+                attachment["size"] = child_end - child_start
+            elif child_id == FILE_UID_ID:
+                attachment["properties"]["uid"] = read_unsigned_integer(data, child_start, child_end)
+        attachments.append(attachment)
+    return attachments
+
+
+def get_mkvmerge_track(track_id, track_entry):
+    track_properties = {
+        "number": track_entry["number"],
+        "uid": track_entry["uid"],
+        "codec_id": track_entry["codec_id"],
+        "language": track_entry["language"] or "eng",
+        "enabled_track": track_entry["enabled_track"],
+        "default_track": track_entry["default_track"],
+        "forced_track": track_entry["forced_track"],
+    }
+    if track_entry["language_bcp47"] is not None:
+        track_properties["language_ietf"] = track_entry["language_bcp47"]
+    if track_entry["track_name"] is not None:
+        track_properties["track_name"] = track_entry["track_name"]
+    return {"id": track_id, "type": TRACK_TYPES_NAMES[track_entry["type"]], "properties": track_properties}
+
+
+def read_mkvmerge_like_info(data):
+    tracks_entries, elements_positions, hidden_rest_position = read_tracks_entries(data)
+    if hidden_rest_position is not None and ATTACHMENTS_ID not in elements_positions:
+        # the attachments could be after the element the walk stopped at, a partial answer would lose them
+        raise ValueError("the attachments are left to mkvmerge, the segment is hidden from " +
+                         str(hidden_rest_position))
+    for track_entry in tracks_entries:
+        # mkvmerge numbers every track it knows and turns a bcp47 only language into an iso 639-2 one,
+        # the files with other tracks or with such languages are left to it
+        if track_entry["type"] not in TRACK_TYPES_NAMES or \
+                (track_entry["language_bcp47"] is not None and track_entry["language"] is None):
+            raise ValueError("track " + str(track_entry["number"]) + " is left to mkvmerge")
+    return {
+        "container": {"recognized": True, "supported": True, "type": "Matroska"},
+        "tracks": [get_mkvmerge_track(track_id, track_entry) for track_id, track_entry in enumerate(tracks_entries)],
+        "attachments": read_attachments(data, elements_positions),
+        "errors": [],
+        "warnings": [],
+    }
+
+
+# reads the tracks and the attachments of a matroska file from its headers, without starting mkvmerge
+# the result has the fields of mkvmerge -J that the jobs use, None means mkvmerge has to probe the file
+def read_matroska_info(file_path):
+    try:
+        with open(file_path, "rb") as video_file:
+            with mmap.mmap(video_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return read_mkvmerge_like_info(data)
+    except (OSError, ValueError, IndexError, KeyError):
+        return None
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+
+from packages.Startup import GlobalPaths
+from packages.Tabs.MuxSetting.Widgets.MatroskaHeaderReader import read_matroska_info
+
+
+def get_file_key(file_path):
+    file_path = os.path.abspath(file_path)
+    file_stat = os.stat(file_path)
+    key_string = "|".join([GlobalPaths.MKVMERGE_PATH, file_path, str(file_stat.st_size), str(file_stat.st_mtime_ns)])
+    return hashlib.sha1(key_string.encode("utf-8")).hexdigest()
+
+
+def run_mkvmerge_probe(file_path):
+    probe_process = subprocess.run([GlobalPaths.MKVMERGE_PATH, "-J", os.path.abspath(file_path)],
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return probe_process.returncode, json.loads(probe_process.stdout.decode("utf-8"))
+
+
+# keeps mkvmerge -J results on disk (one small json file per probed video) and the most used ones in memory
+# a video is probed again only when its path, size or modification time changes
+class MkvmergeProbeCache:
+    def __init__(self, cache_folder_path, max_memory_entries=256, max_disk_entries=5000):
+        self.cache_folder_path = cache_folder_path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.memory_cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.number_of_disk_entries = None  # type: int
+
+    def get_info(self, file_path):
+        key = get_file_key(file_path)
+        with self.lock:
+            self.setup_cache_folder()
+            info = self.get_from_memory(key)
+            if info is None:
+                info = self.get_from_disk(key)
+            if info is not None:
+                self.add_to_memory(key, info)
+                return info
+        exit_code, info = run_mkvmerge_probe(file_path)
+        if exit_code != 2:
+            with self.lock:
+                self.add_to_memory(key, info)
+                self.add_to_disk(key, info)
+        return info
+
+    # the cache folder is created and counted on the first probe instead of at import time
+    def setup_cache_folder(self):
+        if self.number_of_disk_entries is None:
+            os.makedirs(self.cache_folder_path, exist_ok=True)
+            self.number_of_disk_entries = len(os.listdir(self.cache_folder_path))
+
+    def get_cache_file_path(self, key):
+        return os.path.join(self.cache_folder_path, key + ".json")
+
+    def get_from_memory(self, key):
+        info = self.memory_cache.get(key)
+        if info is not None:
+            self.memory_cache.move_to_end(key)
+        return info
+
+    def add_to_memory(self, key, info):
+        self.memory_cache[key] = info
+        self.memory_cache.move_to_end(key)
+        while len(self.memory_cache) > self.max_memory_entries:
+            self.memory_cache.popitem(last=False)
+
+    def get_from_disk(self, key):
+        cache_file_path = self.get_cache_file_path(key)
+        try:
+            with open(cache_file_path, 'r', encoding="UTF-8") as cache_file:
+                info = json.load(cache_file)
+            os.utime(cache_file_path)  # mark it as recently used for the eviction
+            return info
+        except (OSError, ValueError):
+            return None
+
+    def add_to_disk(self, key, info):
+        cache_file_path = self.get_cache_file_path(key)
+        temp_cache_file_path = cache_file_path + ".tmp"
+        try:
+            with open(temp_cache_file_path, 'w', encoding="UTF-8") as cache_file:
+                json.dump(info, cache_file)
+            os.replace(temp_cache_file_path, cache_file_path)
+        except OSError:
+            return
+        self.number_of_disk_entries += 1
+        if self.number_of_disk_entries > self.max_disk_entries:
+            self.evict_least_recently_used_from_disk()
+
+    def evict_least_recently_used_from_disk(self):
+        cache_files = []
+        with os.scandir(self.cache_folder_path) as entries:
+            for entry in entries:
+                try:
+                    cache_files.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    pass
+        cache_files.sort()
+        number_of_files_to_remove = len(cache_files) - (self.max_disk_entries * 9 // 10)
+        for i in range(max(number_of_files_to_remove, 0)):
+            try:
+                os.remove(cache_files[i][1])
+            except OSError:
+                pass
+        self.number_of_disk_entries = len(cache_files) - max(number_of_files_to_remove, 0)
+
+    def clear(self):
+        with self.lock:
+            self.memory_cache.clear()
+            self.setup_cache_folder()
+            for file_name in os.listdir(self.cache_folder_path):
+                try:
+                    os.remove(os.path.join(self.cache_folder_path, file_name))
+                except OSError:
+                    pass
+            self.number_of_disk_entries = 0
+
+
+mkvmerge_probe_cache = MkvmergeProbeCache(GlobalPaths.ProbeCacheFolderPath)
+
+
+def get_mkvmerge_json_info(file_path):
+    # matroska files are read from their headers, mkvmerge is started and its answers cached for the others
+    info = read_matroska_info(file_path)
+    if info is None:
+        info = mkvmerge_probe_cache.get_info(file_path)
+    return info
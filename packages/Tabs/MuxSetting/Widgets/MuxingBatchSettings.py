@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+
+from packages.Startup.PreDefined import ISO_639_2_LANGUAGES
+from packages.Tabs.GlobalSetting import GlobalSetting
+from packages.Tabs.MuxSetting.Widgets.MuxingJsonOptions import add_double_quotation, add_json_line, \
+    fix_windows_backslash_path
+
+
+def get_only_keep_those_tracks(tracks, languages):
+    return tuple(tracks) + tuple(ISO_639_2_LANGUAGES[language] for language in languages)
+
+
+def get_checked_attachments(attachments_absolute_path_list, attachments_checking_list):
+    checked_attachments = []
+    for i in range(len(attachments_absolute_path_list)):
+        if attachments_checking_list[i]:
+            checked_attachments.append(attachments_absolute_path_list[i])
+    return tuple(checked_attachments)
+
+
+def generate_ui_language_command():
+    return add_double_quotation("--ui-language") + "," + add_json_line("en") + add_json_line("--gui-mode")
+
+
+def generate_only_keep_those_tracks_command(enabled, tracks, tracks_option, no_tracks_option):
+    if not enabled:
+        return ""
+    if len(tracks) == 0:
+        return add_json_line(no_tracks_option)
+    return add_json_line(tracks_option) + add_json_line(",".join(tracks))
+
+
+def generate_attachments_command(enabled, attachments, attach_option):
+    if not enabled:
+        return ""
+    attachments_command_list = []
+    for file_to_attach in attachments:
+        attachments_command_list.append(add_json_line(attach_option))
+        attachments_command_list.append(add_json_line(fix_windows_backslash_path(file_to_attach)))
+    return "".join(attachments_command_list)
+
+
+# frozen copy of everything a batch needs from GlobalSetting, taken once when muxing starts
+# the parts of the job files that are the same for every job are generated here only once
+@dataclass(frozen=True)
+class MuxingBatchSettings:
+    destination_folder_path: str
+    video_source_mkv_only: bool
+    have_subtitle_files: bool
+    subtitle_enabled: bool
+    chapter_enabled: bool
+    attachment_enabled: bool
+    attachment_discard_old: bool
+    attachments: tuple
+    only_keep_those_subtitles_enabled: bool
+    only_keep_those_subtitles: tuple
+    only_keep_those_audios_enabled: bool
+    only_keep_those_audios: tuple
+    make_this_subtitle_default_semi_enabled: bool
+    make_this_subtitle_default_full_enabled: bool
+    make_this_subtitle_default_track: str
+    make_this_audio_default_semi_enabled: bool
+    make_this_audio_default_full_enabled: bool
+    make_this_audio_default_track: str
+    edit_source_files: bool
+    ui_language_command: str
+    mkvmerge_discard_old_attachments_command: str
+    mkvmerge_attachments_attach_command: str
+    mkvmerge_specify_subtitle_track_command: str
+    mkvmerge_specify_audio_track_command: str
+    mkvpropedit_attachments_attach_command: str
+
+
+def generate_muxing_batch_settings(destination_folder_path, video_source_mkv_only, have_subtitle_files=False,
+                                   subtitle_enabled=True, chapter_enabled=False, attachment_enabled=False,
+                                   attachment_discard_old=False, attachments=(),
+                                   only_keep_those_subtitles_enabled=False, only_keep_those_subtitles=(),
+                                   only_keep_those_audios_enabled=False, only_keep_those_audios=(),
+                                   make_this_subtitle_default_semi_enabled=False,
+                                   make_this_subtitle_default_full_enabled=False, make_this_subtitle_default_track="",
+                                   make_this_audio_default_semi_enabled=False,
+                                   make_this_audio_default_full_enabled=False, make_this_audio_default_track="",
+                                   edit_source_files=False):
+    if attachment_enabled and attachment_discard_old:
+        mkvmerge_discard_old_attachments_command = add_json_line("--no-attachments")
+    else:
+        mkvmerge_discard_old_attachments_command = ""
+    return MuxingBatchSettings(
+        destination_folder_path=destination_folder_path,
+        video_source_mkv_only=bool(video_source_mkv_only),
+        have_subtitle_files=have_subtitle_files,
+        subtitle_enabled=subtitle_enabled,
+        chapter_enabled=chapter_enabled,
+        attachment_enabled=attachment_enabled,
+        attachment_discard_old=attachment_discard_old,
+        attachments=tuple(attachments),
+        only_keep_those_subtitles_enabled=only_keep_those_subtitles_enabled,
+        only_keep_those_subtitles=tuple(only_keep_those_subtitles),
+        only_keep_those_audios_enabled=only_keep_those_audios_enabled,
+        only_keep_those_audios=tuple(only_keep_those_audios),
+        make_this_subtitle_default_semi_enabled=make_this_subtitle_default_semi_enabled,
+        make_this_subtitle_default_full_enabled=make_this_subtitle_default_full_enabled,
+        make_this_subtitle_default_track=make_this_subtitle_default_track,
+        make_this_audio_default_semi_enabled=make_this_audio_default_semi_enabled,
+        make_this_audio_default_full_enabled=make_this_audio_default_full_enabled,
+        make_this_audio_default_track=make_this_audio_default_track,
+        edit_source_files=edit_source_files,
+        ui_language_command=generate_ui_language_command(),
+        mkvmerge_discard_old_attachments_command=mkvmerge_discard_old_attachments_command,
+        mkvmerge_attachments_attach_command=generate_attachments_command(
+            attachment_enabled, attachments, "--attach-file"),
+        mkvmerge_specify_subtitle_track_command=generate_only_keep_those_tracks_command(
+            only_keep_those_subtitles_enabled, only_keep_those_subtitles, "--subtitle-tracks", "--no-subtitles"),
+        mkvmerge_specify_audio_track_command=generate_only_keep_those_tracks_command(
+            only_keep_those_audios_enabled, only_keep_those_audios, "--audio-tracks", "--no-audio"),
+        mkvpropedit_attachments_attach_command=generate_attachments_command(
+            attachment_enabled, attachments, "--add-attachment"),
+    )
+
+
+def create_muxing_batch_settings():
+    return generate_muxing_batch_settings(
+        destination_folder_path=GlobalSetting.DESTINATION_FOLDER_PATH,
+        video_source_mkv_only=GlobalSetting.VIDEO_SOURCE_MKV_ONLY,
+        have_subtitle_files=len(GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST) > 0,
+        subtitle_enabled=GlobalSetting.SUBTITLE_ENABLED,
+        chapter_enabled=GlobalSetting.CHAPTER_ENABLED,
+        attachment_enabled=GlobalSetting.ATTACHMENT_ENABLED,
+        attachment_discard_old=GlobalSetting.ATTACHMENT_DISCARD_OLD,
+        attachments=get_checked_attachments(GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST,
+                                            GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST),
+        only_keep_those_subtitles_enabled=GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_ENABLED,
+        only_keep_those_subtitles=get_only_keep_those_tracks(
+            GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_TRACKS,
+            GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_LANGUAGES),
+        only_keep_those_audios_enabled=GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_ENABLED,
+        only_keep_those_audios=get_only_keep_those_tracks(
+            GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_TRACKS,
+            GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_LANGUAGES),
+        make_this_subtitle_default_semi_enabled=GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_SEMI_ENABLED,
+        make_this_subtitle_default_full_enabled=GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_FULL_ENABLED,
+        make_this_subtitle_default_track=GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_TRACK,
+        make_this_audio_default_semi_enabled=GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_SEMI_ENABLED,
+        make_this_audio_default_full_enabled=GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_FULL_ENABLED,
+        make_this_audio_default_track=GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_TRACK,
+        edit_source_files=GlobalSetting.MUX_SETTING_EDIT_SOURCE_FILES,
+    )
@@ -0,0 +1,34 @@
+from packages.Tabs.MuxSetting.Widgets.MuxingBatchSettings import MuxingBatchSettings
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+
+
+def check_if_all_tracks_kept(tracks, track_type, kept_tracks):
+    # the only keep options of mkvmerge take track ids and languages, a job that would keep every track
+    # of this type does not need mkvmerge to drop any
+    kept_ids = {int(kept_track) for kept_track in kept_tracks if kept_track.isdigit()}
+    for track in tracks:
+        if track["type"] != track_type or track["id"] in kept_ids:
+            continue
+        if track["properties"].get("language", "eng") not in kept_tracks:
+            return False
+    return True
+
+
+# decides for one job, from its own probe, if its source video is edited in place with mkvpropedit
+# or remuxed by mkvmerge into the destination folder
+# the source is only edited when the batch allows it and mkvpropedit can do everything the job asks for:
+# a matroska video with no subtitle file to add and no track to drop
+def check_if_job_can_edit_source(job: SingleJobData, batch_settings: MuxingBatchSettings, json_info):
+    if not batch_settings.edit_source_files:
+        return False
+    if json_info["container"].get("type") != "Matroska":
+        return False
+    if batch_settings.subtitle_enabled and job.subtitle_found:
+        return False
+    if batch_settings.only_keep_those_subtitles_enabled and \
+            not check_if_all_tracks_kept(json_info["tracks"], "subtitles", batch_settings.only_keep_those_subtitles):
+        return False
+    if batch_settings.only_keep_those_audios_enabled and \
+            not check_if_all_tracks_kept(json_info["tracks"], "audio", batch_settings.only_keep_those_audios):
+        return False
+    return True
@@ -0,0 +1,15 @@
+# the lines of the json options files given to mkvmerge and mkvpropedit with @file
+def add_two_spaces():
+    return "  "
+
+
+def add_double_quotation(string):
+    return add_two_spaces() + "\"" + str(string) + "\""
+
+
+def add_json_line(string):
+    return "\n" + add_double_quotation(string) + ","
+
+
+def fix_windows_backslash_path(string):
+    return string.replace('\\', '\\\\')
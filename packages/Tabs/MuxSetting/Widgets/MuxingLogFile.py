@@ -0,0 +1,23 @@
+import os
+import shutil
+import time
+
+
+def get_time():
+    t = time.time()
+    return str(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t)))
+
+
+# copies one finished job log into the main log as a single block, then removes the job log
+def add_job_log_to_log_file(log_file_path, job_log_file_path, video_name, start_time):
+    with open(log_file_path, "ab") as log_file:
+        log_file.write(
+            ("\n[" + start_time + "] Start Muxing: ********* " + str(video_name) + " *********\n\n").encode("UTF-8"))
+        try:
+            with open(job_log_file_path, "rb") as job_log_file:
+                shutil.copyfileobj(job_log_file, log_file)
+            os.remove(job_log_file_path)
+        except OSError:
+            pass
+        log_file.write(
+            ("\n[" + get_time() + "] Finish Muxing: ********* " + str(video_name) + " *********\n").encode("UTF-8"))
@@ -0,0 +1,58 @@
+import re
+
+from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
+
+PROGRESS_EVENT = "progress"
+WARNING_EVENT = "warning"
+ERROR_EVENT = "error"
+DONE_EVENT = "done"
+
+# jobs run with --gui-mode so mkvtoolnix tags its messages with #GUI#, the plain english prefixes are kept as fallback
+OUTPUT_LINE_PATTERN = re.compile(
+    r"#GUI#(?P<gui_tag>progress|warning|error)\s*(?P<gui_text>.*)"
+    r"|(?P<tag>Progress|Warning|Error):\s*(?P<text>.*)"
+    r"|(?P<done>Multiplexing took|Done\.|No changes were made)")
+PROGRESS_PATTERN = re.compile(r"(\d+)%")
+MATROSKA_STRUCTURE_ERROR = "Error in the Matroska file structure"
+
+
+class MuxingOutputEvent:
+    def __init__(self, kind, progress=0, message=""):
+        self.kind = kind
+        self.progress = progress
+        self.message = message
+
+
+def parse_muxing_output_line(line):
+    match = OUTPUT_LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    if match.group("done") is not None:
+        return MuxingOutputEvent(DONE_EVENT, progress=100)
+    tag = match.group("gui_tag") or match.group("tag").lower()
+    text = match.group("gui_text") if match.group("gui_tag") is not None else match.group("text")
+    if tag == PROGRESS_EVENT:
+        progress_match = PROGRESS_PATTERN.search(text)
+        if progress_match is None:
+            return None
+        return MuxingOutputEvent(PROGRESS_EVENT, progress=int(progress_match.group(1)))
+    # the message is rebuilt from the text so both output modes read the same, without the #GUI# tag,
+    # it ends with a new line like the output line it comes from
+    text = text.strip()
+    if tag == WARNING_EVENT and text.find(MATROSKA_STRUCTURE_ERROR) == -1:
+        return MuxingOutputEvent(WARNING_EVENT, message="Warning: " + text + "\n")
+    return MuxingOutputEvent(ERROR_EVENT, message="Error: " + text + "\n")
+
+
+# applies one event to the job params and returns True when the change is worth reporting
+def update_muxing_params(muxing_params: MuxingParams, event: MuxingOutputEvent):
+    if event.kind == PROGRESS_EVENT or event.kind == DONE_EVENT:
+        if event.progress == muxing_params.progress:
+            return False
+        muxing_params.progress = event.progress
+    elif event.kind == WARNING_EVENT:
+        muxing_params.warnings += 1
+    elif event.kind == ERROR_EVENT:
+        muxing_params.error = True
+        muxing_params.message = event.message
+    return True
@@ -3,4 +3,5 @@ class MuxingParams:
         self.index = 0
         self.progress = 0
         self.error = False
+        self.warnings = 0
         self.message = "Muxing Done Successfully"
@@ -0,0 +1,70 @@
+import os
+import subprocess
+
+from packages.Tabs.MuxSetting.Widgets.AsyncLogWriter import AsyncLogWriter
+
+READ_CHUNK_SIZE = 4096
+KILLED_EXIT_CODE = -1
+# the exit code of mkvmerge and mkvpropedit when they fail, also used for a job that could not be started
+FAILED_EXIT_CODE = 2
+
+
+def split_output_lines(buffer):
+    # mkvmerge rewrites the progress line with \r so both \r and \n end a line
+    lines = buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n").split(b"\n")
+    return lines[:-1], lines[-1]
+
+
+# runs one mkvmerge/mkvpropedit process and streams its stdout straight from the pipe
+# every complete line is passed to line_callback as soon as it arrives, the raw output goes to the log file
+class MuxingProcessRunner:
+    def __init__(self, command, log_file_path, line_callback):
+        self.command = command  # type: list[str]
+        self.log_file_path = log_file_path
+        self.line_callback = line_callback
+        self.process = None  # type: subprocess.Popen
+        self.killed = False
+
+    def run(self):
+        if self.killed:
+            return KILLED_EXIT_CODE
+        log_writer = AsyncLogWriter(self.log_file_path)
+        try:
+            self.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                            stdin=subprocess.DEVNULL,
+                                            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        except OSError as error:
+            log_writer.write(("Error: " + str(error) + "\n").encode("UTF-8"))
+            log_writer.close()
+            self.line_callback("Error: " + str(error))
+            return FAILED_EXIT_CODE
+        if self.killed:
+            # kill came from another thread before the process existed
+            self.process.kill()
+        buffer = b""
+        stdout_fd = self.process.stdout.fileno()
+        while True:
+            chunk = os.read(stdout_fd, READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            log_writer.write(chunk)
+            lines, buffer = split_output_lines(buffer + chunk)
+            for line in lines:
+                if line:
+                    self.line_callback(line.decode("UTF-8", errors="replace"))
+        if buffer:
+            self.line_callback(buffer.decode("UTF-8", errors="replace"))
+        self.process.stdout.close()
+        exit_code = self.process.wait()
+        log_writer.close()
+        if self.killed:
+            return KILLED_EXIT_CODE
+        return exit_code
+
+    def kill(self):
+        # called from another thread, a process that already ended is left with its own exit code
+        if self.process is None:
+            self.killed = True
+        elif self.process.poll() is None:
+            self.killed = True
+            self.process.kill()
@@ -0,0 +1,53 @@
+import threading
+
+from PySide2.QtCore import QObject, QTimer, Signal
+
+from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
+
+PROGRESS_FLUSH_INTERVAL_MS = 100
+
+
+# the muxing threads leave every progress change here instead of sending one signal per output line,
+# only the last change of every job is kept and the queue gets them together ten times a second
+# the timer runs only while there are running jobs, a job that ends gets its last change right away
+class MuxingProgressAggregator(QObject):
+    progress_flushed_signal = Signal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.lock = threading.Lock()
+        self.pending_params = {}  # type: dict[int, MuxingParams]
+        self.running_jobs = set()  # type: set[int]
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(PROGRESS_FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def add_progress(self, params: MuxingParams):
+        # called from the muxing threads, every params object is sent once and not changed after
+        with self.lock:
+            self.pending_params[params.index] = params
+
+    def start_job(self, job_index):
+        self.running_jobs.add(job_index)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def finish_job(self, job_index):
+        self.flush()
+        self.running_jobs.discard(job_index)
+        if len(self.running_jobs) == 0:
+            self.flush_timer.stop()
+
+    def flush(self):
+        with self.lock:
+            if len(self.pending_params) == 0:
+                return
+            params_list = list(self.pending_params.values())
+            self.pending_params = {}
+        self.progress_flushed_signal.emit(params_list)
+
+    def clear(self):
+        with self.lock:
+            self.pending_params = {}
+        self.running_jobs.clear()
+        self.flush_timer.stop()
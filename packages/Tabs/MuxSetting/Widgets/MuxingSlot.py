@@ -0,0 +1,62 @@
+from PySide2.QtCore import QObject, QThread, Signal
+
+from packages.Startup import GlobalPaths
+from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
+from packages.Tabs.MuxSetting.Widgets.StartMuxingProcessWorker import StartMuxingProcessWorker
+
+
+# one slot runs one job at a time, every slot has its own process thread
+# and every job writes into its own log file so parallel jobs never mix their output
+# the thread sleeps in its event loop between jobs and a job is handed over with a queued signal
+class MuxingSlot(QObject):
+    finished_job_signal = Signal(int, int)  # job index, exit code
+    send_muxing_progress_data_signal = Signal(MuxingParams)
+    start_muxing_process_signal = Signal()
+
+    def __init__(self, slot_index, parent=None):
+        super().__init__(parent)
+        self.slot_index = slot_index
+        self.job_index = -1
+        self.is_busy = False
+        self.setup_start_muxing_process_thread()
+        self.start_muxing_process_thread.start()
+
+    def start_job(self, job_index, command, flags_job_file_path=None):
+        # a mkvpropedit job given its options file first tries to set its flags in place
+        self.job_index = job_index
+        self.is_busy = True
+        log_file_path = GlobalPaths.get_job_log_file_path(job_index)
+        open(log_file_path, 'w+').close()
+        self.start_muxing_process_worker.job_index = job_index
+        self.start_muxing_process_worker.command = command
+        self.start_muxing_process_worker.log_file_path = log_file_path
+        self.start_muxing_process_worker.flags_job_file_path = flags_job_file_path
+        self.start_muxing_process_worker.muxing_process_runner = None
+        self.start_muxing_process_worker.stop_requested = False
+        self.start_muxing_process_signal.emit()
+
+    def stop_job(self):
+        # kills the running process, the job ends with the killed exit code
+        self.start_muxing_process_worker.stop_process()
+
+    def stop(self):
+        self.start_muxing_process_thread.quit()
+        self.start_muxing_process_thread.wait()
+        self.start_muxing_process_worker.deleteLater()
+        self.start_muxing_process_thread.deleteLater()
+
+    # noinspection PyAttributeOutsideInit
+    def setup_start_muxing_process_thread(self):
+        self.start_muxing_process_worker = StartMuxingProcessWorker()
+        self.start_muxing_process_thread = QThread()
+        self.start_muxing_process_worker.moveToThread(self.start_muxing_process_thread)
+        self.start_muxing_process_signal.connect(self.start_muxing_process_worker.run)
+        self.start_muxing_process_worker.finished_job_signal.connect(self.finished_muxing_process)
+        self.start_muxing_process_worker.send_muxing_progress_data_signal.connect(self.receive_muxing_progress_data)
+
+    def receive_muxing_progress_data(self, params: MuxingParams):
+        self.send_muxing_progress_data_signal.emit(params)
+
+    def finished_muxing_process(self, exit_code):
+        self.is_busy = False
+        self.finished_job_signal.emit(self.job_index, exit_code)
@@ -0,0 +1,47 @@
+import os
+
+from PySide2.QtWidgets import QSpinBox
+
+from packages.Startup.InitializeScreenResolution import screen_size
+from packages.Tabs.GlobalSetting import GlobalSetting
+
+
+class ParallelJobsSpinBox(QSpinBox):
+    def __init__(self):
+        super().__init__()
+        self.hint_when_enabled = ""
+        self.setMinimum(1)
+        self.setMaximum(max(1, os.cpu_count() or 1))
+        self.setValue(GlobalSetting.MUX_SETTING_NUMBER_OF_PARALLEL_JOBS)
+        self.setMaximumWidth(screen_size.width() // 24)
+        self.setToolTip("Number of jobs to mux at the same time")
+        self.valueChanged.connect(self.change_global_number_of_parallel_jobs)
+
+    @staticmethod
+    def change_global_number_of_parallel_jobs(new_value):
+        GlobalSetting.MUX_SETTING_NUMBER_OF_PARALLEL_JOBS = new_value
+
+    def setEnabled(self, new_state: bool):
+        super().setEnabled(new_state)
+        if not new_state and not GlobalSetting.JOB_QUEUE_EMPTY:
+            if self.hint_when_enabled != "":
+                self.setToolTip("<nobr>" + self.hint_when_enabled + "<br>" + GlobalSetting.DISABLE_TOOLTIP)
+            else:
+                self.setToolTip("<nobr>" + GlobalSetting.DISABLE_TOOLTIP)
+        else:
+            self.setToolTip(self.hint_when_enabled)
+
+    def setDisabled(self, new_state: bool):
+        super().setDisabled(new_state)
+        if new_state and not GlobalSetting.JOB_QUEUE_EMPTY:
+            if self.hint_when_enabled != "":
+                self.setToolTip("<nobr>" + self.hint_when_enabled + "<br>" + GlobalSetting.DISABLE_TOOLTIP)
+            else:
+                self.setToolTip("<nobr>" + GlobalSetting.DISABLE_TOOLTIP)
+        else:
+            self.setToolTip(self.hint_when_enabled)
+
+    def setToolTip(self, new_tool_tip: str):
+        if self.isEnabled() or GlobalSetting.JOB_QUEUE_EMPTY:
+            self.hint_when_enabled = new_tool_tip
+        super().setToolTip(new_tool_tip)
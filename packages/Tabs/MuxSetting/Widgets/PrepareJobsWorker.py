@@ -0,0 +1,38 @@
+from PySide2.QtCore import QObject, Signal
+
+from packages.Startup import GlobalPaths
+from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvmergeJob import GetJsonForMkvmergeJob
+from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvpropeditJob import GetJsonForMkvpropeditJob
+from packages.Tabs.MuxSetting.Widgets.MkvmergeProbeCache import get_mkvmerge_json_info
+from packages.Tabs.MuxSetting.Widgets.MuxingBatchSettings import MuxingBatchSettings
+from packages.Tabs.MuxSetting.Widgets.MuxingJobPlanner import check_if_job_can_edit_source
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+
+
+# probes the videos and writes the option files of the upcoming jobs on its own thread
+# so a muxing slot can start the next job as soon as it gets free
+# every job is planned on its own, only the option file of the tool it will use is written
+class PrepareJobsWorker(QObject):
+    job_prepared_signal = Signal(int, bool)  # job index, edit the source with mkvpropedit
+    job_preparation_failed_signal = Signal(int, str)
+
+    def __init__(self, data, batch_settings: MuxingBatchSettings):
+        super().__init__()
+        self.data = data  # type:list[SingleJobData]
+        self.batch_settings = batch_settings
+
+    def prepare_job(self, job_index):
+        job = self.data[job_index]
+        try:
+            edit_source = check_if_job_can_edit_source(job, self.batch_settings,
+                                                       get_mkvmerge_json_info(job.video_name_absolute))
+            if edit_source:
+                GetJsonForMkvpropeditJob(job, job_file_path=GlobalPaths.get_mkvpropedit_json_job_file_path(job_index),
+                                         batch_settings=self.batch_settings)
+            else:
+                GetJsonForMkvmergeJob(job, job_file_path=GlobalPaths.get_mkvmerge_json_job_file_path(job_index),
+                                      batch_settings=self.batch_settings)
+        except (OSError, ValueError, KeyError) as error:
+            self.job_preparation_failed_signal.emit(job_index, str(error))
+            return
+        self.job_prepared_signal.emit(job_index, edit_source)
@@ -1,12 +1,18 @@
 from packages.Startup.DefaultOptions import Default_Subtitle_Language
 
 
+# one record per queued video, the queue can hold a whole season folder or more so the fields are slots
+# instead of a dict per job, the texts the table shows are made from these fields when they are shown
 class SingleJobData:
+    __slots__ = ("video_name", "video_name_absolute",
+                 "subtitle_found", "subtitle_name", "subtitle_name_absolute", "subtitle_language",
+                 "subtitle_track_name", "subtitle_delay", "subtitle_set_default", "subtitle_set_forced",
+                 "chapter_found", "chapter_name", "chapter_name_absolute",
+                 "progress", "size_before_muxing", "done", "error_occurred", "used_mkvpropedit", "muxing_message",
+                 "number_of_warnings")
+
     def __init__(self):
         self.video_name = ""
-        self.video_name_with_spaces = "  "
-        self.video_name_after_elide = "..."
-        self.video_name_displayed = ""
         self.video_name_absolute = ""
 
         self.subtitle_found = False
@@ -24,9 +30,9 @@ class SingleJobData:
 
         self.progress = 0
         self.size_before_muxing = "0 MB"
-        self.size_after_muxing = "0 MB"
 
         self.done = False
         self.error_occurred = False
         self.used_mkvpropedit = False
         self.muxing_message = ""
+        self.number_of_warnings = 0
@@ -1,27 +1,59 @@
-import subprocess
+import copy
 
-from PySide2.QtCore import Signal, QObject, QThread
+from PySide2.QtCore import Signal, QObject
 
-from packages.Startup import GlobalFiles
+from packages.Startup import GlobalPaths
+from packages.Tabs.MuxSetting.Widgets.MatroskaFlagsEditor import edit_flags_in_place
+from packages.Tabs.MuxSetting.Widgets.MuxingOutputParser import parse_muxing_output_line, update_muxing_params
+from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
+from packages.Tabs.MuxSetting.Widgets.MuxingProcessRunner import MuxingProcessRunner
+
+FLAGS_EDITED_IN_PLACE_MESSAGE = "The track flags were changed in place, mkvpropedit was not needed.\nDone.\n"
 
 
 class StartMuxingProcessWorker(QObject):
     finished_job_signal = Signal(int)
-    all_finished = Signal()
+    send_muxing_progress_data_signal = Signal(MuxingParams)
 
-    def __init__(self, command=""):
+    def __init__(self, command=None):
         super().__init__()
-        self.command = command
-        self.wait = True
-        self.stop = False
+        self.command = command or []  # type: list[str]
+        self.job_index = -1
+        self.log_file_path = GlobalPaths.LogFilePath
+        self.flags_job_file_path = None  # type: str
+        self.muxing_process_runner = None  # type: MuxingProcessRunner
+        self.stop_requested = False
+        self.muxing_params = MuxingParams()
 
     def run(self):
-        while not self.stop:
-            if not self.wait:
-                with open(GlobalFiles.LogFilePath, "a+") as log_file:
-                    mux_process = subprocess.run(self.command, shell=True, stdout=log_file)
-                self.finished_job_signal.emit(mux_process.returncode)
-                self.wait = True
-            else:
-                QThread.msleep(50)
-        self.all_finished.emit()
+        self.muxing_params = MuxingParams()
+        self.muxing_params.index = self.job_index
+        if self.flags_job_file_path is not None and edit_flags_in_place(self.flags_job_file_path):
+            self.finish_flags_edited_in_place()
+            return
+        self.muxing_process_runner = MuxingProcessRunner(command=self.command,
+                                                         log_file_path=self.log_file_path,
+                                                         line_callback=self.read_output_line)
+        if self.stop_requested:
+            self.muxing_process_runner.kill()
+        exit_code = self.muxing_process_runner.run()
+        self.finished_job_signal.emit(exit_code)
+
+    def stop_process(self):
+        # called from the muxing thread while run is busy on this worker's thread
+        self.stop_requested = True
+        if self.muxing_process_runner is not None:
+            self.muxing_process_runner.kill()
+
+    def finish_flags_edited_in_place(self):
+        with open(self.log_file_path, "w", encoding="UTF-8") as log_file:
+            log_file.write(FLAGS_EDITED_IN_PLACE_MESSAGE)
+        self.muxing_params.progress = 100
+        self.send_muxing_progress_data_signal.emit(copy.copy(self.muxing_params))
+        self.finished_job_signal.emit(0)
+
+    # the params go to the muxing thread while this worker keeps changing its own, each signal gets a copy
+    def read_output_line(self, line):
+        event = parse_muxing_output_line(line)
+        if event is not None and update_muxing_params(self.muxing_params, event):
+            self.send_muxing_progress_data_signal.emit(copy.copy(self.muxing_params))
@@ -1,228 +1,223 @@
-import time
-
 from PySide2.QtCore import QObject, QThread, Signal
 
-from packages.Startup import GlobalFiles
+from packages.Startup import GlobalPaths
 from packages.Tabs.GlobalSetting import GlobalSetting
-from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvmergeJob import GetJsonForMkvmergeJob
-from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvpropeditJob import GetJsonForMkvpropeditJob
+from packages.Tabs.MuxSetting.Widgets.MuxingBatchSettings import create_muxing_batch_settings
+from packages.Tabs.MuxSetting.Widgets.MuxingLogFile import get_time, add_job_log_to_log_file
 from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
-from packages.Tabs.MuxSetting.Widgets.ReadFromMkvmergeLogWorker import ReadFromMkvmergeLogWorker
-from packages.Tabs.MuxSetting.Widgets.ReadFromMkvpropeditLogWorker import ReadFromMkvpropeditLogWorker
+from packages.Tabs.MuxSetting.Widgets.MuxingProcessRunner import FAILED_EXIT_CODE, KILLED_EXIT_CODE
+from packages.Tabs.MuxSetting.Widgets.MuxingProgressAggregator import MuxingProgressAggregator
+from packages.Tabs.MuxSetting.Widgets.MuxingSlot import MuxingSlot
+from packages.Tabs.MuxSetting.Widgets.PrepareJobsWorker import PrepareJobsWorker
 from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
-from packages.Tabs.MuxSetting.Widgets.StartMuxingProcessWorker import StartMuxingProcessWorker
-
-
-def check_if_mkvpropedit_good():
-    if len(
-            GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST) > 0 or GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_ENABLED == True or GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_ENABLED == True or not GlobalSetting.VIDEO_SOURCE_MKV_ONLY:
-        return False
-    else:
-        return True
-
 
-def get_time():
-    t = time.time()
-    return str(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t)))
-
-
-def add_double_quotation(string):
-    return "\"" + str(string) + "\""
+NUMBER_OF_JOBS_TO_PREPARE_AHEAD = 2
 
 
 class StartMuxingWorker(QObject):
     finished_all_jobs_signal = Signal()
     finished_paused_signal = Signal()
-    cancel_signal = Signal()
-    mkvpropedit_good_signal = Signal()
-    progress_signal = Signal(MuxingParams)
     job_succeeded_signal = Signal(int)
     job_failed_signal = Signal(int)
+    job_stopped_signal = Signal(int)
     job_started_signal = Signal(int)
     pause_from_error_occurred_signal = Signal()
+    prepare_job_signal = Signal(int)
 
-    def __init__(self, data):
+    def __init__(self, data, progress_aggregator: MuxingProgressAggregator):
         super().__init__()
         self.data = data  # type:list[SingleJobData]
+        self.progress_aggregator = progress_aggregator
+        GlobalPaths.create_temp_folders()
+        self.batch_settings = create_muxing_batch_settings()
         self.current_job = -1
-        self.finished_read_log_and_muxing = 0
-        self.waiting_for_mkvpropedit_confirm = False
-        self.always_use_mkvpropedit = False
-        self.always_use_mkvmerge = False
-        self.use_mkvpropedit = False
-        self.use_mkvmerge = False
+        self.number_of_parallel_jobs = max(1, GlobalSetting.MUX_SETTING_NUMBER_OF_PARALLEL_JOBS)
+        self.running_jobs = {}  # type: dict[int, MuxingSlot]
+        self.jobs_start_time = {}  # type: dict[int, str]
+        self.jobs_with_errors = set()
+        self.requested_to_prepare_jobs = set()
+        self.prepared_jobs = set()
+        self.jobs_editing_source = set()
+        self.failed_to_prepare_jobs = {}  # type: dict[int, str]
+        self.all_jobs_stopped = False
         self.pause = False
-        self.cancel = False
-        self.setup_start_muxing_process_thread()
-        self.setup_read_mkvmerge_log_thread()
-        self.setup_read_mkvpropedit_log_thread()
-        self.start_muxing_process_thread.start()
-        self.read_log_mkvmerge_thread.start()
-        self.read_log_mkvpropedit_thread.start()
+        self.muxing_slots = []  # type: list[MuxingSlot]
+        self.setup_muxing_slots()
+        self.setup_prepare_jobs_thread()
 
     def run(self):
-        if self.current_job == len(self.data):
-            self.stop_all_threads()
-            self.finished_all_jobs_signal.emit()
-        self.next_job()
+        self.prepare_upcoming_jobs()
 
     def stop_all_threads(self):
-        self.read_log_mkvmerge_worker.stop = True
-        self.read_log_mkvpropedit_worker.stop = True
-        self.start_muxing_process_worker.stop = True
-
-    def next_job(self):
-        if self.cancel:
-            self.stop_all_threads()
-            self.cancel_signal.emit()
+        for muxing_slot in self.muxing_slots:
+            muxing_slot.stop()
+        self.prepare_jobs_thread.quit()
+        self.prepare_jobs_thread.wait()
+        self.prepare_jobs_worker.deleteLater()
+        self.prepare_jobs_thread.deleteLater()
+
+    # noinspection PyAttributeOutsideInit
+    def setup_prepare_jobs_thread(self):
+        self.prepare_jobs_worker = PrepareJobsWorker(self.data, self.batch_settings)
+        self.prepare_jobs_thread = QThread()
+        self.prepare_jobs_worker.moveToThread(self.prepare_jobs_thread)
+        self.prepare_job_signal.connect(self.prepare_jobs_worker.prepare_job)
+        self.prepare_jobs_worker.job_prepared_signal.connect(self.job_prepared)
+        self.prepare_jobs_worker.job_preparation_failed_signal.connect(self.job_preparation_failed)
+        self.prepare_jobs_thread.start()
+
+    def setup_muxing_slots(self):
+        for slot_index in range(self.number_of_parallel_jobs):
+            muxing_slot = MuxingSlot(slot_index, parent=self)
+            muxing_slot.finished_job_signal.connect(self.finished_muxing_job)
+            muxing_slot.send_muxing_progress_data_signal.connect(self.receive_muxing_progress_data)
+            self.muxing_slots.append(muxing_slot)
+
+    def get_free_muxing_slot(self):
+        for muxing_slot in self.muxing_slots:
+            if not muxing_slot.is_busy:
+                return muxing_slot
+        return None
+
+    def get_next_job_index(self):
+        for job_index in range(self.current_job + 1, len(self.data)):
+            if not self.data[job_index].done:
+                return job_index
+        return -1
+
+    def get_upcoming_jobs_indices(self, number_of_jobs):
+        upcoming_jobs_indices = []
+        for job_index in range(self.current_job + 1, len(self.data)):
+            if len(upcoming_jobs_indices) == number_of_jobs:
+                break
+            if not self.data[job_index].done:
+                upcoming_jobs_indices.append(job_index)
+        return upcoming_jobs_indices
+
+    def prepare_upcoming_jobs(self):
+        for job_index in self.get_upcoming_jobs_indices(self.number_of_parallel_jobs + NUMBER_OF_JOBS_TO_PREPARE_AHEAD):
+            if job_index not in self.requested_to_prepare_jobs:
+                self.requested_to_prepare_jobs.add(job_index)
+                self.prepare_job_signal.emit(job_index)
+
+    def job_prepared(self, job_index, edit_source):
+        self.prepared_jobs.add(job_index)
+        if edit_source:
+            self.jobs_editing_source.add(job_index)
+        self.start_next_jobs()
+
+    def job_preparation_failed(self, job_index, error_message):
+        self.failed_to_prepare_jobs[job_index] = error_message
+        self.prepared_jobs.add(job_index)
+        self.start_next_jobs()
+
+    def start_next_jobs(self):
+        while not self.pause:
+            muxing_slot = self.get_free_muxing_slot()
+            if muxing_slot is None:
+                break
+            job_index = self.get_next_job_index()
+            if job_index == -1 or job_index not in self.prepared_jobs:
+                break
+            self.current_job = job_index
+            if job_index in self.failed_to_prepare_jobs:
+                self.fail_not_prepared_job(job_index)
+            else:
+                self.start_job(job_index, muxing_slot)
+        if not self.pause:
+            self.prepare_upcoming_jobs()
+        self.check_if_all_jobs_stopped()
+
+    def check_if_all_jobs_stopped(self):
+        if len(self.running_jobs) > 0 or self.all_jobs_stopped:
             return
-        self.current_job += 1
-        if self.current_job == len(self.data):
-            self.stop_all_threads()
+        if not self.pause and self.get_next_job_index() != -1:
+            return  # next job is still being prepared
+        self.all_jobs_stopped = True
+        self.stop_all_threads()
+        if self.get_next_job_index() == -1:
             self.finished_all_jobs_signal.emit()
-            return
-        if self.pause:
-            self.stop_all_threads()
+        else:
             self.finished_paused_signal.emit()
-            return
 
-        job = self.data[self.current_job]
-        if not job.done:
-            GetJsonForMkvmergeJob(job)
-            if GlobalSetting.VIDEO_SOURCE_MKV_ONLY:
-                GetJsonForMkvpropeditJob(job)
-            else:
-                self.always_use_mkvmerge = True
-            if self.always_use_mkvpropedit:
-                self.job_started_signal.emit(self.current_job)
-                self.start_mkvpropedit_muxing()
-            elif self.always_use_mkvmerge:
-                self.job_started_signal.emit(self.current_job)
-                self.start_mkvmerge_muxing()
-            else:
-                if check_if_mkvpropedit_good():
-                    self.mkvpropedit_good_signal.emit()
-                    self.waiting_for_mkvpropedit_confirm = True
-                    while self.waiting_for_mkvpropedit_confirm:
-                        time.sleep(0.05)
-                    if self.use_mkvpropedit:
-                        self.always_use_mkvpropedit = True
-                        self.job_started_signal.emit(self.current_job)
-                        self.start_mkvpropedit_muxing()
-                    elif self.use_mkvmerge:
-                        self.always_use_mkvmerge = True
-                        self.job_started_signal.emit(self.current_job)
-                        self.start_mkvmerge_muxing()
-                    else:
-                        self.stop_all_threads()
-                        self.cancel_signal.emit()
-                else:
-                    self.always_use_mkvmerge = True
-                    self.job_started_signal.emit(self.current_job)
-                    self.start_mkvmerge_muxing()
+    def start_job(self, job_index, muxing_slot):
+        # the prepare worker planned every job, only the ones it allowed edit their source
+        if job_index in self.jobs_editing_source:
+            self.start_mkvpropedit_muxing(job_index, muxing_slot)
         else:
-            self.next_job()
-
-    # noinspection PyAttributeOutsideInit
-    def start_mkvpropedit_muxing(self):
-        self.data[self.current_job].used_mkvpropedit = True
-        mux_command = add_double_quotation(GlobalFiles.MKVPROPEDIT_PATH) + " @" + add_double_quotation(
-            GlobalFiles.mkvpropeditJsonJobFilePath)
-        self.add_header_info_to_log_file()
-        self.start_muxing_process_worker.command = mux_command
-        GlobalSetting.MUXING_ON = True
-        self.read_log_mkvpropedit_worker.job_index = self.current_job
-        self.start_muxing_process_worker.wait = False
-        self.read_log_mkvpropedit_worker.wait = False
-
-    def start_mkvmerge_muxing(self):
-        mux_command = add_double_quotation(GlobalFiles.MKVMERGE_PATH) + " @" + add_double_quotation(
-            GlobalFiles.mkvmergeJsonJobFilePath)
-        self.add_header_info_to_log_file()
-        self.start_muxing_process_worker.command = mux_command
+            self.start_mkvmerge_muxing(job_index, muxing_slot)
+
+    def fail_not_prepared_job(self, job_index):
+        error_message = "Error: " + self.failed_to_prepare_jobs.pop(job_index) + "\n"
+        self.jobs_start_time[job_index] = get_time()
+        with open(GlobalPaths.get_job_log_file_path(job_index), "w", encoding="UTF-8") as job_log_file:
+            job_log_file.write(error_message)
+        self.job_started_signal.emit(job_index)
+        muxing_params = MuxingParams()
+        muxing_params.index = job_index
+        muxing_params.error = True
+        muxing_params.message = error_message
+        self.receive_muxing_progress_data(muxing_params)
+        self.finish_job(job_index, FAILED_EXIT_CODE)
+
+    def start_mkvpropedit_muxing(self, job_index, muxing_slot):
+        self.data[job_index].used_mkvpropedit = True
+        job_file_path = GlobalPaths.get_mkvpropedit_json_job_file_path(job_index)
+        mux_command = [GlobalPaths.MKVPROPEDIT_PATH, "@" + job_file_path]
+        self.start_muxing_command(job_index, muxing_slot, mux_command, flags_job_file_path=job_file_path)
+
+    def start_mkvmerge_muxing(self, job_index, muxing_slot):
+        self.data[job_index].used_mkvpropedit = False
+        mux_command = [GlobalPaths.MKVMERGE_PATH, "@" + GlobalPaths.get_mkvmerge_json_job_file_path(job_index)]
+        self.start_muxing_command(job_index, muxing_slot, mux_command)
+
+    def start_muxing_command(self, job_index, muxing_slot, mux_command, flags_job_file_path=None):
         GlobalSetting.MUXING_ON = True
-        self.read_log_mkvmerge_worker.job_index = self.current_job
-        self.start_muxing_process_worker.wait = False
-        self.read_log_mkvmerge_worker.wait = False
-
-    # noinspection PyAttributeOutsideInit
-    def setup_start_muxing_process_thread(self):
-        self.start_muxing_process_worker = StartMuxingProcessWorker()
-        self.start_muxing_process_thread = QThread()
-        self.start_muxing_process_worker.moveToThread(self.start_muxing_process_thread)
-        self.start_muxing_process_thread.started.connect(self.start_muxing_process_worker.run)
-        self.start_muxing_process_worker.all_finished.connect(self.start_muxing_process_thread.quit)
-        self.start_muxing_process_worker.all_finished.connect(self.start_muxing_process_worker.deleteLater)
-        self.start_muxing_process_worker.finished_job_signal.connect(self.finished_muxing_process)
-
-    # noinspection PyAttributeOutsideInit
-    def setup_read_mkvmerge_log_thread(self):
-        self.read_log_mkvmerge_worker = ReadFromMkvmergeLogWorker(self.current_job)
-        self.read_log_mkvmerge_thread = QThread()
-        self.read_log_mkvmerge_worker.moveToThread(self.read_log_mkvmerge_thread)
-        self.read_log_mkvmerge_thread.started.connect(self.read_log_mkvmerge_worker.run)
-        self.read_log_mkvmerge_worker.all_finished.connect(self.read_log_mkvmerge_thread.quit)
-        self.read_log_mkvmerge_worker.all_finished.connect(self.read_log_mkvmerge_worker.deleteLater)
-        self.read_log_mkvmerge_worker.finished_job_signal.connect(self.finished_read_log)
-        self.read_log_mkvmerge_thread.finished.connect(self.read_log_mkvmerge_thread.deleteLater)
-        self.read_log_mkvmerge_worker.send_muxing_progress_data_signal.connect(self.receive_muxing_progress_data)
-
-    # noinspection PyAttributeOutsideInit
-    def setup_read_mkvpropedit_log_thread(self):
-        self.read_log_mkvpropedit_worker = ReadFromMkvpropeditLogWorker(self.current_job)
-        self.read_log_mkvpropedit_thread = QThread()
-        self.read_log_mkvpropedit_worker.moveToThread(self.read_log_mkvpropedit_thread)
-        self.read_log_mkvpropedit_thread.started.connect(self.read_log_mkvpropedit_worker.run)
-        self.read_log_mkvpropedit_worker.all_finished.connect(self.read_log_mkvpropedit_thread.quit)
-        self.read_log_mkvpropedit_worker.all_finished.connect(self.read_log_mkvpropedit_worker.deleteLater)
-        self.read_log_mkvpropedit_worker.finished_job_signal.connect(self.finished_read_log)
-        self.read_log_mkvpropedit_thread.finished.connect(self.read_log_mkvpropedit_thread.deleteLater)
-        self.read_log_mkvpropedit_worker.send_muxing_progress_data_signal.connect(self.receive_muxing_progress_data)
+        self.running_jobs[job_index] = muxing_slot
+        self.jobs_start_time[job_index] = get_time()
+        self.job_started_signal.emit(job_index)
+        muxing_slot.start_job(job_index, mux_command, flags_job_file_path=flags_job_file_path)
 
     def receive_muxing_progress_data(self, params: MuxingParams):
-        if params.error:
+        # the params are cumulative, every update after the first error still has it, the batch is stopped once
+        if params.error and params.index not in self.jobs_with_errors:
+            self.jobs_with_errors.add(params.index)
             if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
                 self.pause = True
+                self.stop_running_jobs()
                 self.pause_from_error_occurred_signal.emit()
-        self.progress_signal.emit(params)
-
-    def finished_read_log(self):
-        self.finished_read_log_and_muxing += 1
-        if self.finished_read_log_and_muxing == 2:  # both threads end
-            self.add_footer_info_to_log_file()
+        self.progress_aggregator.add_progress(params)
+
+    def stop_running_jobs(self):
+        # an error aborts the batch, the other mkvmerge jobs are killed and muxed again when it resumes
+        # the mkvpropedit jobs write into the source videos so they are left to finish
+        for job_index, muxing_slot in self.running_jobs.items():
+            if job_index not in self.jobs_with_errors and not self.data[job_index].used_mkvpropedit:
+                muxing_slot.stop_job()
+
+    def finished_muxing_job(self, job_index, exit_code):
+        self.finish_job(job_index, exit_code)
+        self.start_next_jobs()
+
+    def finish_job(self, job_index, exit_code):
+        self.running_jobs.pop(job_index, None)
+        if len(self.running_jobs) == 0:
             GlobalSetting.MUXING_ON = False
-            self.finished_read_log_and_muxing = 0
-            self.next_job()
-
-    def finished_muxing_process(self, exit_code):
-        if exit_code == 2:
-            self.job_failed_signal.emit(self.current_job)
+        if exit_code == KILLED_EXIT_CODE:
+            self.jobs_start_time.pop(job_index, None)
+            self.job_stopped_signal.emit(job_index)
+            return
+        if exit_code == FAILED_EXIT_CODE or job_index in self.jobs_with_errors or self.data[job_index].error_occurred:
+            self.job_failed_signal.emit(job_index)
             if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
                 self.pause = True
+                self.stop_running_jobs()
         else:
-            if self.data[self.current_job].error_occurred:
-                self.job_failed_signal.emit(self.current_job)
-                if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
-                    self.pause = True
-            else:
-                self.job_succeeded_signal.emit(self.current_job)
-        self.finished_read_log_and_muxing += 1
-        if self.finished_read_log_and_muxing == 2:  # both threads end
-            self.add_footer_info_to_log_file()
-            GlobalSetting.MUXING_ON = False
-            self.finished_read_log_and_muxing = 0
-            self.next_job()
-
-    def add_header_info_to_log_file(self):
-
-        with open(GlobalFiles.LogFilePath, "a+", encoding="UTF-8") as log_file:
-            t = get_time()
-            log_file.write(
-                "\n[" + t + "] Start Muxing: ********* " + str(
-                    self.data[self.current_job].video_name) + " *********\n\n")
-
-    def add_footer_info_to_log_file(self):
-        with open(GlobalFiles.LogFilePath, "a+", encoding="UTF-8") as log_file:
-            t = get_time()
-            log_file.write(
-                "\n[" + t + "] Finish Muxing: ********* " + self.data[self.current_job].video_name + " *********\n")
+            self.job_succeeded_signal.emit(job_index)
+        self.add_job_log_to_log_file(job_index)
+
+    def add_job_log_to_log_file(self, job_index):
+        add_job_log_to_log_file(log_file_path=GlobalPaths.LogFilePath,
+                                job_log_file_path=GlobalPaths.get_job_log_file_path(job_index),
+                                video_name=self.data[job_index].video_name,
+                                start_time=self.jobs_start_time.pop(job_index, get_time()))
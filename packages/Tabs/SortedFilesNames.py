@@ -0,0 +1,54 @@
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+from packages.Tabs.GlobalSetting import get_windows_sort_key
+
+
+# names sorted like windows next to their sort keys, every key is computed once when its name comes in
+# so finding, adding or removing a name is a binary search on the keys instead of a sort of the names
+class SortedFilesNames:
+    def __init__(self, files_names=None):
+        self.names = []  # type: list[str]
+        self.sort_keys = []  # type: list[list]
+        if files_names:
+            keys_and_names = sorted(((get_windows_sort_key(file_name), file_name) for file_name in files_names),
+                                    key=itemgetter(0))
+            self.sort_keys = [sort_key for sort_key, file_name in keys_and_names]
+            self.names = [file_name for sort_key, file_name in keys_and_names]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __getitem__(self, index):
+        return self.names[index]
+
+    def append(self, file_name, sort_key):
+        # for names that already come in order, like when a sorted list is split
+        self.names.append(file_name)
+        self.sort_keys.append(sort_key)
+
+    def index(self, file_name):
+        # names with the same sort key sit next to each other, the first one with the key is searched from
+        sort_key = get_windows_sort_key(file_name)
+        file_index = bisect_left(self.sort_keys, sort_key)
+        while file_index < len(self.names) and self.sort_keys[file_index] == sort_key:
+            if self.names[file_index] == file_name:
+                return file_index
+            file_index += 1
+        raise ValueError(file_name + " is not in the sorted names")
+
+    def insert(self, file_name):
+        sort_key = get_windows_sort_key(file_name)
+        file_index = bisect_right(self.sort_keys, sort_key)
+        self.names.insert(file_index, file_name)
+        self.sort_keys.insert(file_index, sort_key)
+        return file_index
+
+    def remove(self, file_name):
+        file_index = self.index(file_name)
+        self.names.pop(file_index)
+        self.sort_keys.pop(file_index)
+        return file_index
@@ -1,11 +1,8 @@
 from PySide2.QtCore import Signal
 from PySide2.QtGui import QColor
 from PySide2.QtWidgets import QTabWidget
-from packages.Tabs.AttachmentTab.AttachmentSelection import AttachmentSelectionSetting
-from packages.Tabs.ChapterTab.ChapterSelection import ChapterSelectionSetting
-from packages.Tabs.MuxSetting.MuxSetting import MuxSettingTab
-from packages.Tabs.SubtitleTab.SubtitleSelection import SubtitleSelectionSetting
 from packages.Tabs.VideoTab.VideoSelection import VideoSelectionSetting
+from packages.Widgets.LazyTab import LazyTab
 
 
 class TabsManager(QTabWidget):
@@ -17,10 +14,11 @@ class TabsManager(QTabWidget):
     def __init__(self):
         super().__init__()
         self.video_tab = VideoSelectionSetting()
-        self.subtitle_tab = SubtitleSelectionSetting()
-        self.attachment_tab = AttachmentSelectionSetting()
-        self.chapter_tab = ChapterSelectionSetting()
-        self.mux_setting_tab = MuxSettingTab()
+        # only the videos tab is built at startup, the other tabs are built when they are opened for the first time
+        self.subtitle_tab = LazyTab(self.create_subtitle_tab)
+        self.attachment_tab = LazyTab(self.create_attachment_tab)
+        self.chapter_tab = LazyTab(self.create_chapter_tab)
+        self.mux_setting_tab = LazyTab(self.create_mux_setting_tab)
         self.tabs_ids = {
             "Video": 0,
             "Subtitle": 1,
@@ -44,15 +42,35 @@ class TabsManager(QTabWidget):
         self.tabBar().setTabTextColor(tab_index, QColor(color_string))
 
     def connect_signals(self):
-        self.attachment_tab.activation_signal.connect(self.change_attachment_activated_state)
-        self.subtitle_tab.activation_signal.connect(self.change_subtitle_activated_state)
-        self.chapter_tab.activation_signal.connect(self.change_chapter_activated_state)
-        self.mux_setting_tab.start_muxing_signal.connect(self.tt)
-        self.mux_setting_tab.update_task_bar_progress_signal.connect(self.update_task_bar_progress_signal.emit)
-        self.mux_setting_tab.update_task_bar_paused_signal.connect(self.update_task_bar_paused_signal.emit)
-        self.mux_setting_tab.update_task_bar_clear_signal.connect(self.update_task_bar_clear_signal.emit)
         self.currentChanged.connect(self.current_tab_changed)
 
+    def create_subtitle_tab(self):
+        from packages.Tabs.SubtitleTab.SubtitleSelection import SubtitleSelectionSetting
+        subtitle_tab = SubtitleSelectionSetting()
+        subtitle_tab.activation_signal.connect(self.change_subtitle_activated_state)
+        return subtitle_tab
+
+    def create_attachment_tab(self):
+        from packages.Tabs.AttachmentTab.AttachmentSelection import AttachmentSelectionSetting
+        attachment_tab = AttachmentSelectionSetting()
+        attachment_tab.activation_signal.connect(self.change_attachment_activated_state)
+        return attachment_tab
+
+    def create_chapter_tab(self):
+        from packages.Tabs.ChapterTab.ChapterSelection import ChapterSelectionSetting
+        chapter_tab = ChapterSelectionSetting()
+        chapter_tab.activation_signal.connect(self.change_chapter_activated_state)
+        return chapter_tab
+
+    def create_mux_setting_tab(self):
+        from packages.Tabs.MuxSetting.MuxSetting import MuxSettingTab
+        mux_setting_tab = MuxSettingTab()
+        mux_setting_tab.start_muxing_signal.connect(self.tt)
+        mux_setting_tab.update_task_bar_progress_signal.connect(self.update_task_bar_progress_signal.emit)
+        mux_setting_tab.update_task_bar_paused_signal.connect(self.update_task_bar_paused_signal.emit)
+        mux_setting_tab.update_task_bar_clear_signal.connect(self.update_task_bar_clear_signal.emit)
+        return mux_setting_tab
+
     def tt(self):
         self.task_bar_start_muxing_signal.emit()
 
@@ -78,10 +96,10 @@ class TabsManager(QTabWidget):
         if index == self.tabs_ids["Video"]:
             self.video_tab.tab_clicked_signal.emit()
         elif index == self.tabs_ids["Subtitle"]:
-            self.subtitle_tab.tab_clicked_signal.emit()
+            self.subtitle_tab.get_tab().tab_clicked_signal.emit()
         elif index == self.tabs_ids["Attachment"]:
-            self.attachment_tab.tab_clicked_signal.emit()
+            self.attachment_tab.get_tab().tab_clicked_signal.emit()
         elif index == self.tabs_ids["Chapter"]:
-            self.chapter_tab.tab_clicked_signal.emit()
+            self.chapter_tab.get_tab().tab_clicked_signal.emit()
         elif index == self.tabs_ids["Mux Setting"]:
-            self.mux_setting_tab.tab_clicked_signal.emit()
+            self.mux_setting_tab.get_tab().tab_clicked_signal.emit()
@@ -1,27 +1,26 @@
 from PySide2.QtCore import Signal
+from PySide2.QtWidgets import QWidget
 
 from packages.Startup.DefaultOptions import Default_Video_Extension
 from packages.Tabs.GlobalSetting import *
-from packages.Tabs.GlobalSetting import sort_names_like_windows, get_readable_filesize, get_files_names_absolute_list, \
-    get_file_name_absolute_path
+from packages.Tabs.GlobalSetting import get_readable_filesize
 from packages.Tabs.VideoTab.Widgets.VideoExtensionsCheckableComboBox import VideoExtensionsCheckableComboBox
+from packages.Tabs.VideoTab.Widgets.VideoIncludeSubfoldersCheckBox import VideoIncludeSubfoldersCheckBox
 from packages.Tabs.VideoTab.Widgets.VideoSourceButton import VideoSourceButton
 from packages.Tabs.VideoTab.Widgets.VideoSourceLineEdit import VideoSourceLineEdit
 from packages.Tabs.VideoTab.Widgets.VideoTable import VideoTable
+from packages.Tabs.FolderIndex import FolderIndex, update_files_names_list, FILE_ROW_REMOVED, FILE_ROW_INSERTED
+from packages.Tabs.FolderIndexRegistry import folder_index_registry
+from packages.Widgets.FolderScanStatus import FolderScanStatus
 from packages.Widgets.InvalidPathDialog import *
 
 
 # noinspection PyAttributeOutsideInit
-def get_files_size_list(files_list, folder_path):
-    files_size_list = []
-    for i in range(len(files_list)):
-        file_name_absolute = get_file_name_absolute_path(file_name=files_list[i], folder_path=folder_path)
-        file_size_bytes = os.path.getsize(file_name_absolute)
-        files_size_list.append(get_readable_filesize(size_bytes=file_size_bytes))
-    return files_size_list
+def get_files_size_list(files_entries):
+    return [get_readable_filesize(size_bytes=file_entry.size) for file_entry in files_entries]
 
 
-class VideoSelectionSetting(GlobalSetting):
+class VideoSelectionSetting(QWidget, GlobalSetting):
     tab_clicked_signal = Signal()
 
     def __init__(self):
@@ -31,7 +30,11 @@ class VideoSelectionSetting(GlobalSetting):
         self.video_source_button = VideoSourceButton()
         self.video_extensions_label = QLabel()
         self.video_extensions_comboBox = VideoExtensionsCheckableComboBox()
+        self.video_include_subfolders_checkBox = VideoIncludeSubfoldersCheckBox()
+        self.video_options_layout = QHBoxLayout()
         self.table = VideoTable()
+        self.folder_scan_status = FolderScanStatus()
+        self.folder_index = None  # type: FolderIndex
         self.main_layout = QGridLayout()
         self.folder_path = ""
         self.files_names_list = []
@@ -54,41 +57,59 @@ class VideoSelectionSetting(GlobalSetting):
         if new_path != "":
             self.video_source_lineEdit.setText(new_path)
             self.update_files_lists(new_path)
-            self.show_files_list()
 
     def update_files_lists(self, folder_path):
         if folder_path == "" or folder_path.isspace():
             self.folder_path = ""
             self.video_source_lineEdit.setText("")
             return
-        try:
-            self.folder_path = folder_path
-            self.files_names_list = self.get_files_list(self.folder_path)
-            self.files_names_absolute_list = get_files_names_absolute_list(self.files_names_list, self.folder_path)
-            self.files_size_list = get_files_size_list(files_list=self.files_names_list, folder_path=self.folder_path)
-        except Exception as e:
-            invalid_path_dialog = InvalidPathDialog()
-            invalid_path_dialog.execute()
-
-    def get_files_list(self, folder_path):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, folder_path)
-        current_extensions = self.video_extensions_comboBox.currentData()
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            if os.path.getsize(temp_files_names_absolute[i]) == 0:
-                continue
-            for j in range(len(current_extensions)):
-                temp_file_extension_start_index = temp_files_names[i].rfind(".")
-                if temp_file_extension_start_index == -1:
-                    continue
-                temp_file_extension = temp_files_names[i][temp_file_extension_start_index + 1:]
-                if temp_file_extension.lower() == current_extensions[j].lower():
-                    result.append(temp_files_names[i])
-                    break
-        return result
+        self.folder_scan_status.start_scan(folder_path, recursive=self.video_include_subfolders_checkBox.isChecked())
+
+    def folder_scan_finished(self, folder_index: FolderIndex):
+        self.folder_index = folder_index
+        self.folder_path = folder_index.folder_path
+        self.update_files_lists_from_folder_index()
+        self.show_files_list()
+        folder_index_registry.watch_folder(self, folder_index)
+
+    def update_files_lists_from_folder_index(self):
+        files_entries = self.folder_index.get_files_entries(extensions=self.video_extensions_comboBox.currentData())
+        self.files_names_list = [file_entry.name for file_entry in files_entries]
+        self.files_names_absolute_list = [file_entry.absolute_path for file_entry in files_entries]
+        self.files_size_list = get_files_size_list(files_entries)
+
+    def is_ready_for_folder_changes(self):
+        return not self.folder_scan_status.is_scanning()
+
+    def apply_folder_changes(self, folder_changes):
+        rows_updates = update_files_names_list(self.files_names_list, folder_changes,
+                                               extensions=self.video_extensions_comboBox.currentData())
+        for row_update_type, row_index, file_entry in rows_updates:
+            if row_update_type == FILE_ROW_REMOVED:
+                self.files_names_absolute_list.pop(row_index)
+                self.files_size_list.pop(row_index)
+                self.table.remove_file_row(row_index)
+            elif row_update_type == FILE_ROW_INSERTED:
+                file_size = get_readable_filesize(size_bytes=file_entry.size)
+                self.files_names_absolute_list.insert(row_index, file_entry.absolute_path)
+                self.files_size_list.insert(row_index, file_size)
+                self.table.insert_file_row(row_index=row_index, file_name=file_entry.name, file_size=file_size)
+            else:
+                file_size = get_readable_filesize(size_bytes=file_entry.size)
+                self.files_names_absolute_list[row_index] = file_entry.absolute_path
+                self.files_size_list[row_index] = file_size
+                self.table.update_file_row(row_index=row_index, file_name=file_entry.name, file_size=file_size)
+        if len(rows_updates) > 0:
+            self.update_other_classes_variables()
+        self.video_extensions_comboBox.update_extensions_counts()
+
+    def folder_scan_failed(self, error_message):
+        invalid_path_dialog = InvalidPathDialog()
+        invalid_path_dialog.execute()
+        self.video_source_lineEdit.setText(self.folder_path)
+
+    def folder_scan_canceled(self):
+        self.video_source_lineEdit.setText(self.folder_path)
 
     def show_files_list(self):
         self.table.show_files_list(files_names_list=self.files_names_list, files_size_list=self.files_size_list)
@@ -105,12 +126,18 @@ class VideoSelectionSetting(GlobalSetting):
         self.video_source_lineEdit.set_current_folder_path(self.folder_path)
         self.video_extensions_comboBox.set_current_folder_path(self.folder_path)
         self.video_extensions_comboBox.set_current_files_list(self.files_names_list)
+        self.video_extensions_comboBox.set_folder_index(self.folder_index)
 
     def check_extension_changes(self, new_extensions):
         if new_extensions != self.current_video_extensions:
             self.current_video_extensions = new_extensions
+            if self.folder_index is not None:
+                self.update_files_lists_from_folder_index()
+                self.show_files_list()
+
+    def include_subfolders_changed(self):
+        if self.folder_path != "":
             self.update_files_lists(self.folder_path)
-            self.show_files_list()
 
     def setup_video_source_label(self):
         self.video_source_label.setText("Video Source Folder:")
@@ -123,8 +150,12 @@ class VideoSelectionSetting(GlobalSetting):
         self.main_layout.addWidget(self.video_source_lineEdit, 0, 1)
         self.main_layout.addWidget(self.video_source_button, 0, 2)
         self.main_layout.addWidget(self.video_extensions_label, 1, 0)
-        self.main_layout.addWidget(self.video_extensions_comboBox, 1, 1)
-        self.main_layout.addWidget(self.table, 2, 0, 1, -1)
+        self.video_options_layout.addWidget(self.video_extensions_comboBox)
+        self.video_options_layout.addWidget(self.video_include_subfolders_checkBox)
+        self.video_options_layout.addStretch()
+        self.main_layout.addLayout(self.video_options_layout, 1, 1)
+        self.main_layout.addWidget(self.folder_scan_status, 2, 0, 1, -1)
+        self.main_layout.addWidget(self.table, 3, 0, 1, -1)
 
     def change_global_last_path_directory(self):
         if self.folder_path != "" and not self.folder_path.isspace():
@@ -152,7 +183,11 @@ class VideoSelectionSetting(GlobalSetting):
         self.video_source_button.clicked_signal.connect(self.update_folder_path)
         self.video_source_lineEdit.edit_finished_signal.connect(self.update_folder_path)
         self.video_extensions_comboBox.close_list.connect(self.check_extension_changes)
+        self.video_include_subfolders_checkBox.toggled.connect(self.include_subfolders_changed)
         self.tab_clicked_signal.connect(self.tab_clicked)
+        self.folder_scan_status.scan_finished_signal.connect(self.folder_scan_finished)
+        self.folder_scan_status.scan_failed_signal.connect(self.folder_scan_failed)
+        self.folder_scan_status.scan_canceled_signal.connect(self.folder_scan_canceled)
 
     def tab_clicked(self):
         if not GlobalSetting.JOB_QUEUE_EMPTY:
@@ -162,10 +197,12 @@ class VideoSelectionSetting(GlobalSetting):
 
     def disable_editable_widgets(self):
         self.video_extensions_comboBox.setEnabled(False)
+        self.video_include_subfolders_checkBox.setEnabled(False)
         self.video_source_lineEdit.setEnabled(False)
         self.video_source_button.setEnabled(False)
 
     def enable_editable_widgets(self):
         self.video_extensions_comboBox.setEnabled(True)
+        self.video_include_subfolders_checkBox.setEnabled(True)
         self.video_source_lineEdit.setEnabled(True)
         self.video_source_button.setEnabled(True)
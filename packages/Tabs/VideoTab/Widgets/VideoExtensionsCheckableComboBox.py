@@ -1,5 +1,3 @@
-import os
-
 from PySide2 import QtCore, QtGui
 from PySide2.QtCore import Qt, QEvent
 from PySide2.QtGui import QFontMetrics
@@ -8,7 +6,8 @@ from PySide2.QtWidgets import QStyledItemDelegate, QComboBox
 from packages.Startup.DefaultOptions import Default_Video_Extension
 from packages.Startup.InitializeScreenResolution import screen_size
 from packages.Startup.PreDefined import AllVideosExtensions
-from packages.Tabs.GlobalSetting import GlobalSetting, get_files_names_absolute_list, sort_names_like_windows
+from packages.Tabs.FolderScanner import get_files_entries
+from packages.Tabs.GlobalSetting import GlobalSetting
 from packages.Tabs.VideoTab.Widgets.ReloadVideoFilesDialog import ReloadVideoFilesDialog
 
 
@@ -30,6 +29,7 @@ class VideoExtensionsCheckableComboBox(QComboBox):
         self.hint_when_enabled = ""
         self.current_folder_path = ""
         self.current_files_list = ""
+        self.folder_index = None
         self.current_extensions = [Default_Video_Extension]
         self.is_there_old_files = False
         self.closeOnLineEditClick = False
@@ -122,7 +122,7 @@ class VideoExtensionsCheckableComboBox(QComboBox):
         extensions_text = []
         for i in range(self.model().rowCount()):
             if self.model().item(i).checkState() == Qt.Checked:
-                extensions_text.append(self.model().item(i).text())
+                extensions_text.append(self.model().item(i).data())
 
         text = ', '.join(extensions_text)
 
@@ -178,26 +178,35 @@ class VideoExtensionsCheckableComboBox(QComboBox):
                 count += 1
         if count == 0:
             for i in range(self.model().rowCount()):
-                if self.model().item(i).text() == Default_Video_Extension:
+                if self.model().item(i).data() == Default_Video_Extension:
                     self.model().item(i).setCheckState(Qt.Checked)
         self.updateText()
 
+    def set_folder_index(self, folder_index):
+        self.folder_index = folder_index
+        self.update_extensions_counts()
+
+    def update_extensions_counts(self):
+        # every extension shows how many files of the folder it would list, the text keeps the count
+        # while the data keeps the bare extension
+        extensions_counts = {}
+        if self.folder_index is not None:
+            extensions_counts = self.folder_index.get_extensions_counts()
+        for i in range(self.model().rowCount()):
+            item = self.model().item(i)
+            extension_count = extensions_counts.get(item.data().lower(), 0)
+            if extension_count > 0:
+                item.setText(item.data() + " (" + str(extension_count) + ")")
+            else:
+                item.setText(item.data())
+
     def get_files_list(self, new_extensions):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(self.current_folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, self.current_folder_path)
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            for j in range(len(new_extensions)):
-                temp_file_extension_start_index = temp_files_names[i].rfind(".")
-                if temp_file_extension_start_index == -1:
-                    continue
-                temp_file_extension = temp_files_names[i][temp_file_extension_start_index + 1:]
-                if temp_file_extension.lower() == new_extensions[j].lower():
-                    result.append(temp_files_names[i])
-                    break
-        return result
+        # the tab keeps an index of its folder, so trying other extensions never lists the folder again
+        if self.folder_index is not None and self.folder_index.folder_path == self.current_folder_path:
+            files_entries = self.folder_index.get_files_entries(extensions=new_extensions)
+        else:
+            files_entries = get_files_entries(self.current_folder_path, extensions=new_extensions)
+        return [file_entry.name for file_entry in files_entries]
 
     def check_extensions_changes(self):
         new_extensions = self.currentData()
@@ -1,23 +1,24 @@
 import PySide2
 from PySide2.QtGui import Qt
-from PySide2.QtWidgets import QAbstractItemView, QHeaderView, QTableWidgetItem
+from PySide2.QtWidgets import QAbstractItemView, QHeaderView
 
 from packages.Startup.InitializeScreenResolution import screen_size
-from packages.Widgets.TableWidget import TableWidget
+from packages.Widgets.FilesTableModel import FilesTableModel
+from packages.Widgets.TableView import TableView
 
 
-class VideoTable(TableWidget):
+class VideoTable(TableView):
     def __init__(self):
         super().__init__()
-        self.setColumnCount(2)
-        self.setRowCount(0)
+        self.files_model = FilesTableModel(columns_names=["Name", "Size"], name_prefix=" ", parent=self)
+        self.setModel(self.files_model)
         self.disable_table_bold_column()
         self.disable_table_edit()
         self.force_select_whole_row()
         self.force_single_row_selection()
         self.make_column_expand_as_possible(column_index=0)
         self.set_row_height(new_height=screen_size.height() // 27)
-        self.setup_columns()
+        self.center_row_numbers()
 
     def disable_table_bold_column(self):
         self.horizontalHeader().setHighlightSections(False)
@@ -35,14 +36,9 @@ class VideoTable(TableWidget):
     def force_single_row_selection(self):
         self.setSelectionMode(QAbstractItemView.SingleSelection)
 
-    def setup_columns(self):
-        self.set_column_name(column_index=0, name="Name")
-        self.set_column_name(column_index=1, name="Size")
-
-    def set_column_name(self, column_index, name):
-        column = QTableWidgetItem(name)
-        column.setTextAlignment(Qt.AlignLeft)
-        self.setHorizontalHeaderItem(column_index, column)
+    def center_row_numbers(self):
+        # the header numbers the rows by itself so inserting or removing a row never renumbers the others
+        self.verticalHeader().setDefaultAlignment(Qt.AlignCenter)
 
     def set_row_height(self, new_height):
         self.verticalHeader().setDefaultSectionSize(new_height)
@@ -55,23 +51,15 @@ class VideoTable(TableWidget):
         self.resize_2nd_column()
 
     def show_files_list(self, files_names_list, files_size_list):
-        self.setRowCount(len(files_names_list))
+        self.files_model.show_files(files_names_list=files_names_list, files_size_list=files_size_list)
         self.set_row_height(new_height=screen_size.height() // 27)
-        for i in range(len(files_names_list)):
-            self.set_row_number(row_number=i + 1, row_index=i)
-            self.set_row_file_name(file_name=files_names_list[i], row_index=i)
-            self.set_row_file_size(file_size=files_size_list[i], row_index=i)
         self.show()
 
-    def set_row_number(self, row_number, row_index):
-        row_number_item = QTableWidgetItem(str(row_number))
-        row_number_item.setTextAlignment(Qt.AlignCenter)
-        self.setVerticalHeaderItem(row_index, row_number_item)
+    def insert_file_row(self, row_index, file_name, file_size):
+        self.files_model.insert_file_row(row_index=row_index, file_name=file_name, file_size=file_size)
 
-    def set_row_file_size(self, file_size, row_index):
-        file_size_item = QTableWidgetItem(file_size)
-        self.setItem(row_index, 1, file_size_item)
+    def update_file_row(self, row_index, file_name, file_size):
+        self.files_model.update_file_row(row_index=row_index, file_name=file_name, file_size=file_size)
 
-    def set_row_file_name(self, file_name, row_index):
-        file_name_item = QTableWidgetItem(" " + file_name)
-        self.setItem(row_index, 0, file_name_item)
+    def remove_file_row(self, row_index):
+        self.files_model.remove_file_row(row_index)
@@ -4,11 +4,11 @@ from PySide2 import QtGui, QtCore
 from PySide2.QtWidgets import QGridLayout, QLabel, \
     QDialog, QPushButton, QHBoxLayout
 
-from packages.Startup import GlobalFiles
+from packages.Startup import GlobalFiles, GlobalPaths
 
 
 def click_show_log_file():
-    webbrowser.open(GlobalFiles.LogFilePath)
+    webbrowser.open(GlobalPaths.LogFilePath)
 
 
 class ErrorDialog(QDialog):
@@ -0,0 +1,125 @@
+from PySide2.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from PySide2.QtGui import QColor
+
+UNCHECKED_FILE_TEXT_COLOR = QColor("#787878")
+
+
+# the files of a table kept as plain lists, the view asks only for the rows it paints so showing a folder
+# costs the same for ten files and for fifty thousand, a change to the files tells the view which rows changed
+# the first column is the file name, the second one if there is one is the file size
+class FilesTableModel(QAbstractTableModel):
+    file_check_state_changed_signal = Signal(int, bool)
+
+    def __init__(self, columns_names, name_prefix="", header_alignment=Qt.AlignLeft, checkable=False, parent=None):
+        super().__init__(parent)
+        self.columns_names = columns_names
+        self.name_prefix = name_prefix
+        self.header_alignment = header_alignment
+        self.checkable = checkable
+        self.files_names_list = []  # type: list[str]
+        self.files_size_list = []  # type: list[str]
+        self.files_checked_list = []  # type: list[bool]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.files_names_list)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns_names)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row_index = index.row()
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return self.get_row_text(row_index)
+            return self.files_size_list[row_index]
+        if self.checkable:
+            if role == Qt.CheckStateRole and index.column() == 0:
+                return Qt.Checked if self.files_checked_list[row_index] else Qt.Unchecked
+            if role == Qt.TextColorRole and not self.files_checked_list[row_index]:
+                return UNCHECKED_FILE_TEXT_COLOR
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole):
+        if not self.checkable or role != Qt.CheckStateRole or index.column() != 0:
+            return False
+        row_index = index.row()
+        is_checked = value == Qt.Checked
+        self.files_checked_list[row_index] = is_checked
+        self.dataChanged.emit(self.index(row_index, 0), self.index(row_index, self.columnCount() - 1))
+        self.file_check_state_changed_signal.emit(row_index, is_checked)
+        return True
+
+    def flags(self, index: QModelIndex):
+        item_flags = super().flags(index)
+        if self.checkable and index.isValid() and index.column() == 0:
+            item_flags |= Qt.ItemIsUserCheckable
+        return item_flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole:
+                return self.columns_names[section]
+            if role == Qt.TextAlignmentRole:
+                return self.header_alignment
+            return None
+        if role == Qt.DisplayRole:
+            return str(section + 1)
+        return None
+
+    def get_row_text(self, row_index):
+        return self.name_prefix + self.files_names_list[row_index]
+
+    def show_files(self, files_names_list, files_size_list=None):
+        # the lists are copied, the tabs change theirs in place before they tell the table which rows changed
+        self.beginResetModel()
+        self.files_names_list = files_names_list[:]
+        self.files_size_list = files_size_list[:] if files_size_list is not None else []
+        self.files_checked_list = [True] * len(files_names_list)
+        self.endResetModel()
+
+    def clear_files(self):
+        self.show_files(files_names_list=[])
+
+    def show_files_after_swapping(self, files_names_list):
+        # a swap changes a few rows in place, only the runs of rows that differ are repainted
+        first_changed_row_index = -1
+        for row_index in range(len(files_names_list) + 1):
+            is_changed = row_index < len(files_names_list) and \
+                         files_names_list[row_index] != self.files_names_list[row_index]
+            if is_changed:
+                self.files_names_list[row_index] = files_names_list[row_index]
+                if first_changed_row_index == -1:
+                    first_changed_row_index = row_index
+            elif first_changed_row_index != -1:
+                self.dataChanged.emit(self.index(first_changed_row_index, 0),
+                                      self.index(row_index - 1, self.columnCount() - 1))
+                first_changed_row_index = -1
+
+    def insert_file_row(self, row_index, file_name, file_size=""):
+        self.beginInsertRows(QModelIndex(), row_index, row_index)
+        self.files_names_list.insert(row_index, file_name)
+        if len(self.columns_names) > 1:
+            self.files_size_list.insert(row_index, file_size)
+        self.files_checked_list.insert(row_index, True)
+        self.endInsertRows()
+
+    def update_file_row(self, row_index, file_name, file_size=""):
+        # the check state of the row stays as it is
+        self.files_names_list[row_index] = file_name
+        if len(self.columns_names) > 1:
+            self.files_size_list[row_index] = file_size
+        self.dataChanged.emit(self.index(row_index, 0), self.index(row_index, self.columnCount() - 1))
+
+    def remove_file_row(self, row_index):
+        self.beginRemoveRows(QModelIndex(), row_index, row_index)
+        self.files_names_list.pop(row_index)
+        if len(self.columns_names) > 1:
+            self.files_size_list.pop(row_index)
+        self.files_checked_list.pop(row_index)
+        self.endRemoveRows()
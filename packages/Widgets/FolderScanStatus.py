@@ -0,0 +1,111 @@
+from PySide2.QtCore import QThread, Signal, QCoreApplication
+from PySide2.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton
+
+from packages.Tabs.FolderIndexRegistry import folder_index_registry
+from packages.Tabs.FolderScanWorker import FolderScanWorker
+
+
+# runs the folder scans of a tab in the background and shows how many files were found with a cancel button,
+# it stays hidden while no scan is running
+# a folder another tab already shows is not scanned again, its shared index is brought up to date instead
+class FolderScanStatus(QWidget):
+    scan_finished_signal = Signal(object)  # folder index
+    scan_failed_signal = Signal(str)
+    scan_canceled_signal = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.files_count_label = QLabel()
+        self.cancel_button = QPushButton("Cancel")
+        self.main_layout = QHBoxLayout()
+        self.current_scan_id = 0
+        self.running_scans = {}  # type: dict[int, tuple[QThread, FolderScanWorker]]
+        self.setup_layout()
+        self.cancel_button.clicked.connect(self.cancel_scan)
+        QCoreApplication.instance().aboutToQuit.connect(self.stop_all_scans)
+        self.hide()
+
+    def setup_layout(self):
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.addWidget(self.files_count_label)
+        self.main_layout.addStretch()
+        self.main_layout.addWidget(self.cancel_button)
+        self.setLayout(self.main_layout)
+
+    def start_scan(self, folder_path, recursive=False):
+        self.cancel_running_scans()
+        # the refresh is read on the thread of the folder changes, a folder that cannot be read anymore
+        # is dropped by it and scanned like a new one
+        scan_id = self.current_scan_id
+        folder_index_registry.refresh_folder(folder_path, recursive=recursive,
+                                             refreshed_callback=lambda: self.folder_refreshed(scan_id, folder_path,
+                                                                                              recursive))
+
+    def folder_refreshed(self, scan_id, folder_path, recursive):
+        if scan_id != self.current_scan_id:
+            return
+        folder_index = folder_index_registry.get_folder_index(folder_path, recursive=recursive)
+        if folder_index is not None:
+            self.hide()
+            self.scan_finished_signal.emit(folder_index)
+            return
+        self.scan_folder(folder_path, recursive)
+
+    def scan_folder(self, folder_path, recursive):
+        self.current_scan_id += 1
+        scan_id = self.current_scan_id
+        folder_scan_worker = FolderScanWorker(scan_id=scan_id, folder_path=folder_path, recursive=recursive)
+        folder_scan_thread = QThread()
+        folder_scan_worker.moveToThread(folder_scan_thread)
+        folder_scan_thread.started.connect(folder_scan_worker.run)
+        folder_scan_worker.files_found_signal.connect(self.update_files_count)
+        folder_scan_worker.finished_signal.connect(self.scan_finished)
+        folder_scan_worker.failed_signal.connect(self.scan_failed)
+        folder_scan_worker.finished_signal.connect(folder_scan_thread.quit)
+        folder_scan_worker.failed_signal.connect(folder_scan_thread.quit)
+        folder_scan_worker.canceled_signal.connect(folder_scan_thread.quit)
+        folder_scan_thread.finished.connect(lambda: self.scan_thread_finished(scan_id))
+        self.running_scans[scan_id] = (folder_scan_thread, folder_scan_worker)
+        self.files_count_label.setText("Scanning folder...")
+        self.show()
+        folder_scan_thread.start()
+
+    def is_scanning(self):
+        return self.current_scan_id in self.running_scans
+
+    def update_files_count(self, scan_id, number_of_files):
+        if scan_id == self.current_scan_id:
+            self.files_count_label.setText("Scanning folder... " + str(number_of_files) + " files found")
+
+    def scan_finished(self, scan_id, folder_index):
+        if scan_id == self.current_scan_id:
+            self.hide()
+            self.scan_finished_signal.emit(folder_index_registry.get_shared_folder_index(folder_index))
+
+    def scan_failed(self, scan_id, error_message):
+        if scan_id == self.current_scan_id:
+            self.hide()
+            self.scan_failed_signal.emit(error_message)
+
+    def cancel_scan(self):
+        if self.current_scan_id in self.running_scans:
+            self.cancel_running_scans()
+            self.hide()
+            self.scan_canceled_signal.emit()
+
+    def cancel_running_scans(self):
+        # a canceled scan keeps its thread until it notices the flag, its results are ignored from now on
+        for folder_scan_thread, folder_scan_worker in self.running_scans.values():
+            folder_scan_worker.cancel = True
+        self.current_scan_id += 1
+
+    def scan_thread_finished(self, scan_id):
+        folder_scan_thread, folder_scan_worker = self.running_scans.pop(scan_id)
+        folder_scan_worker.deleteLater()
+        folder_scan_thread.deleteLater()
+
+    def stop_all_scans(self):
+        for folder_scan_thread, folder_scan_worker in list(self.running_scans.values()):
+            folder_scan_worker.cancel = True
+            folder_scan_thread.quit()
+            folder_scan_thread.wait()
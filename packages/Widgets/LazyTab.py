@@ -0,0 +1,21 @@
+from PySide2.QtWidgets import QWidget, QVBoxLayout
+
+
+# empty page that builds the real tab the first time it is needed
+class LazyTab(QWidget):
+    def __init__(self, create_tab_function):
+        super().__init__()
+        self.create_tab_function = create_tab_function
+        self.tab = None  # type: QWidget
+        self.main_layout = QVBoxLayout()
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self.main_layout)
+
+    def get_tab(self):
+        if self.tab is None:
+            self.tab = self.create_tab_function()
+            self.main_layout.addWidget(self.tab)
+        return self.tab
+
+    def is_created(self):
+        return self.tab is not None
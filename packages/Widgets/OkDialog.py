@@ -5,11 +5,11 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel, \
     QDialog, QPushButton, QHBoxLayout
 
-from packages.Startup import GlobalFiles
+from packages.Startup import GlobalFiles, GlobalPaths
 
 
 def click_show_log_file():
-    webbrowser.open(GlobalFiles.LogFilePath)
+    webbrowser.open(GlobalPaths.LogFilePath)
 
 
 class OkDialog(QDialog):
@@ -1,23 +1,29 @@
+import heapq
+
 import PySide2
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QFontMetrics, QPaintEvent
 from PySide2.QtWidgets import QGridLayout, QTableWidgetItem, \
-    QHeaderView, QAbstractItemView, QTableWidget
+    QHeaderView, QAbstractItemView, QTableWidget, QTableView
 
+from packages.Widgets.FilesTableModel import FilesTableModel
 from packages.Widgets.TableNoSelection import TableWidgetNoSelection
 
+MEASURED_LONGEST_ROWS_COUNT = 200
+
 
+# the files are shown by a view over a files model, the model is set once so the selection model of the view
+# that the layouts connect to stays the same
 class TableFixedHeaderWidget(QTableWidget):
-    def __init__(self, primarytable=QTableWidget(), headername="Test", numberofcolumn=1):
+    def __init__(self, primarytable: QTableView, headername="Test", numberofcolumn=1, name_prefix=""):
         QTableWidget.__init__(self)
         self.table = primarytable
-        self.table.setColumnCount(numberofcolumn)
+        self.files_model = FilesTableModel(columns_names=[headername] * numberofcolumn, name_prefix=name_prefix,
+                                           header_alignment=Qt.AlignCenter, parent=self)
+        self.table.setModel(self.files_model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.column0 = QTableWidgetItem(headername)
-        self.column0.setTextAlignment(Qt.AlignCenter)
-        self.table.setHorizontalHeaderItem(0, self.column0)
 
         self.tableHeader = TableWidgetNoSelection()
         self.column1 = QTableWidgetItem(headername)
@@ -35,6 +41,7 @@ class TableFixedHeaderWidget(QTableWidget):
         self.tableLayout.addWidget(self.tableHeader, 0, 0, -1, 1)
         self.tableLayout.setContentsMargins(0, 0, 0, 0)
         self.tableLayout.setSpacing(0)
+        self.reset_rows_width()
 
     def takeupdate(self):
         # make sure that new header place exactly on old header [Width Checker]
@@ -52,16 +59,39 @@ class TableFixedHeaderWidget(QTableWidget):
         # make sure that new header place exactly on old header [Position Checker]
         self.tableHeader.move(self.table.pos())
 
+    def reset_rows_width(self):
+        self.measured_rows_count = 0
+        self.longest_row_width = 0
+
+    def get_row_text_width(self, row_index):
+        return QFontMetrics(self.table.font()).horizontalAdvance(self.files_model.get_row_text(row_index))
+
     def update_row_size(self):
-        new_column_width = self.tableHeader.width()
+        # only the rows shown since the last paint are measured, the tables reset it when they show new files
+        if self.measured_rows_count > self.files_model.rowCount():
+            self.reset_rows_width()
+        if self.measured_rows_count < self.files_model.rowCount():
+            # measuring every name of a big folder takes longer than painting it, the widest name is
+            # one of the longest ones so only those are measured
+            font_metrics = QFontMetrics(self.table.font())
+            rows_texts = heapq.nlargest(MEASURED_LONGEST_ROWS_COUNT,
+                                        map(self.files_model.get_row_text, range(self.measured_rows_count,
+                                                                                 self.files_model.rowCount())),
+                                        key=len)
+            self.longest_row_width = max(self.longest_row_width, max(map(font_metrics.horizontalAdvance, rows_texts)))
+            self.measured_rows_count = self.files_model.rowCount()
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
-        for i in range(self.table.rowCount()):
-            column_font = self.table.item(i, 0).font()
-            column_font_metrics = QFontMetrics(column_font)
-            new_column_width = max(new_column_width, column_font_metrics.horizontalAdvance(
-                self.table.item(i, 0).text()))
-        new_column_width += 15
-        self.table.setColumnWidth(0, new_column_width)
+        self.table.setColumnWidth(0, max(self.tableHeader.width(), self.longest_row_width) + 15)
+
+    def measure_inserted_row(self, row_index):
+        if row_index < self.measured_rows_count:
+            self.measured_rows_count += 1
+            self.longest_row_width = max(self.longest_row_width, self.get_row_text_width(row_index))
+
+    def forget_removed_row(self, row_index):
+        # the column keeps its width, it only grows back when new files are shown
+        if row_index < self.measured_rows_count:
+            self.measured_rows_count -= 1
 
     def paintEvent(self, a0: QPaintEvent) -> None:
         self.update_row_size()
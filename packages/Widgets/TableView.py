@@ -0,0 +1,9 @@
+from PySide2.QtWidgets import QTableView
+
+from packages.Widgets.TableViewDelegate import TableViewDelegate
+
+
+class TableView(QTableView):
+    def __init__(self):
+        super().__init__()
+        self.setItemDelegate(TableViewDelegate(self))
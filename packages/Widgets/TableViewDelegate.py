@@ -0,0 +1,37 @@
+from PySide2 import QtGui
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QPalette
+from PySide2.QtWidgets import QStyledItemDelegate, QStyle
+
+
+class TableViewDelegate(QStyledItemDelegate):
+    color_default = QtGui.QColor("#aaedff")  # aaedff: blue Kashef
+
+    def paint(self, painter, option, index):
+        if option.state & QStyle.State_Selected:
+            item_color = index.data(role=Qt.TextColorRole)
+            if item_color is None:
+                item_color = Qt.black
+            option.palette.setColor(QPalette.HighlightedText, item_color)
+            option.palette.setColor(QPalette.Highlight, self.selected_background(option, index))
+        QStyledItemDelegate.paint(self, painter, option, index)
+
+    def selected_background(self, option, index):
+        return self.combineColors(self.color_default, self.background(option, index))
+
+    def background(self, option, index):
+        item_background = index.data(role=Qt.BackgroundRole)
+        if item_background is not None:
+            return QtGui.QBrush(item_background).color()
+        if self.parent().alternatingRowColors():
+            if index.row() % 2 == 1:
+                return option.palette.color(QPalette.AlternateBase)
+        return option.palette.color(QPalette.Base)
+
+    @staticmethod
+    def combineColors(c1, c2):
+        c3 = QtGui.QColor()
+        c3.setRed((c1.red() + c2.red()) // 2)
+        c3.setGreen((c1.green() + c2.green()) // 2)
+        c3.setBlue((c1.blue() + c2.blue()) // 2)
+        return c3
@@ -0,0 +1,24 @@
+import typing
+
+from PySide2 import QtGui, QtCore
+
+from packages.Widgets.TableView import TableView
+
+
+# a table that only shows the selection it is given, like the videos next to the matched files
+class TableViewNoSelection(TableView):
+    def __init__(self):
+        super().__init__()
+        self.preventSelect = True
+
+    def selectionCommand(self, index: QtCore.QModelIndex,
+                         event: typing.Optional[QtCore.QEvent] = ...) -> QtCore.QItemSelectionModel.SelectionFlags:
+        if (self.preventSelect == False):
+            return super().selectionCommand(index, event)
+        if (event is None):  # when selecting programitcally or press on header
+            return QtCore.QItemSelectionModel.NoUpdate
+        else:
+            return super().selectionCommand(index, event)
+
+    def mousePressEvent(self, e: QtGui.QMouseEvent) -> None:
+        return
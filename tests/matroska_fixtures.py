@@ -0,0 +1,179 @@
+# the matroska files of the tests and of the probe benchmarks, written element by element
+import json
+import zlib
+
+from packages.Tabs.MuxSetting.Widgets import MatroskaHeaderReader as reader
+
+CLUSTER_PADDING_BYTES = 64 * 1024
+LANGUAGES = ("jpn", "eng", "fre", "ger", "spa")
+
+
+def encode_element(element_id, payload):
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    size_length = 1
+    while len(payload) >= (1 << (7 * size_length)) - 1:
+        size_length += 1
+    size_bytes = (len(payload) | (1 << (7 * size_length))).to_bytes(size_length, "big")
+    return id_bytes + size_bytes + payload
+
+
+def encode_unsigned(element_id, value, length=None):
+    length = length or max(1, (value.bit_length() + 7) // 8)
+    return encode_element(element_id, value.to_bytes(length, "big"))
+
+
+def encode_string(element_id, text):
+    return encode_element(element_id, text.encode("utf-8"))
+
+
+def generate_tracks(file_index):
+    # a video, one or two audios and a few subtitles, some flags and languages are left to their defaults
+    tracks = [{"type": 1, "codec_id": "V_MPEGH/ISO/HEVC", "language": "und", "default": True, "forced": False}]
+    for audio_index in range(1 + file_index % 2):
+        tracks.append({"type": 2, "codec_id": "A_AAC", "language": LANGUAGES[audio_index],
+                       "default": audio_index == 0, "forced": False})
+    for subtitle_index in range(file_index % 4):
+        tracks.append({"type": 17, "codec_id": "S_TEXT/ASS", "language": LANGUAGES[(file_index + subtitle_index) % 5],
+                       "default": None if subtitle_index == 0 else False, "forced": subtitle_index == 1,
+                       "name": "Subtitle " + str(subtitle_index + 1)})
+    tracks[-1]["language"] = None if file_index % 5 == 0 else tracks[-1]["language"]
+    return tracks
+
+
+def encode_track_entry(track_number, track):
+    payload = encode_unsigned(reader.TRACK_NUMBER_ID, track_number) + \
+        encode_unsigned(reader.TRACK_UID_ID, 1000 + track_number, 8) + \
+        encode_unsigned(reader.TRACK_TYPE_ID, track["type"]) + \
+        encode_string(reader.CODEC_ID_ID, track["codec_id"])
+    if track.get("name") is not None:
+        payload += encode_string(reader.TRACK_NAME_ID, track["name"])
+    if track["language"] is not None:
+        payload += encode_string(reader.LANGUAGE_ID, track["language"])
+    if track["default"] is not None:
+        payload += encode_unsigned(reader.FLAG_DEFAULT_ID, int(track["default"]))
+    payload += encode_unsigned(reader.FLAG_FORCED_ID, int(track["forced"]))
+    return encode_element(reader.TRACK_ENTRY_ID, payload)
+
+
+def encode_attachments(number_of_attachments):
+    payload = b""
+    for attachment_index in range(number_of_attachments):
+        payload += encode_element(reader.ATTACHED_FILE_ID,
+                                  encode_string(reader.FILE_NAME_ID, "font" + str(attachment_index) + ".ttf") +
+                                  encode_string(reader.FILE_MIME_TYPE_ID, "font/ttf") +
+                                  encode_element(reader.FILE_DATA_ID, bytes(512 + attachment_index)) +
+                                  encode_unsigned(reader.FILE_UID_ID, 7 + attachment_index, 8))
+    return encode_element(reader.ATTACHMENTS_ID, payload)
+
+
+def encode_seek_head(elements_positions):
+    payload = b""
+    for element_id, element_position in elements_positions:
+        payload += encode_element(reader.SEEK_ID, encode_unsigned(reader.SEEK_ELEMENT_ID, element_id) +
+                                  encode_unsigned(reader.SEEK_POSITION_ID, element_position, 8))
+    return encode_element(reader.SEEK_HEAD_ID, payload)
+
+
+def encode_tracks(tracks, with_crc):
+    payload = b"".join(encode_track_entry(track_index + 1, track) for track_index, track in enumerate(tracks))
+    if with_crc:
+        payload = encode_element(0xBF, zlib.crc32(payload).to_bytes(4, "little")) + payload
+    return encode_element(reader.TRACKS_ID, payload)
+
+
+def encode_cluster(laced_blocks, unknown_size):
+    # the blocks are never read, the laced ones only check that a cluster is skipped whatever it holds
+    payload = encode_unsigned(0xE7, 0)
+    if laced_blocks:
+        # a xiph laced simple block with three frames and a block group with an ebml laced block
+        payload += encode_element(0xA3, b"\x81\x00\x00\x82\x02\xff\x10\x20" + bytes(300))
+        payload += encode_element(0xA0, encode_element(0xA1, b"\x82\x00\x00\x06\x01\x40\x20\x5f\xef" +
+                                                       bytes(100)))
+    payload += encode_element(0xA3, bytes(CLUSTER_PADDING_BYTES))
+    if unknown_size:
+        return reader.CLUSTER_ID.to_bytes(4, "big") + b"\xff" + payload
+    return encode_element(reader.CLUSTER_ID, payload)
+
+
+def write_fixture_file(file_path, file_index, with_seek_head=None, tracks_after_cluster=False,
+                       unknown_size_segment=False, unknown_size_cluster=False, laced_blocks=False):
+    # the attachments are written after the cluster so they are only found through the seek head,
+    # every fourth file has no seek head and is read by walking over its cluster, every third one has a crc
+    # the keyword options build the layouts the tests need, the tracks after the cluster need a seek head too
+    tracks = generate_tracks(file_index)
+    number_of_attachments = file_index % 3
+    info_element = encode_element(0x1549A966, encode_unsigned(0x2AD7B1, 1000000))
+    tracks_element = encode_tracks(tracks, with_crc=file_index % 3 == 1)
+    cluster_element = encode_cluster(laced_blocks, unknown_size_cluster)
+    attachments_element = encode_attachments(number_of_attachments) if number_of_attachments > 0 else b""
+    if with_seek_head is None:
+        with_seek_head = file_index % 4 != 0
+    if tracks_after_cluster:
+        segment_children = [info_element, cluster_element, tracks_element, attachments_element]
+    else:
+        segment_children = [info_element, tracks_element, cluster_element, attachments_element]
+    segment_payload = b"".join(segment_children)
+    if with_seek_head:
+        seek_elements = [(reader.TRACKS_ID, tracks_element)]
+        if number_of_attachments > 0:
+            seek_elements.append((reader.ATTACHMENTS_ID, attachments_element))
+        # the positions are written with a fixed length, so the size of the seek head is known before them
+        seek_head_size = len(encode_seek_head([(element_id, 0) for element_id, element in seek_elements]))
+        seek_entries = []
+        for element_id, element in seek_elements:
+            element_index = segment_children.index(element)
+            seek_entries.append((element_id, seek_head_size + sum(len(child) for child in
+                                                                  segment_children[:element_index])))
+        segment_payload = encode_seek_head(seek_entries) + segment_payload
+    ebml_header = encode_element(reader.EBML_ID, encode_unsigned(0x4286, 1) +
+                                 encode_string(reader.DOC_TYPE_ID, "matroska"))
+    if unknown_size_segment:
+        segment_element = reader.SEGMENT_ID.to_bytes(4, "big") + b"\x01\xff\xff\xff\xff\xff\xff\xff" + \
+            segment_payload
+    else:
+        segment_element = encode_element(reader.SEGMENT_ID, segment_payload)
+    with open(file_path, "wb") as fixture_file:
+        fixture_file.write(ebml_header + segment_element)
+    return get_expected_info(tracks, number_of_attachments)
+
+
+def get_expected_info(tracks, number_of_attachments):
+    type_names = {1: "video", 2: "audio", 17: "subtitles"}
+    expected_tracks = []
+    for track_index, track in enumerate(tracks):
+        properties = {
+            "number": track_index + 1,
+            "uid": 1000 + track_index + 1,
+            "codec_id": track["codec_id"],
+            "language": track["language"] or "eng",
+            "enabled_track": True,
+            "default_track": True if track["default"] is None else track["default"],
+            "forced_track": track["forced"],
+        }
+        if track.get("name") is not None:
+            properties["track_name"] = track["name"]
+        expected_tracks.append({"id": track_index, "type": type_names[track["type"]], "properties": properties})
+    expected_attachments = [{"id": attachment_index + 1, "file_name": "font" + str(attachment_index) + ".ttf",
+                             "content_type": "font/ttf", "size": 512 + attachment_index,
+                             "properties": {"uid": 7 + attachment_index}}
+                            for attachment_index in range(number_of_attachments)]
+    return {"container": {"recognized": True, "supported": True, "type": "Matroska"}, "tracks": expected_tracks,
+            "attachments": expected_attachments, "errors": [], "warnings": []}
+
+
+def write_flags_job(job_file_path, video_path, flags):
+    # the same options file a mkvpropedit job gets, flags is a list of (track number, name, value)
+    options = ["--ui-language", "en", "--gui-mode", video_path]
+    for track_number, flag_name, flag_value in flags:
+        options += ["--edit", "track:" + str(track_number), "--set", flag_name + "=" + str(int(flag_value))]
+    with open(job_file_path, "w", encoding="utf-8") as job_file:
+        json.dump(options, job_file)
+
+
+def get_audio_flags(info, inverted):
+    flags = []
+    for track in info["tracks"]:
+        if track["type"] == "audio":
+            flags.append((track["id"] + 1, "flag-default", track["properties"]["default_track"] != inverted))
+            flags.append((track["id"] + 1, "flag-forced", track["properties"]["forced_track"] != inverted))
+    return flags
@@ -0,0 +1,149 @@
+import os
+
+from packages.Tabs.FolderChanges import FolderChanges
+from packages.Tabs.FolderIndex import FILE_ROW_INSERTED, FILE_ROW_REMOVED, FILE_ROW_UPDATED, FolderIndex, \
+    update_files_names_list
+from packages.Tabs.FolderScanner import read_file_entry, scan_folder_in_chunks, scan_folder_tree_in_chunks
+from packages.Tabs.GlobalSetting import get_sorted_index
+
+OLD_TIME_NS = 1500000000 * 10 ** 9
+
+
+def write_file(folder_path, relative_path, size=10, modification_time_ns=OLD_TIME_NS):
+    # old files, so they are not pending and only the listing tells what changed
+    file_path = os.path.join(str(folder_path), relative_path)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "wb") as written_file:
+        written_file.write(bytes(size))
+    os.utime(file_path, ns=(modification_time_ns, modification_time_ns))
+
+
+def create_folder_index(folder_path, recursive=False):
+    files_entries = []
+    subfolders_relative_paths = []
+    if recursive:
+        files_entries_chunks = scan_folder_tree_in_chunks(str(folder_path),
+                                                          subfolders_relative_paths=subfolders_relative_paths)
+    else:
+        files_entries_chunks = scan_folder_in_chunks(str(folder_path))
+    for files_entries_chunk in files_entries_chunks:
+        files_entries.extend(files_entries_chunk)
+    return FolderIndex(folder_path=str(folder_path), files_entries=files_entries, recursive=recursive,
+                       subfolders_relative_paths=subfolders_relative_paths)
+
+
+def get_names(files_entries):
+    return sorted(file_entry.name for file_entry in files_entries)
+
+
+def test_read_changes_of_whole_folder(tmp_path):
+    write_file(tmp_path, "episode 1.mkv")
+    write_file(tmp_path, "episode 2.mkv", size=20)
+    folder_index = create_folder_index(tmp_path)
+    os.remove(os.path.join(str(tmp_path), "episode 1.mkv"))
+    write_file(tmp_path, "episode 3.mkv", size=30)
+    folder_changes = folder_index.read_changes()
+    assert get_names(folder_changes.removed) == ["episode 1.mkv"]
+    assert get_names(folder_changes.added) == ["episode 3.mkv"]
+    assert folder_changes.renamed == []
+    folder_index.apply_changes(folder_changes)
+    assert [file_entry.name for file_entry in folder_index.get_files_entries()] == ["episode 2.mkv", "episode 3.mkv"]
+
+
+def test_only_changed_folders_are_listed(tmp_path):
+    write_file(tmp_path, "top.mkv")
+    write_file(tmp_path, os.path.join("season 1", "episode 1.mkv"))
+    write_file(tmp_path, os.path.join("season 2", "episode 1.mkv"), size=20)
+    folder_index = create_folder_index(tmp_path, recursive=True)
+    write_file(tmp_path, os.path.join("season 1", "episode 2.mkv"), size=30)
+    write_file(tmp_path, os.path.join("season 2", "episode 2.mkv"), size=40)
+    folder_changes = folder_index.read_changes({"season 1"})
+    assert get_names(folder_changes.added) == [os.path.join("season 1", "episode 2.mkv")]
+    assert folder_changes.removed == [] and folder_changes.added_folders == []
+
+
+def test_new_and_removed_subfolders(tmp_path):
+    write_file(tmp_path, os.path.join("season 1", "episode 1.mkv"))
+    write_file(tmp_path, os.path.join("season 1", "extras", "opening.mkv"), size=20)
+    folder_index = create_folder_index(tmp_path, recursive=True)
+    for file_path in (os.path.join("season 1", "extras", "opening.mkv"), os.path.join("season 1", "episode 1.mkv")):
+        os.remove(os.path.join(str(tmp_path), file_path))
+    os.rmdir(os.path.join(str(tmp_path), "season 1", "extras"))
+    os.rmdir(os.path.join(str(tmp_path), "season 1"))
+    write_file(tmp_path, os.path.join("season 2", "episode 1.mkv"), size=30)
+    write_file(tmp_path, os.path.join("season 2", "extras", "ending.mkv"), size=40)
+    folder_changes = folder_index.read_changes({"", "season 1", os.path.join("season 1", "extras")})
+    assert get_names(folder_changes.removed) == [os.path.join("season 1", "episode 1.mkv"),
+                                                 os.path.join("season 1", "extras", "opening.mkv")]
+    assert get_names(folder_changes.added) == [os.path.join("season 2", "episode 1.mkv"),
+                                               os.path.join("season 2", "extras", "ending.mkv")]
+    assert sorted(folder_changes.removed_folders) == ["season 1", os.path.join("season 1", "extras")]
+    assert sorted(folder_changes.added_folders) == ["season 2", os.path.join("season 2", "extras")]
+    folder_index.apply_changes(folder_changes)
+    assert folder_index.read_changes(None).is_empty()
+
+
+def test_rename_found_when_unambiguous(tmp_path):
+    write_file(tmp_path, "episode 1.mkv")
+    write_file(tmp_path, "episode 2.mkv", size=20)
+    folder_index = create_folder_index(tmp_path)
+    os.rename(os.path.join(str(tmp_path), "episode 1.mkv"), os.path.join(str(tmp_path), "episode 01.mkv"))
+    folder_changes = folder_index.read_changes()
+    assert [(old_file_entry.name, new_file_entry.name) for old_file_entry, new_file_entry in
+            folder_changes.renamed] == [("episode 1.mkv", "episode 01.mkv")]
+    assert folder_changes.added == [] and folder_changes.removed == []
+
+
+def test_rename_not_guessed_when_ambiguous(tmp_path):
+    # two files with the same size and time renamed at once could have been swapped
+    write_file(tmp_path, "episode 1.mkv")
+    write_file(tmp_path, "episode 2.mkv")
+    folder_index = create_folder_index(tmp_path)
+    os.rename(os.path.join(str(tmp_path), "episode 1.mkv"), os.path.join(str(tmp_path), "a.mkv"))
+    os.rename(os.path.join(str(tmp_path), "episode 2.mkv"), os.path.join(str(tmp_path), "b.mkv"))
+    folder_changes = folder_index.read_changes()
+    assert folder_changes.renamed == []
+    assert get_names(folder_changes.removed) == ["episode 1.mkv", "episode 2.mkv"]
+    assert get_names(folder_changes.added) == ["a.mkv", "b.mkv"]
+
+
+def test_pending_file_modified(tmp_path):
+    write_file(tmp_path, "episode 1.mkv", size=0)
+    folder_index = create_folder_index(tmp_path)
+    write_file(tmp_path, "episode 1.mkv", size=50)
+    folder_changes = folder_index.read_changes(set())
+    assert [(file_entry.name, file_entry.size) for file_entry in folder_changes.modified] == [("episode 1.mkv", 50)]
+
+
+def test_get_sorted_index():
+    names_list = ["episode 1.mkv", "episode 2.mkv", "episode 10.mkv"]
+    assert get_sorted_index(names_list, "episode 10.mkv") == 2
+    assert get_sorted_index(names_list, "episode 3.mkv") == -1
+    assert get_sorted_index(["Episode 1.mkv", "episode 1.mkv"], "episode 1.mkv") == 1
+
+
+def get_file_entry(folder_path, file_name, size=10):
+    write_file(folder_path, file_name, size=size)
+    return read_file_entry(str(folder_path), file_name)
+
+
+def test_update_files_names_list(tmp_path):
+    files_names_list = ["episode 1.mkv", "episode 2.mkv", "episode 3.mkv"]
+    removed = get_file_entry(tmp_path, "episode 2.mkv")
+    added = get_file_entry(tmp_path, "episode 10.mkv")
+    not_shown = get_file_entry(tmp_path, "episode 4.ass")
+    folder_changes = FolderChanges(added=[added, not_shown], removed=[removed])
+    rows_updates = update_files_names_list(files_names_list, folder_changes, extensions=["mkv"])
+    assert files_names_list == ["episode 1.mkv", "episode 3.mkv", "episode 10.mkv"]
+    assert [(row_update_type, row_index) for row_update_type, row_index, file_entry in rows_updates] == \
+           [(FILE_ROW_REMOVED, 1), (FILE_ROW_INSERTED, 2)]
+
+
+def test_update_swapped_files_names_list(tmp_path):
+    files_names_list = ["episode 3.mkv", "episode 1.mkv", "episode 2.mkv"]
+    renamed = (get_file_entry(tmp_path, "episode 3.mkv"), get_file_entry(tmp_path, "episode 03.mkv"))
+    removed = get_file_entry(tmp_path, "episode 1.mkv")
+    rows_updates = update_files_names_list(files_names_list, FolderChanges(removed=[removed], renamed=[renamed]))
+    assert files_names_list == ["episode 03.mkv", "episode 2.mkv"]
+    assert [(row_update_type, row_index) for row_update_type, row_index, file_entry in rows_updates] == \
+           [(FILE_ROW_REMOVED, 1), (FILE_ROW_UPDATED, 0)]
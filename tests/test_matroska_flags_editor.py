@@ -0,0 +1,110 @@
+import os
+import zlib
+
+from packages.Tabs.MuxSetting.Widgets import MatroskaFlagsEditor
+from packages.Tabs.MuxSetting.Widgets.MatroskaFlagsEditor import edit_flags_in_place, get_crc_position
+from packages.Tabs.MuxSetting.Widgets.MatroskaHeaderReader import TRACKS_ID, find_segment, \
+    find_top_level_elements, read_matroska_info, read_top_level_element, read_tracks_entries
+from tests.matroska_fixtures import get_audio_flags, write_fixture_file, write_flags_job
+
+
+def write_fixture(folder, file_index, flags, **options):
+    video_path = os.path.join(str(folder), "episode " + str(file_index) + ".mkv")
+    expected_info = write_fixture_file(video_path, file_index, **options)
+    job_file_path = os.path.join(str(folder), "episode " + str(file_index) + ".flags.json")
+    write_flags_job(job_file_path, video_path, flags(expected_info))
+    return video_path, job_file_path, expected_info
+
+
+def read_file(file_path):
+    with open(file_path, "rb") as video_file:
+        return video_file.read()
+
+
+def read_tracks_range(data):
+    elements_positions, _ = find_top_level_elements(data, *find_segment(data))
+    return read_top_level_element(data, elements_positions, TRACKS_ID)
+
+
+def get_inverted_audio_flags_info(expected_info):
+    for track in expected_info["tracks"]:
+        if track["type"] == "audio":
+            for flag_key in ("default_track", "forced_track"):
+                track["properties"][flag_key] = not track["properties"][flag_key]
+    return expected_info
+
+
+def test_flags_flipped_in_place(tmp_path):
+    video_path, job_file_path, expected_info = write_fixture(tmp_path, 3, lambda info: get_audio_flags(info, True))
+    file_size = os.path.getsize(video_path)
+    assert edit_flags_in_place(job_file_path)
+    assert os.path.getsize(video_path) == file_size
+    assert read_matroska_info(video_path) == get_inverted_audio_flags_info(expected_info)
+
+
+def test_flags_edited_before_unknown_size_cluster(tmp_path):
+    # without a seek head the walk stops at the cluster, the tracks before it are all the edit needs
+    video_path, job_file_path, expected_info = write_fixture(tmp_path, 3, lambda info: get_audio_flags(info, True),
+                                                             with_seek_head=False, unknown_size_cluster=True)
+    assert edit_flags_in_place(job_file_path)
+    tracks_entries, _, _ = read_tracks_entries(read_file(video_path))
+    assert [(track_entry["default_track"], track_entry["forced_track"]) for track_entry in tracks_entries] == \
+        [(track["properties"]["default_track"], track["properties"]["forced_track"])
+         for track in get_inverted_audio_flags_info(expected_info)["tracks"]]
+
+
+def test_missing_flag_is_left_to_mkvpropedit(tmp_path):
+    # the first subtitle has no default flag, adding one would grow its track entry so nothing is written,
+    # not even the audio flags that could be changed in place
+    def get_flags(info):
+        subtitle_id = [track["id"] for track in info["tracks"] if track["type"] == "subtitles"][0]
+        return get_audio_flags(info, True) + [(subtitle_id + 1, "flag-default", False)]
+
+    video_path, job_file_path, expected_info = write_fixture(tmp_path, 3, get_flags)
+    file_content = read_file(video_path)
+    assert not edit_flags_in_place(job_file_path)
+    assert read_file(video_path) == file_content
+
+
+def test_crc_recomputed(tmp_path):
+    video_path, job_file_path, expected_info = write_fixture(tmp_path, 1, lambda info: get_audio_flags(info, True))
+    file_content = read_file(video_path)
+    assert edit_flags_in_place(job_file_path)
+    data = read_file(video_path)
+    tracks_start, tracks_end = read_tracks_range(data)
+    crc_start, crc_end = get_crc_position(data, tracks_start, tracks_end)
+    assert data[crc_start:crc_end] != file_content[crc_start:crc_end]
+    assert data[crc_start:crc_end] == zlib.crc32(data[crc_end:tracks_end]).to_bytes(4, "little")
+    assert read_matroska_info(video_path) == get_inverted_audio_flags_info(expected_info)
+
+
+def test_bad_crc_is_left_to_mkvpropedit(tmp_path):
+    video_path, job_file_path, expected_info = write_fixture(tmp_path, 1, lambda info: get_audio_flags(info, True))
+    data = bytearray(read_file(video_path))
+    tracks_start, tracks_end = read_tracks_range(data)
+    crc_start, crc_end = get_crc_position(data, tracks_start, tracks_end)
+    data[crc_start] ^= 0xFF
+    with open(video_path, "wb") as video_file:
+        video_file.write(data)
+    assert not edit_flags_in_place(job_file_path)
+    assert read_file(video_path) == data
+
+
+def test_modification_time_updated(tmp_path):
+    video_path, job_file_path, expected_info = write_fixture(tmp_path, 3, lambda info: get_audio_flags(info, True))
+    old_time_ns = 1500000000 * 10 ** 9
+    os.utime(video_path, ns=(old_time_ns, old_time_ns))
+    assert edit_flags_in_place(job_file_path)
+    assert os.stat(video_path).st_mtime_ns > old_time_ns
+    assert read_matroska_info(video_path) == get_inverted_audio_flags_info(expected_info)
+
+
+def test_failed_check_puts_the_file_back(tmp_path, monkeypatch):
+    def fail_check(data, flags_edits):
+        raise ValueError("the flags did not stick")
+
+    video_path, job_file_path, expected_info = write_fixture(tmp_path, 1, lambda info: get_audio_flags(info, True))
+    file_content = read_file(video_path)
+    monkeypatch.setattr(MatroskaFlagsEditor, "check_flags_edits", fail_check)
+    assert not edit_flags_in_place(job_file_path)
+    assert read_file(video_path) == file_content
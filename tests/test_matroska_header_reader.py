@@ -0,0 +1,152 @@
+import os
+
+import pytest
+
+from packages.Tabs.MuxSetting.Widgets.MatroskaHeaderReader import ATTACHMENTS_ID, CLUSTER_ID, SEEK_HEAD_ID, \
+    TRACKS_ID, find_segment, find_top_level_elements, read_matroska_info, read_tracks_entries
+from tests.matroska_fixtures import write_fixture_file
+
+
+def write_fixture(folder, file_index, **options):
+    file_path = os.path.join(str(folder), "episode " + str(file_index) + ".mkv")
+    return file_path, write_fixture_file(file_path, file_index, **options)
+
+
+def read_file(file_path):
+    with open(file_path, "rb") as video_file:
+        return video_file.read()
+
+
+def read_top_level_positions(file_path):
+    data = read_file(file_path)
+    elements_positions, hidden_rest_position = find_top_level_elements(data, *find_segment(data))
+    assert hidden_rest_position is None
+    return elements_positions
+
+
+@pytest.mark.parametrize("file_index", range(12))
+def test_generated_files_match_mkvmerge_fields(tmp_path, file_index):
+    file_path, expected_info = write_fixture(tmp_path, file_index)
+    info = read_matroska_info(file_path)
+    assert info is not None
+    assert info.keys() == expected_info.keys()
+    assert info["container"] == expected_info["container"]
+    assert len(info["tracks"]) == len(expected_info["tracks"])
+    for track, expected_track in zip(info["tracks"], expected_info["tracks"]):
+        assert track["id"] == expected_track["id"]
+        assert track["type"] == expected_track["type"]
+        assert track["properties"] == expected_track["properties"]
+    assert info["attachments"] == expected_info["attachments"]
+    assert info["errors"] == [] and info["warnings"] == []
+
+
+def test_fields_read_like_mkvmerge(tmp_path):
+    # file 2 has a video, an audio, two subtitles, two attachments and a seek head, written as mkvmerge -J shows it
+    file_path, _ = write_fixture(tmp_path, 2)
+    info = read_matroska_info(file_path)
+    assert info["container"] == {"recognized": True, "supported": True, "type": "Matroska"}
+    assert info["tracks"] == [
+        {"id": 0, "type": "video", "properties": {
+            "number": 1, "uid": 1001, "codec_id": "V_MPEGH/ISO/HEVC", "language": "und", "enabled_track": True,
+            "default_track": True, "forced_track": False}},
+        {"id": 1, "type": "audio", "properties": {
+            "number": 2, "uid": 1002, "codec_id": "A_AAC", "language": "jpn", "enabled_track": True,
+            "default_track": True, "forced_track": False}},
+        {"id": 2, "type": "subtitles", "properties": {
+            "number": 3, "uid": 1003, "codec_id": "S_TEXT/ASS", "language": "fre", "enabled_track": True,
+            "default_track": True, "forced_track": False, "track_name": "Subtitle 1"}},
+        {"id": 3, "type": "subtitles", "properties": {
+            "number": 4, "uid": 1004, "codec_id": "S_TEXT/ASS", "language": "ger", "enabled_track": True,
+            "default_track": False, "forced_track": True, "track_name": "Subtitle 2"}},
+    ]
+    assert info["attachments"] == [
+        {"id": 1, "file_name": "font0.ttf", "content_type": "font/ttf", "size": 512, "properties": {"uid": 7}},
+        {"id": 2, "file_name": "font1.ttf", "content_type": "font/ttf", "size": 513, "properties": {"uid": 8}},
+    ]
+
+
+def test_tracks_and_attachments_found_through_seek_head(tmp_path):
+    file_path, expected_info = write_fixture(tmp_path, 5, tracks_after_cluster=True)
+    elements_positions = read_top_level_positions(file_path)
+    assert SEEK_HEAD_ID in elements_positions
+    assert TRACKS_ID in elements_positions and ATTACHMENTS_ID in elements_positions
+    assert read_matroska_info(file_path) == expected_info
+
+
+def test_attachments_found_by_walking_without_seek_head(tmp_path):
+    file_path, expected_info = write_fixture(tmp_path, 8)
+    assert SEEK_HEAD_ID not in read_top_level_positions(file_path)
+    assert read_matroska_info(file_path) == expected_info
+
+
+def test_tracks_after_cluster_found_by_walking_without_seek_head(tmp_path):
+    file_path, expected_info = write_fixture(tmp_path, 5, with_seek_head=False, tracks_after_cluster=True)
+    assert read_matroska_info(file_path) == expected_info
+
+
+@pytest.mark.parametrize("with_seek_head", [True, False])
+def test_unknown_size_segment(tmp_path, with_seek_head):
+    file_path, expected_info = write_fixture(tmp_path, 2, with_seek_head=with_seek_head, unknown_size_segment=True)
+    assert read_matroska_info(file_path) == expected_info
+
+
+def test_unknown_size_cluster_with_seek_head(tmp_path):
+    file_path, expected_info = write_fixture(tmp_path, 5, unknown_size_segment=True, unknown_size_cluster=True,
+                                             tracks_after_cluster=True)
+    assert read_matroska_info(file_path) == expected_info
+
+
+def test_unknown_size_cluster_without_seek_head_keeps_the_tracks(tmp_path):
+    # the tracks before the cluster are read, the attachments after it cannot be reached so mkvmerge probes the file
+    file_path, expected_info = write_fixture(tmp_path, 2, with_seek_head=False, unknown_size_cluster=True)
+    data = read_file(file_path)
+    elements_positions, hidden_rest_position = find_top_level_elements(data, *find_segment(data))
+    assert hidden_rest_position == elements_positions[CLUSTER_ID]
+    tracks_entries, _, _ = read_tracks_entries(data)
+    assert [(track_entry["number"], track_entry["codec_id"]) for track_entry in tracks_entries] == \
+        [(track["properties"]["number"], track["properties"]["codec_id"]) for track in expected_info["tracks"]]
+    assert read_matroska_info(file_path) is None
+
+
+def test_tracks_hidden_by_unknown_size_cluster(tmp_path):
+    file_path, _ = write_fixture(tmp_path, 2, with_seek_head=False, unknown_size_cluster=True,
+                                 tracks_after_cluster=True)
+    with pytest.raises(ValueError):
+        read_tracks_entries(read_file(file_path))
+    assert read_matroska_info(file_path) is None
+
+
+@pytest.mark.parametrize("with_seek_head", [True, False])
+def test_laced_blocks_are_skipped(tmp_path, with_seek_head):
+    file_path, expected_info = write_fixture(tmp_path, 7, with_seek_head=with_seek_head, laced_blocks=True)
+    assert read_matroska_info(file_path) == expected_info
+
+
+@pytest.mark.parametrize("content", [b"", b"not a video at all", b"\x00\x00\x01\xba" + bytes(2048),
+                                     b"\x1a\x45\xdf\xa3\x88\x42\x82\x85other"])
+def test_not_matroska_file(tmp_path, content):
+    file_path = os.path.join(str(tmp_path), "video.mkv")
+    with open(file_path, "wb") as video_file:
+        video_file.write(content)
+    assert read_matroska_info(file_path) is None
+
+
+@pytest.mark.parametrize("file_index", [5, 8])
+def test_truncated_file(tmp_path, file_index):
+    file_path, _ = write_fixture(tmp_path, file_index)
+    with open(file_path, "r+b") as video_file:
+        video_file.truncate(120)
+    assert read_matroska_info(file_path) is None
+
+
+def test_truncated_before_attachments(tmp_path):
+    # the seek head still points to the attachments that were cut off
+    file_path, _ = write_fixture(tmp_path, 5)
+    file_size = os.path.getsize(file_path)
+    with open(file_path, "r+b") as video_file:
+        video_file.truncate(file_size - 600)
+    assert read_matroska_info(file_path) is None
+
+
+def test_missing_file(tmp_path):
+    assert read_matroska_info(os.path.join(str(tmp_path), "missing.mkv")) is None
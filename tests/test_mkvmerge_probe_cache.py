@@ -0,0 +1,148 @@
+import os
+import shutil
+
+import pytest
+
+from packages.Startup import GlobalPaths
+from packages.Tabs.MuxSetting.Widgets import MkvmergeProbeCache
+from packages.Tabs.MuxSetting.Widgets.MkvmergeProbeCache import get_file_key, get_mkvmerge_json_info
+from tests.matroska_fixtures import write_fixture_file
+
+
+class FakeProbe:
+    # answers like mkvmerge -J and remembers which files it was started on
+    def __init__(self, exit_code=0):
+        self.exit_code = exit_code
+        self.probed_files_paths = []
+
+    def __call__(self, file_path):
+        self.probed_files_paths.append(file_path)
+        return self.exit_code, {"file_name": os.path.basename(file_path), "probe": len(self.probed_files_paths)}
+
+
+@pytest.fixture
+def fake_probe(monkeypatch):
+    probe = FakeProbe()
+    monkeypatch.setattr(MkvmergeProbeCache, "run_mkvmerge_probe", probe)
+    monkeypatch.setattr(GlobalPaths, "MKVMERGE_PATH", "/tools/mkvmerge")
+    return probe
+
+
+def write_video(folder, file_name, content=b"not a matroska file"):
+    file_path = os.path.join(str(folder), file_name)
+    with open(file_path, "wb") as video_file:
+        video_file.write(content)
+    return file_path
+
+
+def create_cache(folder, **options):
+    return MkvmergeProbeCache.MkvmergeProbeCache(os.path.join(str(folder), "ProbeCache"), **options)
+
+
+def test_probed_once(tmp_path, fake_probe):
+    cache = create_cache(tmp_path)
+    video_path = write_video(tmp_path, "episode 1.avi")
+    info = cache.get_info(video_path)
+    assert cache.get_info(video_path) == info
+    assert fake_probe.probed_files_paths == [video_path]
+
+
+def test_memory_keeps_the_most_recently_used(tmp_path, fake_probe):
+    cache = create_cache(tmp_path, max_memory_entries=2)
+    videos_paths = [write_video(tmp_path, "episode " + str(video_index) + ".avi") for video_index in range(3)]
+    cache.get_info(videos_paths[0])
+    cache.get_info(videos_paths[1])
+    cache.get_info(videos_paths[0])
+    cache.get_info(videos_paths[2])
+    assert list(cache.memory_cache) == [get_file_key(videos_paths[0]), get_file_key(videos_paths[2])]
+    # the evicted one is still on disk, it is not probed again
+    cache.get_info(videos_paths[1])
+    assert fake_probe.probed_files_paths == videos_paths
+
+
+def test_read_back_from_disk(tmp_path, fake_probe):
+    video_path = write_video(tmp_path, "episode 1.avi")
+    info = create_cache(tmp_path).get_info(video_path)
+    assert create_cache(tmp_path).get_info(video_path) == info
+    assert fake_probe.probed_files_paths == [video_path]
+
+
+def test_failed_probe_is_not_cached(tmp_path, fake_probe):
+    fake_probe.exit_code = 2
+    cache = create_cache(tmp_path)
+    video_path = write_video(tmp_path, "episode 1.avi")
+    cache.get_info(video_path)
+    cache.get_info(video_path)
+    assert fake_probe.probed_files_paths == [video_path, video_path]
+    assert os.listdir(cache.cache_folder_path) == []
+
+
+def test_key_changes_with_mkvmerge_path_file_path_size_and_modification_time(tmp_path, fake_probe, monkeypatch):
+    video_path = write_video(tmp_path, "episode 1.avi")
+    keys = [get_file_key(video_path)]
+    monkeypatch.setattr(GlobalPaths, "MKVMERGE_PATH", "/other tools/mkvmerge")
+    keys.append(get_file_key(video_path))
+    copied_video_path = os.path.join(str(tmp_path), "episode 1 copy.avi")
+    shutil.copy2(video_path, copied_video_path)
+    keys.append(get_file_key(copied_video_path))
+    file_stat = os.stat(video_path)
+    os.utime(video_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000))
+    keys.append(get_file_key(video_path))
+    with open(video_path, "ab") as video_file:
+        video_file.write(b"more")
+    os.utime(video_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000))
+    keys.append(get_file_key(video_path))
+    assert len(set(keys)) == len(keys)
+
+
+def test_changed_file_is_probed_again(tmp_path, fake_probe):
+    cache = create_cache(tmp_path)
+    video_path = write_video(tmp_path, "episode 1.avi")
+    first_info = cache.get_info(video_path)
+    file_stat = os.stat(video_path)
+    os.utime(video_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000))
+    assert cache.get_info(video_path) != first_info
+    assert fake_probe.probed_files_paths == [video_path, video_path]
+
+
+def test_disk_evicts_the_least_recently_used(tmp_path, fake_probe):
+    cache = create_cache(tmp_path, max_memory_entries=1, max_disk_entries=10)
+    videos_paths = [write_video(tmp_path, "episode " + str(video_index) + ".avi") for video_index in range(11)]
+    for video_index, video_path in enumerate(videos_paths[:10]):
+        cache.get_info(video_path)
+        # the files are written faster than the modification time moves, their order is set by hand
+        os.utime(cache.get_cache_file_path(get_file_key(video_path)), ns=(0, (video_index + 1) * 10 ** 9))
+    # reading the first one from disk makes it the most recently used
+    cache.get_info(videos_paths[0])
+    cache.get_info(videos_paths[10])
+    cached_keys = sorted(file_name[:-len(".json")] for file_name in os.listdir(cache.cache_folder_path))
+    expected_keys = sorted(get_file_key(video_path) for video_path in videos_paths[:1] + videos_paths[3:])
+    assert cached_keys == expected_keys
+    assert cache.number_of_disk_entries == 9
+
+
+def test_clear(tmp_path, fake_probe):
+    cache = create_cache(tmp_path)
+    video_path = write_video(tmp_path, "episode 1.avi")
+    cache.get_info(video_path)
+    cache.clear()
+    assert os.listdir(cache.cache_folder_path) == [] and len(cache.memory_cache) == 0
+    cache.get_info(video_path)
+    assert fake_probe.probed_files_paths == [video_path, video_path]
+
+
+def test_matroska_file_is_read_from_its_headers(tmp_path, fake_probe, monkeypatch):
+    monkeypatch.setattr(MkvmergeProbeCache, "mkvmerge_probe_cache", create_cache(tmp_path))
+    video_path = os.path.join(str(tmp_path), "episode 1.mkv")
+    expected_info = write_fixture_file(video_path, 2)
+    assert get_mkvmerge_json_info(video_path) == expected_info
+    assert fake_probe.probed_files_paths == []
+
+
+def test_other_files_are_left_to_mkvmerge(tmp_path, fake_probe, monkeypatch):
+    monkeypatch.setattr(MkvmergeProbeCache, "mkvmerge_probe_cache", create_cache(tmp_path))
+    video_path = write_video(tmp_path, "episode 1.mkv", b"\x00\x00\x01\xba" + bytes(2048))
+    info = get_mkvmerge_json_info(video_path)
+    assert info == {"file_name": "episode 1.mkv", "probe": 1}
+    assert get_mkvmerge_json_info(video_path) == info
+    assert fake_probe.probed_files_paths == [video_path]
@@ -0,0 +1,82 @@
+from packages.Tabs.MuxSetting.Widgets.MuxingBatchSettings import generate_muxing_batch_settings
+from packages.Tabs.MuxSetting.Widgets.MuxingJobPlanner import check_if_job_can_edit_source
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+
+
+def create_batch_settings(**options):
+    options.setdefault("edit_source_files", True)
+    return generate_muxing_batch_settings(destination_folder_path="/output", video_source_mkv_only=True, **options)
+
+
+def create_job(subtitle_found=False):
+    job = SingleJobData()
+    job.video_name = "episode 01.mkv"
+    job.video_name_absolute = "/videos/episode 01.mkv"
+    job.subtitle_found = subtitle_found
+    return job
+
+
+def create_json_info(container_type="Matroska"):
+    # a video, a japanese and an english audio, an english subtitle and one with no language
+    return {
+        "container": {"recognized": True, "supported": True, "type": container_type},
+        "tracks": [
+            {"id": 0, "type": "video", "properties": {"language": "und"}},
+            {"id": 1, "type": "audio", "properties": {"language": "jpn"}},
+            {"id": 2, "type": "audio", "properties": {"language": "eng"}},
+            {"id": 3, "type": "subtitles", "properties": {"language": "eng"}},
+            {"id": 4, "type": "subtitles", "properties": {}},
+        ],
+        "attachments": [],
+    }
+
+
+def test_matroska_job_edits_its_source():
+    assert check_if_job_can_edit_source(create_job(), create_batch_settings(), create_json_info())
+
+
+def test_source_not_edited_when_the_batch_does_not_allow_it():
+    batch_settings = create_batch_settings(edit_source_files=False)
+    assert not check_if_job_can_edit_source(create_job(), batch_settings, create_json_info())
+
+
+def test_source_not_edited_when_not_matroska():
+    json_info = create_json_info(container_type="MP4/QuickTime")
+    assert not check_if_job_can_edit_source(create_job(), create_batch_settings(), json_info)
+
+
+def test_source_not_edited_when_a_subtitle_is_added():
+    batch_settings = create_batch_settings(subtitle_enabled=True)
+    assert not check_if_job_can_edit_source(create_job(subtitle_found=True), batch_settings, create_json_info())
+
+
+def test_source_edited_when_the_subtitles_are_disabled():
+    batch_settings = create_batch_settings(subtitle_enabled=False)
+    assert check_if_job_can_edit_source(create_job(subtitle_found=True), batch_settings, create_json_info())
+
+
+def test_source_not_edited_when_a_subtitle_is_dropped():
+    batch_settings = create_batch_settings(only_keep_those_subtitles_enabled=True, only_keep_those_subtitles=("4",))
+    assert not check_if_job_can_edit_source(create_job(), batch_settings, create_json_info())
+
+
+def test_source_edited_when_every_subtitle_is_kept():
+    # the subtitle with no language is an english one for mkvmerge
+    batch_settings = create_batch_settings(only_keep_those_subtitles_enabled=True,
+                                           only_keep_those_subtitles=("3", "eng"))
+    assert check_if_job_can_edit_source(create_job(), batch_settings, create_json_info())
+
+
+def test_source_not_edited_when_an_audio_is_dropped():
+    batch_settings = create_batch_settings(only_keep_those_audios_enabled=True, only_keep_those_audios=("1",))
+    assert not check_if_job_can_edit_source(create_job(), batch_settings, create_json_info())
+
+
+def test_source_not_edited_when_every_audio_is_discarded():
+    batch_settings = create_batch_settings(only_keep_those_audios_enabled=True, only_keep_those_audios=())
+    assert not check_if_job_can_edit_source(create_job(), batch_settings, create_json_info())
+
+
+def test_source_edited_when_every_audio_is_kept():
+    batch_settings = create_batch_settings(only_keep_those_audios_enabled=True, only_keep_those_audios=("1", "eng"))
+    assert check_if_job_can_edit_source(create_job(), batch_settings, create_json_info())
@@ -0,0 +1,61 @@
+import pytest
+
+from packages.Tabs.MuxSetting.Widgets.MuxingOutputParser import DONE_EVENT, ERROR_EVENT, PROGRESS_EVENT, \
+    WARNING_EVENT, parse_muxing_output_line, update_muxing_params
+from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
+
+
+@pytest.mark.parametrize("line", ["#GUI#progress 42%", "Progress: 42%", "#GUI#progress 42%\r"])
+def test_progress_lines(line):
+    event = parse_muxing_output_line(line)
+    assert event.kind == PROGRESS_EVENT
+    assert event.progress == 42
+
+
+@pytest.mark.parametrize("line", ["#GUI#warning The track 2 has no language.",
+                                  "Warning: The track 2 has no language.",
+                                  "#GUI#warning The track 2 has no language.\r"])
+def test_warning_lines(line):
+    event = parse_muxing_output_line(line)
+    assert event.kind == WARNING_EVENT
+    assert event.message == "Warning: The track 2 has no language.\n"
+
+
+@pytest.mark.parametrize("line", ["#GUI#error The file could not be opened.", "Error: The file could not be opened.",
+                                  "Error: The file could not be opened.\r"])
+def test_error_lines(line):
+    event = parse_muxing_output_line(line)
+    assert event.kind == ERROR_EVENT
+    assert event.message == "Error: The file could not be opened.\n"
+
+
+@pytest.mark.parametrize("line", ["#GUI#warning Error in the Matroska file structure at position 1234.",
+                                  "Warning: Error in the Matroska file structure at position 1234."])
+def test_matroska_structure_warning_is_an_error(line):
+    event = parse_muxing_output_line(line)
+    assert event.kind == ERROR_EVENT
+    assert event.message == "Error: Error in the Matroska file structure at position 1234.\n"
+
+
+@pytest.mark.parametrize("line", ["Multiplexing took 3 seconds.", "Done.", "No changes were made to the file."])
+def test_done_lines(line):
+    event = parse_muxing_output_line(line)
+    assert event.kind == DONE_EVENT
+    assert event.progress == 100
+
+
+@pytest.mark.parametrize("line", ["mkvmerge v81.0 ('Milliontown') 64-bit", "", "#GUI#progress unknown"])
+def test_other_lines(line):
+    assert parse_muxing_output_line(line) is None
+
+
+def test_update_muxing_params():
+    muxing_params = MuxingParams()
+    assert update_muxing_params(muxing_params, parse_muxing_output_line("#GUI#progress 10%"))
+    assert not update_muxing_params(muxing_params, parse_muxing_output_line("#GUI#progress 10%"))
+    assert update_muxing_params(muxing_params, parse_muxing_output_line("#GUI#warning careful"))
+    assert update_muxing_params(muxing_params, parse_muxing_output_line("#GUI#error boom"))
+    assert muxing_params.progress == 10
+    assert muxing_params.warnings == 1
+    assert muxing_params.error
+    assert muxing_params.message == "Error: boom\n"